@@ -1,5 +1,12 @@
 from django.contrib import admin
-from .models import ComplaintCluster, ComplaintEmbedding
+from .models import ClusteringRun, ComplaintCluster, ComplaintEmbedding
+
+
+@admin.register(ClusteringRun)
+class ClusteringRunAdmin(admin.ModelAdmin):
+    list_display = ['id', 'method', 'status', 'complaint_count', 'total_seconds', 'peak_rss_mb', 'created_at']
+    list_filter = ['status', 'method', 'created_at']
+    readonly_fields = ['created_at']
 
 
 @admin.register(ComplaintCluster)
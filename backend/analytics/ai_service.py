@@ -3,71 +3,121 @@ from sentence_transformers import SentenceTransformer
 from bertopic import BERTopic
 from sklearn.cluster import KMeans
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional
 import logging
+import math
+import time
+
+from backend.metrics import stage
+from .tracing import PipelineTrace
 
 logger = logging.getLogger(__name__)
 
+# SentenceTransformer.encode's default batch size, made explicit so traces
+# can report the batch count
+EMBED_BATCH_SIZE = 32
+
 
 class ComplaintClusteringService:
     def __init__(self):
         self.model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
         self.bertopic_model = None
     
+    def encode(self, texts: List[str], batch_size: int = EMBED_BATCH_SIZE) -> np.ndarray:
+        """Embed `texts`; unlike generate_embeddings, errors propagate."""
+        with stage('inference'):
+            return self.model.encode(texts, batch_size=batch_size, show_progress_bar=False)
+    
+    def count_tokens(self, texts: List[str]) -> int:
+        """Tokens the model sees for `texts`, after truncation to its max length."""
+        encoded = self.model.tokenizer(
+            texts, truncation=True, max_length=self.model.max_seq_length,
+        )
+        return sum(len(ids) for ids in encoded['input_ids'])
+    
     def generate_embeddings(self, texts: List[str]) -> np.ndarray:
         try:
-            embeddings = self.model.encode(texts, show_progress_bar=False)
-            return embeddings
+            return self.encode(texts)
         except Exception as e:
             logger.error(f"Error generating embeddings: {e}")
             return np.array([])
     
-    def cluster_complaints_kmeans(self, complaints_data: List[Dict], n_clusters: int = 5) -> Dict:
-        try:
+    def cluster_complaints_kmeans(self, complaints_data: List[Dict], n_clusters: int = 5,
+                                  trace: Optional[PipelineTrace] = None,
+                                  count_tokens: bool = False) -> Dict:
+        """Cluster complaints with KMeans over their embeddings.
+
+        Each stage is timed into `trace` (a fresh one if not given), which
+        is returned under 'trace'. Failures raise rather than being folded
+        into the result. `count_tokens` adds a tokenize stage, and tokens/s
+        for the embedding; it runs the tokenizer over the corpus once more.
+        """
+        trace = trace or PipelineTrace()
+        
+        with trace.stage('text_assembly') as counters:
             texts = [f"{c['title']}. {c['description']}" for c in complaints_data]
-            
-            if len(texts) < n_clusters:
-                n_clusters = max(1, len(texts) // 2)
-            
-            embeddings = self.generate_embeddings(texts)
-            
-            if embeddings.size == 0:
-                return {'error': 'Failed to generate embeddings'}
-            
+            counters['texts'] = len(texts)
+            counters['characters'] = sum(len(t) for t in texts)
+        
+        if not texts:
+            raise ValueError('No complaints to cluster')
+        if len(texts) < n_clusters:
+            n_clusters = max(1, len(texts) // 2)
+        
+        tokens = None
+        if count_tokens:
+            with trace.stage('tokenize') as counters:
+                tokens = self.count_tokens(texts)
+                counters['tokens'] = tokens
+        
+        with trace.stage('embedding') as counters:
+            start = time.perf_counter()
+            embeddings = self.encode(texts)
+            seconds = time.perf_counter() - start
+            counters['batch_size'] = EMBED_BATCH_SIZE
+            counters['batches'] = math.ceil(len(texts) / EMBED_BATCH_SIZE)
+            counters['dimensions'] = int(embeddings.shape[1])
+            counters['texts_per_s'] = round(len(texts) / seconds, 1) if seconds else None
+            if tokens is not None:
+                counters['tokens_per_s'] = round(tokens / seconds, 1) if seconds else None
+        
+        with trace.stage('kmeans') as counters:
             kmeans = KMeans(n_clusters=n_clusters, random_state=42)
             cluster_labels = kmeans.fit_predict(embeddings)
-            
-            clusters = {}
-            for idx, label in enumerate(cluster_labels):
-                label = int(label)
-                if label not in clusters:
-                    clusters[label] = {
-                        'cluster_id': label,
-                        'complaints': [],
-                        'count': 0
-                    }
-                clusters[label]['complaints'].append({
-                    'id': complaints_data[idx]['id'],
-                    'title': complaints_data[idx]['title'],
-                    'embedding': embeddings[idx].tolist()
-                })
-                clusters[label]['count'] += 1
-            
+            counters['n_clusters'] = n_clusters
+            counters['iterations'] = int(kmeans.n_iter_)
+            counters['inertia'] = round(float(kmeans.inertia_), 4)
+        
+        clusters = {}
+        for idx, label in enumerate(cluster_labels):
+            label = int(label)
+            if label not in clusters:
+                clusters[label] = {
+                    'cluster_id': label,
+                    'complaints': [],
+                    'count': 0
+                }
+            clusters[label]['complaints'].append({
+                'id': complaints_data[idx]['id'],
+                'title': complaints_data[idx]['title'],
+                'embedding': embeddings[idx].tolist()
+            })
+            clusters[label]['count'] += 1
+        
+        with trace.stage('keywords') as counters:
             for cluster_id, cluster_data in clusters.items():
                 cluster_texts = [c['title'] for c in cluster_data['complaints']]
                 keywords = self._extract_keywords(cluster_texts)
                 clusters[cluster_id]['keywords'] = keywords
                 clusters[cluster_id]['cluster_name'] = self._generate_cluster_name(keywords)
-            
-            return {
-                'clusters': list(clusters.values()),
-                'total_clusters': len(clusters),
-                'total_complaints': len(complaints_data)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in KMeans clustering: {e}")
-            return {'error': str(e)}
+            counters['clusters'] = len(clusters)
+        
+        return {
+            'clusters': list(clusters.values()),
+            'total_clusters': len(clusters),
+            'total_complaints': len(complaints_data),
+            'trace': trace.summary(),
+        }
     
     # def cluster_complaints_bertopic(self, complaints_data: List[Dict]) -> Dict:
     #     try:
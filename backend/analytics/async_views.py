@@ -0,0 +1,49 @@
+# Async versions of the dashboard and heatmap reads, served under ASGI
+import logging
+
+from asgiref.sync import sync_to_async
+from django.utils import timezone
+
+from backend.replicas import is_pinned, read_from_replica
+from complaints.archive import archive_summary
+from complaints.async_views import UNAUTHORIZED, render
+from complaints.auth import authenticate_request
+from .stats import assemble_dashboard, dashboard_queries, heatmap_point, heatmap_queryset
+
+logger = logging.getLogger(__name__)
+
+
+async def _user_for(request):
+    return await sync_to_async(authenticate_request)(request)
+
+
+async def dashboard_stats(request):
+    user = await _user_for(request)
+    if user is None:
+        return render(UNAUTHORIZED, 401)
+    try:
+        now = timezone.now()
+        rows = {}
+        with read_from_replica(not await sync_to_async(is_pinned)(user)):
+            for name, queryset in dashboard_queries(now).items():
+                rows[name] = [row async for row in queryset]
+            archived = await sync_to_async(archive_summary)()
+        data = assemble_dashboard(now, rows, archived)
+        return render(data)
+    except Exception as e:
+        logger.error(f"Error in async dashboard_stats: {e}")
+        return render({'error': 'Failed to fetch dashboard statistics'}, 500)
+
+
+async def heatmap_data(request):
+    user = await _user_for(request)
+    if user is None:
+        return render(UNAUTHORIZED, 401)
+    try:
+        queryset = heatmap_queryset(request.GET.get('category'), request.GET.get('status'))
+        with read_from_replica(not await sync_to_async(is_pinned)(user)):
+            heatmap = [heatmap_point(row) async for row in queryset]
+        return render({'data': heatmap, 'total_points': len(heatmap)})
+    except Exception as e:
+        logger.error(f"Error in async heatmap_data: {e}")
+        return render({'error': 'Failed to fetch heatmap data'}, 500)
@@ -0,0 +1,54 @@
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from analytics.vector_index import complaint_vector_index
+from complaints.models import Complaint
+
+
+class Command(BaseCommand):
+    help = 'Time semantic search over stored complaint embeddings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--queries', type=int, default=200)
+        parser.add_argument('--top-k', type=int, default=10)
+        parser.add_argument('--recency-weight', type=float, default=0.0)
+        parser.add_argument('--citizen', type=int, help='Restrict candidates to one citizen')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        ids, vectors, _ = complaint_vector_index.refresh(force=True)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        size = ids.size
+        if size == 0:
+            self.stderr.write('No stored embeddings; run embed_complaints first')
+            return
+        dim = vectors.shape[1]
+        self.stdout.write(f'{size} vectors x {dim} dims, index load {load_ms:.1f} ms')
+
+        candidate_ids = None
+        if options['citizen']:
+            candidate_ids = Complaint.objects.filter(
+                citizen_id=options['citizen']
+            ).values_list('id', flat=True)
+
+        # Query embedding cost is the model's, not the index's; use random
+        # unit vectors so this measures search alone.
+        rng = np.random.default_rng(42)
+        queries = rng.standard_normal((options['queries'], dim)).astype(np.float32)
+
+        timings = []
+        for query in queries:
+            start = time.perf_counter()
+            complaint_vector_index.search(
+                query,
+                candidate_ids=candidate_ids,
+                top_k=options['top_k'],
+                recency_weight=options['recency_weight'],
+            )
+            timings.append((time.perf_counter() - start) * 1000)
+
+        p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+        self.stdout.write(f'p50 {p50:.2f} ms  p95 {p95:.2f} ms  p99 {p99:.2f} ms')
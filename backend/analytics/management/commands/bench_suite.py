@@ -0,0 +1,230 @@
+import json
+import platform
+import subprocess
+import time
+from datetime import datetime, timezone
+
+import django
+import numpy as np
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from analytics.views import AnalyticsViewSet
+from complaints.models import Complaint
+from complaints.views import ComplaintViewSet
+from users.models import User
+
+# (name, view, path); run as an officer so every row is visible
+ENDPOINTS = [
+    ('dashboard_stats', AnalyticsViewSet.as_view({'get': 'dashboard_stats'}), '/api/analytics/dashboard_stats/'),
+    ('heatmap_data', AnalyticsViewSet.as_view({'get': 'heatmap_data'}), '/api/analytics/heatmap_data/'),
+    ('complaint_list', ComplaintViewSet.as_view({'get': 'list'}), '/api/complaints/v2/'),
+    ('complaint_search_en', ComplaintViewSet.as_view({'get': 'list'}), '/api/complaints/v2/?search=garbage'),
+    ('complaint_search_hi', ComplaintViewSet.as_view({'get': 'list'}), '/api/complaints/v2/?search=पानी'),
+    ('my_queue', ComplaintViewSet.as_view({'get': 'my_queue'}), '/api/complaints/v2/my_queue/'),
+]
+SIMILAR_QUERY = 'नाली जाम है और सड़क पर गंदा पानी बह रहा है'
+
+
+def git_revision():
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, dirty
+
+
+def summarize(timings):
+    p50, p95 = np.percentile(timings, [50, 95])
+    return {
+        'mean_ms': round(float(np.mean(timings)), 3),
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'min_ms': round(float(np.min(timings)), 3),
+    }
+
+
+class Command(BaseCommand):
+    help = 'Time API and AI hot paths at several data sizes and write a JSON report'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000],
+                            help='Complaint counts to benchmark at')
+        parser.add_argument('--seed-data', action='store_true',
+                            help='Top the database up with seed_synthetic to reach each size')
+        parser.add_argument('--repeat', type=int, default=10)
+        parser.add_argument('--ai-repeat', type=int, default=1)
+        parser.add_argument('--ai-max-rows', type=int, default=2000,
+                            help='Cap on complaints fed to the embedding model per size')
+        parser.add_argument('--skip-ai', action='store_true')
+        parser.add_argument('--username', help='Officer to run the API calls as')
+        parser.add_argument('--output', default='bench_report.json')
+        parser.add_argument('--baseline', help='Earlier report to compare against')
+
+    def handle(self, *args, **options):
+        officers = User.objects.filter(role='officer', is_active=True)
+        if options['username']:
+            officers = officers.filter(username=options['username'])
+        officer = officers.order_by('id').first()
+        if officer is None and not options['seed_data']:
+            raise CommandError('Need an active officer; pass --seed-data to create synthetic ones')
+
+        commit, dirty = git_revision()
+        report = {
+            'meta': {
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'git_commit': commit,
+                'git_dirty': dirty,
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': f'{connection.vendor} {getattr(connection, "pg_version", "")}'.strip(),
+                'machine': platform.machine(),
+                'repeat': options['repeat'],
+                'ai_repeat': options['ai_repeat'],
+            },
+            'results': [],
+        }
+
+        for size in sorted(options['sizes']):
+            count = Complaint.objects.count()
+            if count < size:
+                if not options['seed_data']:
+                    self.stdout.write(f'size {size}: only {count} complaints, skipped (use --seed-data)')
+                    continue
+                self.stdout.write(f'size {size}: seeding {size - count} complaints')
+                call_command('seed_synthetic', complaints=size - count, stdout=self.stdout)
+                count = Complaint.objects.count()
+            if officer is None:
+                officer = User.objects.filter(role='officer', is_active=True).order_by('id').first()
+
+            self.stdout.write(f'size {size}: {count} complaints in the database')
+            for result in self.bench_endpoints(officer, options['repeat']):
+                self.record(report, size, count, result)
+            if not options['skip_ai']:
+                sample = min(size, options['ai_max_rows'])
+                for result in self.bench_ai(sample, options['ai_repeat']):
+                    self.record(report, size, sample, result)
+
+        with open(options['output'], 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}"))
+
+        if options['baseline']:
+            self.compare(options['baseline'], report)
+
+    def record(self, report, size, rows, result):
+        result = {'size': size, 'rows': rows, **result}
+        report['results'].append(result)
+        if result.get('error'):
+            self.stdout.write(f"  {result['benchmark']:<26} error: {result['error']}")
+        else:
+            queries = result.get('queries')
+            self.stdout.write(
+                f"  {result['benchmark']:<26} p50 {result['p50_ms']:>10.2f} ms  p95 {result['p95_ms']:>10.2f} ms"
+                + (f'  {queries} queries' if queries is not None else '')
+            )
+
+    def bench_endpoints(self, officer, repeat):
+        factory = APIRequestFactory()
+        for name, view, path in ENDPOINTS:
+            def call():
+                request = factory.get(path)
+                force_authenticate(request, user=officer)
+                response = view(request)
+                response.render()
+                return response
+
+            # Warm-up call, also counting its queries
+            with CaptureQueriesContext(connection) as queries:
+                response = call()
+            if response.status_code != 200:
+                yield {'benchmark': name, 'error': f'HTTP {response.status_code}'}
+                continue
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                call()
+                timings.append((time.perf_counter() - start) * 1000)
+            yield {'benchmark': name, 'repeat': repeat, 'queries': len(queries), **summarize(timings)}
+
+    def bench_ai(self, sample, repeat):
+        try:
+            from analytics.ai_service import clustering_service
+        except ImportError as e:
+            for name in ('generate_embeddings', 'cluster_complaints_kmeans', 'find_similar_complaints'):
+                yield {'benchmark': name, 'error': f'AI dependencies unavailable: {e}'}
+            return
+
+        complaints = list(
+            Complaint.objects.order_by('-created_at').values('id', 'title', 'description')[:sample]
+        )
+        texts = [f"{c['title']}. {c['description']}" for c in complaints]
+        # Load the model before timing anything
+        clustering_service.generate_embeddings(texts[:2])
+
+        timings, embeddings = [], None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            embeddings = clustering_service.generate_embeddings(texts)
+            timings.append((time.perf_counter() - start) * 1000)
+        if embeddings is None or embeddings.size == 0:
+            yield {'benchmark': 'generate_embeddings', 'error': 'no embeddings returned'}
+            return
+        yield {'benchmark': 'generate_embeddings', 'repeat': repeat,
+               'rows_per_s': round(len(texts) / (min(timings) / 1000), 1), **summarize(timings)}
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                result = clustering_service.cluster_complaints_kmeans(complaints, n_clusters=5)
+            except Exception as e:
+                yield {'benchmark': 'cluster_complaints_kmeans', 'error': f'{type(e).__name__}: {e}'}
+                break
+            timings.append((time.perf_counter() - start) * 1000)
+        else:
+            # Stage breakdown of the last run
+            stages = {s['name']: round(s['seconds'] * 1000, 3) for s in result['trace']['stages']}
+            yield {'benchmark': 'cluster_complaints_kmeans', 'repeat': repeat,
+                   'stages_ms': stages, 'peak_rss_mb': result['trace']['peak_rss_mb'],
+                   'peak_rss_growth_mb': result['trace']['peak_rss_growth_mb'],
+                   **summarize(timings)}
+
+        stored = [
+            {'id': c['id'], 'title': c['title'], 'embedding': vector.tolist()}
+            for c, vector in zip(complaints, embeddings)
+        ]
+        timings = []
+        for _ in range(max(repeat, 5)):
+            start = time.perf_counter()
+            clustering_service.find_similar_complaints(SIMILAR_QUERY, stored, top_k=5)
+            timings.append((time.perf_counter() - start) * 1000)
+        yield {'benchmark': 'find_similar_complaints', 'repeat': len(timings), **summarize(timings)}
+
+    def compare(self, path, report):
+        with open(path, encoding='utf-8') as f:
+            baseline = json.load(f)
+        before = {(r['benchmark'], r['size']): r for r in baseline['results'] if 'p50_ms' in r}
+        revision = (baseline['meta'].get('git_commit') or 'unknown')[:10]
+        self.stdout.write(f'\nCompared with {path} ({revision}), p50:')
+        self.stdout.write(f"{'benchmark':<26} {'size':>7} {'before ms':>11} {'after ms':>11} {'change':>8}")
+        for result in report['results']:
+            old = before.get((result['benchmark'], result['size']))
+            if old is None or 'p50_ms' not in result:
+                continue
+            change = result['p50_ms'] / old['p50_ms'] if old['p50_ms'] else float('nan')
+            self.stdout.write(
+                f"{result['benchmark']:<26} {result['size']:>7} {old['p50_ms']:>11.2f} "
+                f"{result['p50_ms']:>11.2f} {change:>7.2f}x"
+            )
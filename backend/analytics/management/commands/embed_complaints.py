@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from analytics.ai_service import clustering_service
+from analytics.models import ComplaintEmbedding
+from complaints.models import Complaint
+
+
+class Command(BaseCommand):
+    help = 'Store embeddings for complaints that do not have one yet'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=256)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        pending = (
+            Complaint.objects
+            .filter(embedding__isnull=True)
+            .order_by('id')
+            .values('id', 'title', 'description')
+        )
+
+        total = 0
+        last_id = 0
+        while True:
+            batch = list(pending.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            last_id = batch[-1]['id']
+
+            texts = [f"{c['title']}. {c['description']}" for c in batch]
+            embeddings = clustering_service.generate_embeddings(texts)
+            if embeddings.size == 0:
+                self.stderr.write(f'Failed to embed batch ending at complaint {last_id}')
+                continue
+
+            ComplaintEmbedding.objects.bulk_create([
+                ComplaintEmbedding(complaint_id=c['id'], embedding_vector=vector.tolist())
+                for c, vector in zip(batch, embeddings)
+            ], ignore_conflicts=True)
+            total += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'Embedded {total} complaints'))
@@ -1,7 +1,39 @@
+from django.conf import settings
 from django.db import models
 from complaints.models import Complaint
 
+class ClusteringRun(models.Model):
+    """One clustering pipeline run and its per-stage trace."""
+    STATUS_CHOICES = [
+        ('succeeded', 'Succeeded'),
+        ('failed', 'Failed'),
+    ]
+    
+    method = models.CharField(max_length=20)
+    requested_clusters = models.IntegerField()
+    complaint_count = models.IntegerField(default=0)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES)
+    error = models.TextField(blank=True)
+    # PipelineTrace.summary(): stage list with seconds, peak RSS and counters
+    trace = models.JSONField(default=dict)
+    total_seconds = models.FloatField(null=True, blank=True)
+    peak_rss_mb = models.FloatField(null=True, blank=True)
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"{self.method} run {self.pk} ({self.status})"
+
+
 class ComplaintCluster(models.Model):
+    run = models.ForeignKey(
+        ClusteringRun, on_delete=models.SET_NULL, null=True, blank=True, related_name='clusters'
+    )
     cluster_id = models.IntegerField()
     cluster_name = models.CharField(max_length=200)
     keywords = models.JSONField(default=list)
@@ -1,12 +1,21 @@
 from rest_framework import serializers
-from .models import ComplaintCluster, ComplaintEmbedding
+from .models import ClusteringRun, ComplaintCluster, ComplaintEmbedding
 from complaints.serializers import ComplaintListSerializer
 
 
 class ComplaintClusterSerializer(serializers.ModelSerializer):
     class Meta:
         model = ComplaintCluster
-        fields = ['id', 'cluster_id', 'cluster_name', 'keywords', 'complaint_count', 'created_at']
+        fields = ['id', 'run', 'cluster_id', 'cluster_name', 'keywords', 'complaint_count', 'created_at']
+
+
+class ClusteringRunSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ClusteringRun
+        fields = [
+            'id', 'method', 'requested_clusters', 'complaint_count', 'status', 'error',
+            'total_seconds', 'peak_rss_mb', 'trace', 'requested_by', 'created_at',
+        ]
 
 
 class ComplaintEmbeddingSerializer(serializers.ModelSerializer):
@@ -42,4 +51,6 @@ class ClusteringResultSerializer(serializers.Serializer):
     clusters = serializers.ListField()
     total_clusters = serializers.IntegerField()
     total_complaints = serializers.IntegerField()
-    outliers = serializers.IntegerField(required=False)
\ No newline at end of file
+    outliers = serializers.IntegerField(required=False)
+    run_id = serializers.IntegerField(required=False)
+    trace = serializers.DictField(required=False)
\ No newline at end of file
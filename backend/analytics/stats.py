@@ -0,0 +1,134 @@
+# Dashboard and heatmap queries shared by the sync and async views
+#
+# Each builder returns lazy querysets; the DRF views evaluate them with
+# list() and the ASGI views with async iteration, then both assemble the
+# same response from the rows.
+from datetime import timedelta
+
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Sum
+from django.db.models.functions import TruncDate, TruncMonth
+
+from complaints.models import Complaint
+
+
+def _grouped(queryset, field):
+    return queryset.order_by().values(field).annotate(count=Count('id')).values_list(field, 'count')
+
+
+def _daily_dates(now):
+    seven_days_ago = now - timedelta(days=7)
+    return [seven_days_ago + timedelta(days=i) for i in range(7)]
+
+
+def _monthly_dates(now):
+    return [now - timedelta(days=30 * i) for i in reversed(range(6))]
+
+
+def dashboard_queries(now):
+    """Lazy querysets behind dashboard_stats, keyed by name."""
+    days = _daily_dates(now)
+    first_day = days[0].replace(hour=0, minute=0, second=0, microsecond=0)
+    first_month = _monthly_dates(now)[0].replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    resolution = ExpressionWrapper(F('resolved_at') - F('created_at'), output_field=DurationField())
+    return {
+        'status': _grouped(Complaint.objects.all(), 'status'),
+        'category': _grouped(Complaint.objects.all(), 'category'),
+        'daily': _grouped(
+            Complaint.objects
+            .filter(created_at__gte=first_day, created_at__lt=first_day + timedelta(days=len(days)))
+            .annotate(day=TruncDate('created_at')),
+            'day',
+        ),
+        'monthly': _grouped(
+            Complaint.objects.filter(created_at__gte=first_month).annotate(month=TruncMonth('created_at')),
+            'month',
+        ),
+        'resolution': (
+            Complaint.objects
+            .filter(status='resolved', resolved_at__isnull=False)
+            .order_by()
+            .values('status')
+            .annotate(count=Count('id'), total=Sum(resolution))
+            .values_list('count', 'total')
+        ),
+        'heatmap': (
+            Complaint.objects.values('latitude', 'longitude', 'category')
+            .annotate(count=Count('id'))
+        ),
+    }
+
+
+def assemble_dashboard(now, rows, archived):
+    """Build the dashboard_stats payload from evaluated dashboard_queries().
+
+    `archived` is complaints.archive.archive_summary(), folded into the
+    totals so archived history still counts.
+    """
+    status_dist = dict(rows['status'])
+    category_dist = dict(rows['category'])
+
+    daily_counts = dict(rows['daily'])
+    daily_complaints = [
+        {'date': date.strftime('%Y-%m-%d'), 'count': daily_counts.get(date.date(), 0)}
+        for date in _daily_dates(now)
+    ]
+    monthly_counts = {(month.year, month.month): count for month, count in rows['monthly']}
+    monthly_complaints = [
+        {'month': date.strftime('%b %Y'), 'count': monthly_counts.get((date.year, date.month), 0)}
+        for date in _monthly_dates(now)
+    ]
+
+    resolved_count, total_time = 0, 0.0
+    for count, total in rows['resolution']:
+        resolved_count += count
+        total_time += total.total_seconds() / 3600 if total else 0.0
+
+    # Fold in complaints moved to the archive tables
+    for key, count in archived['by_status'].items():
+        status_dist[key] = status_dist.get(key, 0) + count
+    for key, count in archived['by_category'].items():
+        category_dist[key] = category_dist.get(key, 0) + count
+    total_time += archived['resolution_hours']
+    resolved_count += archived['resolved_count']
+
+    avg_time = total_time / resolved_count if resolved_count else None
+
+    top_categories = [
+        {'category': category, 'count': count}
+        for category, count in sorted(category_dist.items(), key=lambda item: -item[1])[:5]
+    ]
+
+    return {
+        'total_complaints': sum(status_dist.values()),
+        'pending_complaints': status_dist.get('pending', 0),
+        'in_progress_complaints': status_dist.get('in_progress', 0),
+        'resolved_complaints': status_dist.get('resolved', 0),
+        'rejected_complaints': status_dist.get('rejected', 0),
+        'category_distribution': category_dist,
+        'status_distribution': status_dist,
+        'daily_complaints': daily_complaints,
+        'monthly_complaints': monthly_complaints,
+        'avg_resolution_time': round(avg_time, 2) if avg_time else None,
+        'top_categories': top_categories,
+        'complaint_heatmap': list(rows['heatmap']),
+    }
+
+
+def heatmap_queryset(category=None, status=None):
+    queryset = Complaint.objects.all()
+    if category:
+        queryset = queryset.filter(category=category)
+    if status:
+        queryset = queryset.filter(status=status)
+    return queryset.values_list('latitude', 'longitude', 'category', 'status')
+
+
+def heatmap_point(row):
+    latitude, longitude, category, status = row
+    return {
+        'lat': float(latitude),
+        'lng': float(longitude),
+        'intensity': 1,
+        'category': category,
+        'status': status,
+    }
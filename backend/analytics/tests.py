@@ -0,0 +1,69 @@
+from unittest import mock
+
+import numpy as np
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from analytics.models import ComplaintEmbedding
+from analytics.vector_index import ComplaintVectorIndex
+from complaints.models import Complaint
+from users.models import User
+
+
+class ComplaintVectorIndexTests(TestCase):
+    def setUp(self):
+        self.citizen = User.objects.create_user('citizen', password='x')
+        self.index = ComplaintVectorIndex()
+
+    def embed(self, vector):
+        complaint = Complaint.objects.create(
+            title='Water', description='No water supply', category='water',
+            latitude=21.25, longitude=81.63, citizen=self.citizen,
+        )
+        ComplaintEmbedding.objects.create(complaint=complaint, embedding_vector=vector)
+        return complaint.pk
+
+    def test_refresh_publishes_a_new_snapshot(self):
+        first = self.embed([1.0, 0.0])
+        before = self.index.refresh()
+        self.assertIs(self.index.refresh(), before)
+
+        second = self.embed([0.0, 2.0])
+        ids, vectors, created_at = self.index.refresh()
+        self.assertEqual(ids.tolist(), [first, second])
+        self.assertEqual(len(vectors), len(created_at))
+        np.testing.assert_allclose(vectors[1], [0.0, 1.0])
+        # A reader still holding the old snapshot keeps consistent rows
+        self.assertEqual(before[0].tolist(), [first])
+        self.assertEqual(len(before[1]), 1)
+        with self.assertRaises(ValueError):
+            vectors[0, 0] = 0.5
+
+    def test_search(self):
+        first = self.embed([1.0, 0.0])
+        second = self.embed([0.6, 0.8])
+        hits = self.index.search(np.array([0.0, 1.0]), top_k=1)
+        self.assertEqual([pk for pk, _ in hits], [second])
+        hits = self.index.search(np.array([0.0, 1.0]), candidate_ids=[first])
+        self.assertEqual([pk for pk, _ in hits], [first])
+
+
+class ClusteringAccessTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def as_user(self, role):
+        self.client.force_authenticate(User.objects.create_user(role, password='x', role=role))
+
+    def test_citizen_cannot_cluster_or_take_a_slot(self):
+        self.as_user('citizen')
+        with mock.patch('backend.throttling.acquire_slot') as acquire:
+            response = self.client.post('/api/analytics/cluster_complaints/')
+        self.assertEqual(response.status_code, 403)
+        acquire.assert_not_called()
+
+    def test_clustering_runs_is_for_officers(self):
+        self.as_user('citizen')
+        self.assertEqual(self.client.get('/api/analytics/clustering_runs/').status_code, 403)
+        self.as_user('officer')
+        self.assertEqual(self.client.get('/api/analytics/clustering_runs/').status_code, 200)
@@ -0,0 +1,75 @@
+# Stage-level timing and memory for the clustering pipeline
+#
+# A PipelineTrace is threaded through one clustering run. Each stage
+# records its wall time and the process's peak RSS when it finished,
+# plus whatever counters the stage adds (batches, tokens/s, inertia...).
+# The finished trace is stored on the ClusteringRun.
+#
+# Peak RSS is getrusage's ru_maxrss: the high-water mark for the whole
+# life of the process, not of the run. In a long-lived worker it can come
+# from an earlier request, and growth is only non-zero when the run itself
+# pushed memory past every earlier peak.
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no getrusage
+    resource = None
+
+
+def peak_rss_mb():
+    """High-water resident memory since this process started, in MB, if the OS reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+class PipelineTrace:
+    def __init__(self):
+        self.stages = []
+        self._start = time.perf_counter()
+        self.peak_rss_start_mb = peak_rss_mb()
+
+    @contextmanager
+    def stage(self, name):
+        """Time the block as stage `name`; yields a dict for the stage's counters.
+
+        A stage that raises is still recorded, with `failed` set.
+        """
+        counters = {}
+        peak_before = peak_rss_mb()
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield counters
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            record = {'name': name, 'seconds': round(time.perf_counter() - start, 4)}
+            peak_after = peak_rss_mb()
+            if peak_after is not None:
+                record['peak_rss_mb'] = peak_after
+                record['peak_rss_growth_mb'] = round(peak_after - peak_before, 1)
+            if failed:
+                record['failed'] = True
+            record.update(counters)
+            self.stages.append(record)
+
+    @property
+    def total_seconds(self):
+        return round(time.perf_counter() - self._start, 4)
+
+    def summary(self):
+        peak = peak_rss_mb()
+        return {
+            'total_seconds': self.total_seconds,
+            'peak_rss_mb': peak,
+            'peak_rss_start_mb': self.peak_rss_start_mb,
+            'peak_rss_growth_mb': None if peak is None else round(peak - self.peak_rss_start_mb, 1),
+            'stages': self.stages,
+        }
@@ -1,10 +1,14 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import AnalyticsViewSet
+from .async_views import dashboard_stats, heatmap_data
 
 router = DefaultRouter()
 router.register(r'', AnalyticsViewSet, basename='analytics')
 
 urlpatterns = [
+    # Async (ASGI) read paths mirroring the viewset actions
+    path('async/dashboard_stats/', dashboard_stats, name='analytics-dashboard-stats-async'),
+    path('async/heatmap_data/', heatmap_data, name='analytics-heatmap-data-async'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -0,0 +1,109 @@
+# In-memory index over stored complaint embeddings
+import threading
+import time
+from typing import List, Tuple
+
+import numpy as np
+from django.db.models import Count, Max
+
+from .models import ComplaintEmbedding
+
+
+def _freeze(*arrays):
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+class ComplaintVectorIndex:
+    """Normalised embedding matrix kept in process memory.
+
+    The matrix is rebuilt only when the stored embeddings change, which is
+    detected with a single COUNT/MAX aggregate, so a search costs one matrix
+    product over the candidate rows.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        # (ids, vectors, created_at), replaced as a whole by refresh() and
+        # never modified, so a reader holding it sees rows that line up
+        self.snapshot = _freeze(
+            np.empty(0, dtype=np.int64),
+            np.empty((0, 0), dtype=np.float32),
+            np.empty(0, dtype=np.float64),
+        )
+
+    def _current_version(self):
+        stats = ComplaintEmbedding.objects.aggregate(count=Count('id'), last=Max('id'))
+        return stats['count'], stats['last']
+
+    def refresh(self, force: bool = False):
+        """Rebuild if the stored embeddings changed; return the snapshot."""
+        version = self._current_version()
+        if not force and version == self._version:
+            return self.snapshot
+        with self._lock:
+            if not force and version == self._version:
+                return self.snapshot
+            rows = list(
+                ComplaintEmbedding.objects
+                .exclude(embedding_vector=[])
+                .values_list('complaint_id', 'complaint__created_at', 'embedding_vector')
+                .order_by('complaint_id')
+            )
+            if rows:
+                ids, created, vectors = zip(*rows)
+                matrix = np.asarray(vectors, dtype=np.float32)
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                snapshot = _freeze(
+                    np.asarray(ids, dtype=np.int64),
+                    matrix / norms,
+                    np.asarray([c.timestamp() for c in created], dtype=np.float64),
+                )
+            else:
+                snapshot = _freeze(
+                    np.empty(0, dtype=np.int64),
+                    np.empty((0, 0), dtype=np.float32),
+                    np.empty(0, dtype=np.float64),
+                )
+            # Publish before the version, so a matching version never
+            # hands out an older snapshot
+            self.snapshot = snapshot
+            self._version = version
+            return snapshot
+
+    def search(self, query_vector: np.ndarray, candidate_ids=None, top_k: int = 10,
+               recency_weight: float = 0.0, half_life_days: float = 30.0) -> List[Tuple[int, float]]:
+        """Return (complaint_id, score) pairs, best first.
+
+        The score is cosine similarity, optionally blended with an exponential
+        recency decay: (1 - w) * similarity + w * 0.5 ** (age / half_life).
+        """
+        ids, vectors, created_at = self.refresh()
+        if ids.size == 0:
+            return []
+
+        if candidate_ids is not None:
+            mask = np.isin(ids, np.fromiter(candidate_ids, dtype=np.int64))
+            ids, vectors, created_at = ids[mask], vectors[mask], created_at[mask]
+            if ids.size == 0:
+                return []
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+        scores = vectors @ query
+
+        if recency_weight:
+            age_days = (time.time() - created_at) / 86400
+            recency = np.power(0.5, age_days / half_life_days)
+            scores = (1 - recency_weight) * scores + recency_weight * recency
+
+        k = min(top_k, scores.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(ids[i]), float(scores[i])) for i in top]
+
+
+complaint_vector_index = ComplaintVectorIndex()
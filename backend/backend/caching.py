@@ -0,0 +1,31 @@
+# Whether the default cache is shared between worker processes
+#
+# The JWT user cache, replica pins, throttle buckets and concurrency slots
+# keep state in the default cache that every worker has to see. Django's
+# local-memory cache is private to one process, so with it invalidations
+# and pins written by one worker never reach the others.
+from django.conf import settings
+from django.core.checks import Warning
+
+PROCESS_LOCAL_BACKENDS = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+
+def cache_is_shared(alias='default'):
+    return settings.CACHES[alias]['BACKEND'] not in PROCESS_LOCAL_BACKENDS
+
+
+def check_shared_cache(app_configs, **kwargs):
+    if cache_is_shared():
+        return []
+    return [Warning(
+        'The default cache is private to each worker process.',
+        hint=(
+            'Set REDIS_URL. Until then the JWT user cache and read-replica '
+            'routing stay off, and throttle buckets and concurrency limits '
+            'apply per worker.'
+        ),
+        id='backend.W001',
+    )]
@@ -0,0 +1,274 @@
+# Per-request performance instrumentation
+#
+# RequestMetricsMiddleware collects, for every request, the number of SQL
+# queries and time spent in them, in serializers, in rendering and in model
+# inference, and:
+#   - returns them in a Server-Timing header (visible in browser devtools),
+#   - feeds per-view latency histograms served in Prometheus text format
+#     by metrics_view (/metrics),
+#   - logs requests slower than SLOW_REQUEST_SECONDS with their SQL.
+# Histograms are per worker process; Prometheus should scrape each worker
+# or sum across them.
+import bisect
+import hmac
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse, HttpResponseForbidden
+from rest_framework.serializers import BaseSerializer
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('sql', 'serialize', 'render', 'inference')
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250, 500)
+# Distinct statements remembered per request for the slow log
+MAX_STATEMENTS = 100
+SLOW_LOG_STATEMENTS = 10
+
+_current = ContextVar('request_stats', default=None)
+
+
+class RequestStats:
+    def __init__(self):
+        self.queries = 0
+        self.durations = dict.fromkeys(STAGES, 0.0)
+        self.statements = {}  # sql -> [count, seconds]
+        self._depth = defaultdict(int)
+
+    def add_query(self, sql, seconds):
+        self.queries += 1
+        self.durations['sql'] += seconds
+        entry = self.statements.get(sql)
+        if entry is not None:
+            entry[0] += 1
+            entry[1] += seconds
+        elif len(self.statements) < MAX_STATEMENTS:
+            self.statements[sql] = [1, seconds]
+
+
+@contextmanager
+def stage(name):
+    """Attribute the time spent inside to `name` for the current request.
+
+    Nested uses of the same stage count once, so a serializer reached from
+    another serializer is not timed twice.
+    """
+    stats = _current.get()
+    if stats is None or stats._depth[name]:
+        yield
+        return
+    stats._depth[name] += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.durations[name] += time.perf_counter() - start
+        stats._depth[name] -= 1
+
+
+def record_sql(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.add_query(sql, time.perf_counter() - start)
+
+
+def install_sql_timing(connection, **kwargs):
+    if record_sql not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_sql)
+
+
+_serializer_timing_installed = False
+
+
+def install_serializer_timing():
+    """Time BaseSerializer.data, where DRF runs to_representation.
+
+    DRF has no hook around serialization, so the property is wrapped once.
+    """
+    global _serializer_timing_installed
+    if _serializer_timing_installed:
+        return
+    data = BaseSerializer.data.fget
+
+    def timed_data(self):
+        with stage('serialize'):
+            return data(self)
+
+    BaseSerializer.data = property(timed_data)
+    _serializer_timing_installed = True
+
+
+class Histogram:
+    def __init__(self, name, documentation, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        # labels -> [bucket counts..., +Inf count, sum]
+        self._series = {}
+
+    def observe(self, labels, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def expose(self, label_names):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            series = {labels: list(values) for labels, values in self._series.items()}
+        for labels, values in sorted(series.items()):
+            base = ','.join(f'{k}="{_escape(v)}"' for k, v in zip(label_names, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), values[:-1]):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{base},le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_count{{{base}}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{base}}} {values[-1]}')
+        return lines
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+LABELS = ('view', 'method')
+HISTOGRAMS = {
+    'total': Histogram('http_request_duration_seconds', 'Request latency by view.', LATENCY_BUCKETS),
+    'sql': Histogram('http_request_sql_seconds', 'Time spent in SQL per request by view.', LATENCY_BUCKETS),
+    'serialize': Histogram('http_request_serialize_seconds', 'Time spent in serializers per request by view.', LATENCY_BUCKETS),
+    'render': Histogram('http_request_render_seconds', 'Time spent rendering responses per request by view.', LATENCY_BUCKETS),
+    'inference': Histogram('http_request_inference_seconds', 'Time spent in model inference per request by view.', LATENCY_BUCKETS),
+    'queries': Histogram('http_request_queries', 'SQL queries per request by view.', QUERY_BUCKETS),
+}
+_responses_lock = threading.Lock()
+_responses = defaultdict(int)  # (view, method, status) -> count
+
+
+def view_label(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unmatched'
+    return match.view_name or match.route or 'unknown'
+
+
+def observe(request, response, stats, total):
+    labels = (view_label(request), request.method)
+    HISTOGRAMS['total'].observe(labels, total)
+    HISTOGRAMS['queries'].observe(labels, stats.queries)
+    for name in STAGES:
+        HISTOGRAMS[name].observe(labels, stats.durations[name])
+    with _responses_lock:
+        _responses[labels + (str(response.status_code),)] += 1
+
+
+def server_timing(stats, total):
+    durations = stats.durations
+    parts = [f'db;dur={durations["sql"] * 1000:.1f};desc="{stats.queries} queries"']
+    parts += [f'{name};dur={durations[name] * 1000:.1f}' for name in STAGES[1:] if durations[name]]
+    parts.append(f'total;dur={total * 1000:.1f}')
+    return ', '.join(parts)
+
+
+def log_if_slow(request, response, stats, total):
+    if total < settings.SLOW_REQUEST_SECONDS:
+        return
+    worst = sorted(stats.statements.items(), key=lambda item: -item[1][1])[:SLOW_LOG_STATEMENTS]
+    statements = '\n'.join(
+        f'  {seconds * 1000:8.1f} ms  x{count:<4} {sql}' for sql, (count, seconds) in worst
+    )
+    durations = stats.durations
+    logger.warning(
+        f'Slow request {request.method} {request.get_full_path()} -> {response.status_code} '
+        f'in {total * 1000:.0f} ms: {stats.queries} queries / {durations["sql"] * 1000:.0f} ms SQL, '
+        f'{durations["serialize"] * 1000:.0f} ms serialize, {durations["render"] * 1000:.0f} ms render, '
+        f'{durations["inference"] * 1000:.0f} ms inference\n{statements}'
+    )
+
+
+class RequestMetricsMiddleware:
+    """Time each request and its SQL, serialization, rendering and inference.
+
+    Should come first in MIDDLEWARE so the total covers everything else.
+    Streaming responses are measured up to their first byte.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        install_serializer_timing()
+        connection_created.connect(install_sql_timing, dispatch_uid='backend.metrics.sql_timing')
+        # Connections opened before this middleware was loaded
+        for connection in connections.all(initialized_only=True):
+            install_sql_timing(connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, stats, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, stats, time.perf_counter() - start)
+
+    def finish(self, request, response, stats, total):
+        response['Server-Timing'] = server_timing(stats, total)
+        observe(request, response, stats, total)
+        log_if_slow(request, response, stats, total)
+        return response
+
+
+def metrics_view(request):
+    """Prometheus text exposition of this worker's request metrics."""
+    token = settings.METRICS_TOKEN
+    if token:
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return HttpResponseForbidden()
+    elif not settings.DEBUG:
+        return HttpResponseForbidden()
+
+    lines = []
+    for histogram in HISTOGRAMS.values():
+        lines += histogram.expose(LABELS)
+    lines += ['# HELP http_responses_total Responses by view, method and status.',
+              '# TYPE http_responses_total counter']
+    with _responses_lock:
+        responses = dict(_responses)
+    for (view, method, status), count in sorted(responses.items()):
+        lines.append(
+            f'http_responses_total{{view="{_escape(view)}",method="{method}",status="{status}"}} {count}'
+        )
+    return HttpResponse('\n'.join(lines) + '\n', content_type='text/plain; version=0.0.4; charset=utf-8')
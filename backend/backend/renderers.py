@@ -0,0 +1,34 @@
+# JSON rendering through orjson, byte-for-byte compatible with DRF's
+# JSONRenderer for the compact (non-indented) responses this API returns
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from .metrics import stage
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to DRF's stdlib encoder
+    orjson = None
+
+_drf_encoder = JSONEncoder()
+
+# Datetimes go through DRF's encoder so they keep its millisecond/'Z'
+# formatting; Decimals, numpy values, lazy strings etc. likewise.
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+) if orjson else 0
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with stage('render'):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type, renderer_context):
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        content = orjson.dumps(data, default=_drf_encoder.default, option=ORJSON_OPTIONS)
+        # Same escaping of the JavaScript line terminators as JSONRenderer
+        return content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -0,0 +1,128 @@
+# Read-replica routing
+#
+# Reads only go to a replica inside read_from_replica(), which
+# ReplicaReadMixin enters for the safe-method actions a view opts in.
+# Everything else, writes included, stays on `default`. A user who just
+# wrote is pinned to the primary for REPLICA_PIN_SECONDS so they never
+# read an older copy than the one they saved, whatever the replica lag.
+# Pins live in the cache, so replicas are only used when it is shared.
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+
+from .caching import cache_is_shared
+
+_use_replica = ContextVar('use_replica', default=False)
+
+
+def replica_aliases():
+    return [alias for alias in settings.DATABASES if alias.startswith('replica_')]
+
+
+@contextmanager
+def read_from_replica(enabled=True):
+    token = _use_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def pin_key(user_id):
+    return f'db:pin:{user_id}'
+
+
+def pin_to_primary(user):
+    if user is not None and user.is_authenticated and settings.REPLICA_PIN_SECONDS:
+        cache.set(pin_key(user.pk), True, settings.REPLICA_PIN_SECONDS)
+
+
+def is_pinned(user):
+    return user is not None and user.is_authenticated and bool(cache.get(pin_key(user.pk)))
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        # A pin set on one worker must be visible on all of them, or a user
+        # could read a stale replica right after writing
+        if _use_replica.get() and cache_is_shared():
+            replicas = replica_aliases()
+            if replicas:
+                return random.choice(replicas)
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema through replication
+        return db == 'default'
+
+
+class ReplicaPinMiddleware:
+    """Pin users to the primary after any successful write request.
+
+    Runs after the view, when DRF has copied the authenticated (JWT) user
+    onto the Django request. Pins live in the cache, which is why
+    ReplicaRouter ignores replicas unless that cache is shared.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        if self.should_pin(request, response):
+            pin_to_primary(request.user)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if self.should_pin(request, response):
+            await sync_to_async(pin_to_primary)(request.user)
+        return response
+
+    @staticmethod
+    def should_pin(request, response):
+        return (
+            request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and hasattr(request, 'user')
+        )
+
+
+class ReplicaReadMixin:
+    """Serve the listed actions' GETs from a replica (all GETs if None)."""
+    replica_actions = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        action = getattr(self, 'action', None)
+        if (
+            request.method in SAFE_METHODS
+            and (self.replica_actions is None or action in self.replica_actions)
+            and not is_pinned(request.user)
+        ):
+            self._replica_token = _use_replica.set(True)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, '_replica_token', None)
+        if token is not None:
+            _use_replica.reset(token)
+            self._replica_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
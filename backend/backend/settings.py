@@ -27,6 +27,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework_simplejwt',
     'corsheaders',
@@ -37,15 +38,17 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'backend.metrics.RequestMetricsMiddleware',
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'backend.static.StaticFilesMiddleware',
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     'corsheaders.middleware.CorsMiddleware',
+    'backend.replicas.ReplicaPinMiddleware',
 ]
 
 ROOT_URLCONF = "backend.urls"
@@ -79,6 +82,38 @@ DATABASES = {
     }
 }
 
+# User cache, replica pins and throttle state must be visible to every
+# worker: point REDIS_URL at a shared Redis. Without it each process gets
+# a private local-memory cache and those features fall back (see
+# backend.caching).
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Read replicas: PSQL_REPLICA_HOSTS="host[:port],..." adds aliases replica_1,
+# replica_2, ... that analytics and list reads are routed to
+for n, replica in enumerate(filter(None, os.getenv('PSQL_REPLICA_HOSTS', '').split(',')), start=1):
+    host, _, port = replica.strip().partition(':')
+    DATABASES[f'replica_{n}'] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_ROUTERS = ['backend.replicas.ReplicaRouter']
+# After a write, that user's reads stay on the primary for this long
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', 5))
+
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -110,18 +145,89 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Threads that recompress uploaded complaint photos and build thumbnails
+IMAGE_PROCESSING_WORKERS = int(os.getenv('IMAGE_PROCESSING_WORKERS', 2))
+
+# GeoJSON of district boundaries used to fill in Complaint.district from
+# coordinates; features need a district name property (e.g. "district").
+# Not bundled; an empty value turns the lookup off
+DISTRICT_BOUNDARIES_FILE = os.getenv(
+    'DISTRICT_BOUNDARIES_FILE', os.path.join(BASE_DIR, 'data', 'cg_districts.geojson')
+)
+
+# Bulk ingest: largest accepted batch and rows per INSERT/transaction
+COMPLAINT_INGEST_MAX_ROWS = int(os.getenv('COMPLAINT_INGEST_MAX_ROWS', 20000))
+COMPLAINT_INGEST_CHUNK_SIZE = 1000
+
+# Resolved/rejected complaints untouched for this long move to the archive tables
+COMPLAINT_ARCHIVE_AFTER_DAYS = int(os.getenv('COMPLAINT_ARCHIVE_AFTER_DAYS', 365))
+COMPLAINT_ARCHIVE_BATCH_SIZE = 1000
+
+# Assign new complaints to the least-loaded officer in their district
+COMPLAINT_AUTO_ROUTING = os.getenv('COMPLAINT_AUTO_ROUTING', 'True') == 'True'
+ROUTING_EXPERTISE_BONUS = 5
+
+# Seconds to cache serialized complaint detail responses; 0 disables
+COMPLAINT_DETAIL_CACHE_TIMEOUT = int(os.getenv('COMPLAINT_DETAIL_CACHE_TIMEOUT', 0))
+
+# Status push over Server-Sent Events; swap the broker to fan out across processes
+COMPLAINT_EVENT_BROKER = 'complaints.events.InProcessBroker'
+COMPLAINT_EVENTS_KEEPALIVE = 25
+
+# Token-bucket cost of expensive view actions (backend.throttling); actions
+# not listed are free. Buckets are (capacity, tokens refilled per second).
+THROTTLE_COSTS = {
+    'cluster_complaints': 30,
+    'semantic_search': 1,
+}
+THROTTLE_BUCKETS = {
+    'user': (
+        int(os.getenv('THROTTLE_USER_CAPACITY', 60)),
+        float(os.getenv('THROTTLE_USER_REFILL', 0.5)),
+    ),
+    'global': (
+        int(os.getenv('THROTTLE_GLOBAL_CAPACITY', 300)),
+        float(os.getenv('THROTTLE_GLOBAL_REFILL', 5)),
+    ),
+}
+# Concurrent runs allowed per heavy action, and the Retry-After (seconds)
+# sent with the 503 when they are all busy
+CONCURRENCY_LIMITS = {
+    'cluster_complaints': (int(os.getenv('CLUSTERING_CONCURRENCY', 1)), 60),
+    'semantic_search': (int(os.getenv('SEMANTIC_SEARCH_CONCURRENCY', 4)), 2),
+}
+# Longest a concurrency slot is held if its worker dies mid-request
+CONCURRENCY_LEASE = 900
+
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_THROTTLE_CLASSES': (
+        'backend.throttling.CostThrottle',
+    ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'backend.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 
+# Seconds an authenticated user row is cached between requests; 0 disables.
+# Needs a shared cache (REDIS_URL), since saves only invalidate that cache.
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv('AUTH_USER_CACHE_TIMEOUT', 60))
+
+# Requests slower than this (seconds) are logged with their SQL
+SLOW_REQUEST_SECONDS = float(os.getenv('SLOW_REQUEST_SECONDS', 1.0))
+# Bearer token required to read /metrics; without one it is only served
+# while DEBUG is on
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
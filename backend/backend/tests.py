@@ -0,0 +1,78 @@
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import AsyncClient, Client, SimpleTestCase, override_settings
+from django.utils.module_loading import import_string
+
+from backend.replicas import ReplicaRouter, read_from_replica
+from backend.throttling import LOCK_BUSY_RETRY, TokenBucket, consume_all
+
+
+@mock.patch('backend.replicas.replica_aliases', return_value=['replica_1'])
+class ReplicaRouterTests(SimpleTestCase):
+    def test_per_process_cache_keeps_reads_on_primary(self, aliases):
+        with read_from_replica():
+            self.assertEqual(ReplicaRouter().db_for_read(None), 'default')
+
+    def test_shared_cache_reads_from_replica(self, aliases):
+        with tempfile.TemporaryDirectory() as location, override_settings(CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location},
+        }):
+            with read_from_replica():
+                self.assertEqual(ReplicaRouter().db_for_read(None), 'replica_1')
+            self.assertEqual(ReplicaRouter().db_for_read(None), 'default')
+
+
+class TokenBucketTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = TokenBucket('throttle:user:1', 60, 0.5)
+        self.shared = TokenBucket('throttle:global', 40, 0.5)
+
+    def test_refused_by_one_bucket_debits_neither(self):
+        self.assertEqual(consume_all([self.user, self.shared], 30), 0)
+        # The global bucket cannot afford a second call; the user's could
+        self.assertGreater(consume_all([self.user, self.shared], 30), 0)
+        self.assertEqual(consume_all([self.user], 30), 0)
+        self.assertGreater(consume_all([self.user], 30), 0)
+
+    def test_busy_lock_throttles_without_spending(self):
+        cache.add(self.shared.lock_key, 1)
+        self.assertEqual(consume_all([self.user, self.shared], 30), LOCK_BUSY_RETRY)
+        self.assertIsNone(cache.get(self.user.lock_key))
+        cache.delete(self.shared.lock_key)
+        self.assertEqual(self.user.consume(60), 0)
+
+
+class AsyncMiddlewareTests(SimpleTestCase):
+    def test_no_middleware_forces_a_thread_under_asgi(self):
+        for path in settings.MIDDLEWARE:
+            self.assertTrue(getattr(import_string(path), 'async_capable', False), path)
+
+    @override_settings(WHITENOISE_USE_FINDERS=True)
+    async def test_static_files_served_without_the_view(self):
+        response = await AsyncClient().get('/static/admin/css/base.css')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'body', response.getvalue())
+        response.close()
+
+
+class MetricsAccessTests(SimpleTestCase):
+    def get(self, **headers):
+        return Client().get('/metrics', headers=headers).status_code
+
+    @override_settings(METRICS_TOKEN='', DEBUG=False)
+    def test_closed_without_a_token(self):
+        self.assertEqual(self.get(), 403)
+
+    @override_settings(METRICS_TOKEN='', DEBUG=True)
+    def test_open_in_debug_without_a_token(self):
+        self.assertEqual(self.get(), 200)
+
+    @override_settings(METRICS_TOKEN='secret', DEBUG=True)
+    def test_token_required_once_set(self):
+        self.assertEqual(self.get(), 403)
+        self.assertEqual(self.get(Authorization='Bearer wrong'), 403)
+        self.assertEqual(self.get(Authorization='Bearer secret'), 200)
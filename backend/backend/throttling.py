@@ -0,0 +1,183 @@
+# Cost-aware throttling and admission control for expensive endpoints
+#
+# Each view action has a cost (THROTTLE_COSTS) that is spent from two token
+# buckets, one per user and one shared by everybody (THROTTLE_BUCKETS).
+# The heaviest actions additionally hold one of a fixed number of
+# concurrency slots while they run (CONCURRENCY_LIMITS). All state lives in
+# the configured cache so every worker process sees the same buckets and
+# slots; use a shared backend (Redis, memcached) when running several.
+import functools
+import math
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.throttling import BaseThrottle
+
+# A bucket update is read-modify-write; this lock keeps concurrent requests
+# from spending the same tokens twice. A request that cannot get it in
+# LOCK_WAIT seconds is throttled for LOCK_BUSY_RETRY seconds instead.
+LOCK_TIMEOUT = 2
+LOCK_WAIT = 0.05
+LOCK_BUSY_RETRY = 1
+
+
+def action_cost(view):
+    return settings.THROTTLE_COSTS.get(getattr(view, 'action', None), 0)
+
+
+class TokenBucket:
+    def __init__(self, key, capacity, refill_rate):
+        self.key = key
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+
+    @property
+    def lock_key(self):
+        return f'{self.key}:lock'
+
+    def acquire(self):
+        deadline = time.monotonic() + LOCK_WAIT
+        while not cache.add(self.lock_key, 1, LOCK_TIMEOUT):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.002)
+        return True
+
+    def release(self):
+        cache.delete(self.lock_key)
+
+    def tokens(self, now):
+        tokens, stamp = cache.get(self.key, (self.capacity, now))
+        return min(self.capacity, tokens + (now - stamp) * self.refill_rate)
+
+    def store(self, tokens, now):
+        # Idle for the time a full refill takes, the bucket is full again
+        timeout = math.ceil(self.capacity / self.refill_rate) + 1
+        cache.set(self.key, (tokens, now), timeout)
+
+    def consume(self, cost):
+        """Spend `cost` tokens; returns 0, or seconds until they are available."""
+        return consume_all([self], cost)
+
+
+def consume_all(buckets, cost):
+    """Spend `cost` from every bucket or from none of them.
+
+    Returns 0, or the seconds until all of them can afford it. The buckets
+    are locked in the order given (always user, then global) for the whole
+    check-and-spend; a lock that stays busy counts as a refusal.
+    """
+    held = []
+    try:
+        for bucket in buckets:
+            if not bucket.acquire():
+                return LOCK_BUSY_RETRY
+            held.append(bucket)
+
+        now = time.time()
+        wait, remaining = 0, []
+        for bucket in buckets:
+            # A cost no bucket could ever afford is charged as a full bucket
+            charge = min(cost, bucket.capacity)
+            tokens = bucket.tokens(now)
+            if tokens < charge:
+                wait = max(wait, (charge - tokens) / bucket.refill_rate)
+            remaining.append(tokens - charge)
+        if wait:
+            return wait
+        for bucket, tokens in zip(buckets, remaining):
+            bucket.store(tokens, now)
+        return 0
+    finally:
+        for bucket in held:
+            bucket.release()
+
+
+class CostThrottle(BaseThrottle):
+    """Charge the view action's THROTTLE_COSTS entry to the user's bucket
+    and the global one together: both are debited, or neither is.
+
+    One class rather than two throttles because DRF consults every
+    throttle even after one refuses, which would let a throttled user keep
+    draining the shared bucket.
+    """
+
+    def get_ident_key(self, request):
+        if request.user and request.user.is_authenticated:
+            return f'throttle:user:{request.user.pk}'
+        return f'throttle:anon:{self.get_ident(request)}'
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        cost = action_cost(view)
+        if not cost:
+            return True
+        buckets = [
+            TokenBucket(key, *settings.THROTTLE_BUCKETS[name])
+            for name, key in (('user', self.get_ident_key(request)), ('global', 'throttle:global'))
+        ]
+        self.wait_seconds = consume_all(buckets, cost)
+        return not self.wait_seconds
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class ServiceBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Server is busy with other requests of this kind, try again later.'
+    default_code = 'service_busy'
+
+    def __init__(self, wait, detail=None):
+        # DRF's exception handler turns `wait` into a Retry-After header
+        self.wait = wait
+        super().__init__(detail)
+
+
+def slot_keys(name):
+    limit = settings.CONCURRENCY_LIMITS[name][0]
+    return [f'concurrency:{name}:{slot}' for slot in range(limit)]
+
+
+def acquire_slot(name):
+    """Claim a free slot for `name`; returns (key, token), or None when all are taken.
+
+    Slots expire after CONCURRENCY_LEASE seconds so a worker killed
+    mid-request cannot hold one forever.
+    """
+    token = uuid.uuid4().hex
+    for key in slot_keys(name):
+        if cache.add(key, token, settings.CONCURRENCY_LEASE):
+            return key, token
+    return None
+
+
+def release_slot(slot):
+    key, token = slot
+    # Only free the slot if the lease has not expired and been re-taken
+    if cache.get(key) == token:
+        cache.delete(key)
+
+
+def limit_concurrency(name):
+    """Run the decorated view method in one of CONCURRENCY_LIMITS[name] slots.
+
+    When every slot is busy the request is refused with 503 and a
+    Retry-After of CONCURRENCY_LIMITS[name][1] seconds.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            slot = acquire_slot(name)
+            if slot is None:
+                raise ServiceBusy(settings.CONCURRENCY_LIMITS[name][1])
+            try:
+                return method(*args, **kwargs)
+            finally:
+                release_slot(slot)
+        return wrapper
+    return decorator
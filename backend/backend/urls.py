@@ -3,11 +3,14 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from .metrics import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/users/', include('users.urls')),
     path('api/complaints/', include('complaints.urls')),
     path('api/analytics/', include('analytics.urls')),
+    path('metrics', metrics_view),
 ]
 
 if settings.DEBUG:
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class ComplaintsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "complaints"
+
+    def ready(self):
+        from django.core.checks import register
+
+        from . import signals  # noqa: F401
+        from .districts import check_district_boundaries
+
+        register(check_district_boundaries)
@@ -0,0 +1,106 @@
+# Cold storage for complaints closed long ago
+#
+# Resolved and rejected complaints that have not been touched for
+# COMPLAINT_ARCHIVE_AFTER_DAYS are copied, with their update history, into
+# ArchivedComplaint / ArchivedComplaintUpdate and deleted from the hot
+# tables, so everyday queries and indexes only cover recent history.
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Sum
+from django.utils import timezone
+
+from .models import ArchivedComplaint, ArchivedComplaintUpdate, Complaint, ComplaintUpdate
+
+ARCHIVABLE_STATUSES = ('resolved', 'rejected')
+
+# The archive only changes when archive_complaints runs, so its totals can
+# be cached for a while
+ARCHIVE_SUMMARY_CACHE_KEY = 'complaints:archive:summary'
+ARCHIVE_SUMMARY_TIMEOUT = 600
+
+
+def archive_cutoff(days=None):
+    if days is None:
+        days = settings.COMPLAINT_ARCHIVE_AFTER_DAYS
+    return timezone.now() - timedelta(days=days)
+
+
+def archivable(cutoff):
+    return Complaint.objects.filter(status__in=ARCHIVABLE_STATUSES, updated_at__lt=cutoff)
+
+
+def _copy_sql(source, target, key):
+    """INSERT ... SELECT copying every shared column of `source` into `target`."""
+    quote = connection.ops.quote_name
+    columns = ', '.join(
+        quote(f.column) for f in target._meta.concrete_fields if f.name != 'archived_at'
+    )
+    extra_column = ', archived_at' if target is ArchivedComplaint else ''
+    extra_value = ', %s' if target is ArchivedComplaint else ''
+    return (
+        f'INSERT INTO {quote(target._meta.db_table)} ({columns}{extra_column}) '
+        f'SELECT {columns}{extra_value} FROM {quote(source._meta.db_table)} '
+        f'WHERE {quote(key)} = ANY(%s)'
+    )
+
+
+def archive_batch(cutoff, batch_size=None) -> int:
+    """Move one batch of archivable complaints; returns how many moved.
+
+    Rows being edited right now are skipped rather than waited on, and each
+    batch is its own short transaction.
+    """
+    batch_size = batch_size or settings.COMPLAINT_ARCHIVE_BATCH_SIZE
+    with transaction.atomic():
+        ids = list(
+            archivable(cutoff)
+            .select_for_update(skip_locked=True)
+            .order_by('id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(_copy_sql(Complaint, ArchivedComplaint, 'id'), [timezone.now(), ids])
+            cursor.execute(_copy_sql(ComplaintUpdate, ArchivedComplaintUpdate, 'complaint_id'), [ids])
+        # Cascades to the update history and embeddings
+        Complaint.objects.filter(id__in=ids).delete()
+    cache.delete(ARCHIVE_SUMMARY_CACHE_KEY)
+    return len(ids)
+
+
+def archive_summary():
+    """Totals over the archive for merging into dashboard statistics."""
+    summary = cache.get(ARCHIVE_SUMMARY_CACHE_KEY)
+    if summary is not None:
+        return summary
+
+    by_status = Counter()
+    by_category = Counter()
+    rows = (
+        ArchivedComplaint.objects.order_by()
+        .values_list('status', 'category')
+        .annotate(count=Count('id'))
+    )
+    for status, category, count in rows:
+        by_status[status] += count
+        by_category[category] += count
+
+    resolved = ArchivedComplaint.objects.filter(
+        status='resolved', resolved_at__isnull=False
+    ).aggregate(
+        count=Count('id'),
+        total=Sum(ExpressionWrapper(F('resolved_at') - F('created_at'), output_field=DurationField())),
+    )
+    summary = {
+        'by_status': dict(by_status),
+        'by_category': dict(by_category),
+        'resolved_count': resolved['count'],
+        'resolution_hours': resolved['total'].total_seconds() / 3600 if resolved['total'] else 0.0,
+    }
+    cache.set(ARCHIVE_SUMMARY_CACHE_KEY, summary, ARCHIVE_SUMMARY_TIMEOUT)
+    return summary
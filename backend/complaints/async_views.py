@@ -0,0 +1,103 @@
+# Async versions of the hottest complaint reads, served under ASGI
+#
+# They reuse ComplaintViewSet's querysets, filters, pagination, validators
+# and serializers, but fetch rows with the async ORM, so a slow client or
+# database wait no longer holds a worker thread. Responses match the DRF
+# endpoints under /api/complaints/v2/.
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+
+from backend.renderers import ORJSONRenderer
+from backend.replicas import is_pinned, read_from_replica
+from .auth import authenticate_request
+from .conditional import get_cached_detail, set_cached_detail
+from .fastpath import list_values, serialize_list_rows
+from .views import ComplaintViewSet
+
+
+def render(data, status=200):
+    return HttpResponse(ORJSONRenderer().render(data), content_type='application/json', status=status)
+
+
+def render_error(exc):
+    data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+    return render(data, exc.status_code)
+
+
+async def viewset_for(request, action, **kwargs):
+    """A ComplaintViewSet bound to the request, or None if unauthenticated."""
+    user = await sync_to_async(authenticate_request)(request)
+    if user is None:
+        return None
+    drf_request = Request(request)
+    drf_request.user = user
+    return ComplaintViewSet(
+        request=drf_request, action=action, args=(), kwargs=kwargs, format_kwarg=None
+    )
+
+
+UNAUTHORIZED = {'detail': 'Authentication credentials were not provided.'}
+NOT_FOUND = {'detail': 'Not found.'}
+
+
+async def complaint_list(request):
+    view = await viewset_for(request, 'list')
+    if view is None:
+        return render(UNAUTHORIZED, 401)
+
+    pinned = await sync_to_async(is_pinned)(view.request.user)
+    with read_from_replica(not pinned):
+        try:
+            queryset = list_values(view.filter_queryset(view.get_queryset()))
+            rows = await view.paginator.apaginate_queryset(queryset, view.request, view)
+        except APIException as e:
+            return render_error(e)
+
+    etag, last_modified = view.page_validators(view.request, rows)
+    not_modified = view.not_modified(request, etag, last_modified)
+    if not_modified is not None:
+        return view.with_validators(not_modified, etag, last_modified)
+
+    data = serialize_list_rows(rows, view.request)
+    body = view.paginator.get_paginated_response(data).data
+    return view.with_validators(render(body), etag, last_modified)
+
+
+async def complaint_detail(request, pk):
+    view = await viewset_for(request, 'retrieve', pk=pk)
+    if view is None:
+        return render(UNAUTHORIZED, 401)
+
+    validators = await (
+        view.get_queryset().filter(pk=pk)
+        .values_list('updated_at', 'assigned_officer_id')
+        .afirst()
+    )
+    if validators is None:
+        complaint = await view.get_archive_queryset().filter(pk=pk).afirst()
+        if complaint is None:
+            return render(NOT_FOUND, 404)
+        etag = view.archived_etag(request, complaint)
+        last_modified = complaint.archived_at
+        data = None
+    else:
+        last_modified, officer_id = validators
+        etag = view.detail_etag(request, pk, last_modified, officer_id)
+        complaint = None
+        data = await sync_to_async(get_cached_detail)(pk, etag)
+
+    not_modified = view.not_modified(request, etag, last_modified)
+    if not_modified is not None:
+        return view.with_validators(not_modified, etag, last_modified)
+
+    if data is None:
+        if complaint is None:
+            complaint = await view.get_queryset().filter(pk=pk).afirst()
+            if complaint is None:
+                return render(NOT_FOUND, 404)
+        data = view.get_serializer(complaint).data
+        if validators is not None:
+            await sync_to_async(set_cached_detail)(pk, etag, data)
+    return view.with_validators(render(data), etag, last_modified)
@@ -0,0 +1,23 @@
+# JWT authentication for plain (non-DRF) async views
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+from users.authentication import CachedJWTAuthentication
+
+
+def authenticate_request(request, allow_query_token=False):
+    """The active user for the request's bearer token, or None.
+
+    Blocking (loads the user); call through sync_to_async from async views.
+    """
+    auth = CachedJWTAuthentication()
+    header = auth.get_header(request)
+    raw_token = auth.get_raw_token(header) if header else None
+    if raw_token is None and allow_query_token:
+        raw_token = request.GET.get('token')
+    if not raw_token:
+        return None
+    try:
+        user = auth.get_user(auth.get_validated_token(raw_token))
+    except (InvalidToken, AuthenticationFailed):
+        return None
+    return user if user.is_active else None
@@ -0,0 +1,51 @@
+# ETag / Last-Modified support for complaint read endpoints
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    return hashlib.md5(repr(parts).encode()).hexdigest()
+
+
+def detail_cache_key(pk):
+    return f'complaint:detail:{pk}'
+
+
+def get_cached_detail(pk, etag):
+    """Serialized detail body for `pk`, if cached under the same ETag."""
+    if not settings.COMPLAINT_DETAIL_CACHE_TIMEOUT:
+        return None
+    cached = cache.get(detail_cache_key(pk))
+    if cached and cached[0] == etag:
+        return cached[1]
+    return None
+
+
+def set_cached_detail(pk, etag, data):
+    if settings.COMPLAINT_DETAIL_CACHE_TIMEOUT:
+        cache.set(detail_cache_key(pk), (etag, data), settings.COMPLAINT_DETAIL_CACHE_TIMEOUT)
+
+
+def invalidate_cached_detail(pk):
+    if settings.COMPLAINT_DETAIL_CACHE_TIMEOUT:
+        cache.delete(detail_cache_key(pk))
+
+
+class ConditionalGetMixin:
+    """Answer unchanged GETs with 304 before any serialization happens."""
+
+    def not_modified(self, request, etag, last_modified=None):
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        return get_conditional_response(request, etag=quote_etag(etag), last_modified=timestamp)
+
+    def with_validators(self, response, etag, last_modified=None):
+        response['ETag'] = quote_etag(etag)
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        # Let the browser keep a copy but always revalidate it
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -0,0 +1,129 @@
+# District lookup from coordinates using bundled boundary polygons
+import json
+import logging
+import math
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.core.checks import Warning
+
+logger = logging.getLogger(__name__)
+
+# Grid cell size in degrees (~5.5 km); each cell lists the polygons whose
+# bounding box touches it, so a lookup tests one or two polygons at most.
+GRID_DEGREES = 0.05
+NAME_PROPERTIES = ('district', 'DISTRICT', 'dtname', 'DIST_NAME', 'NAME_2', 'name')
+
+
+class DistrictPolygon:
+    def __init__(self, name: str, rings: List[np.ndarray]):
+        self.name = name
+        # Edge arrays for even-odd ray casting over the outer ring and holes
+        starts = np.concatenate(rings)
+        ends = np.concatenate([np.roll(ring, -1, axis=0) for ring in rings])
+        self.x1, self.y1 = starts[:, 0], starts[:, 1]
+        self.x2, self.y2 = ends[:, 0], ends[:, 1]
+        self.bbox = (self.x1.min(), self.y1.min(), self.x1.max(), self.y1.max())
+
+    def contains(self, lng: float, lat: float) -> bool:
+        min_x, min_y, max_x, max_y = self.bbox
+        if not (min_x <= lng <= max_x and min_y <= lat <= max_y):
+            return False
+        straddles = (self.y1 > lat) != (self.y2 > lat)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cross_x = (self.x2 - self.x1) * (lat - self.y1) / (self.y2 - self.y1) + self.x1
+        return bool(np.count_nonzero(straddles & (lng < cross_x)) % 2)
+
+
+class DistrictIndex:
+    def __init__(self, polygons: List[DistrictPolygon]):
+        self.polygons = polygons
+        self.grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for index, polygon in enumerate(polygons):
+            min_x, min_y, max_x, max_y = polygon.bbox
+            for gx in range(self._cell(min_x), self._cell(max_x) + 1):
+                for gy in range(self._cell(min_y), self._cell(max_y) + 1):
+                    self.grid[(gx, gy)].append(index)
+
+    @staticmethod
+    def _cell(value: float) -> int:
+        return math.floor(value / GRID_DEGREES)
+
+    @classmethod
+    def from_geojson(cls, data: dict) -> 'DistrictIndex':
+        polygons = []
+        for feature in data.get('features', []):
+            properties = feature.get('properties') or {}
+            name = next((properties[k] for k in NAME_PROPERTIES if properties.get(k)), None)
+            geometry = feature.get('geometry') or {}
+            if not name or geometry.get('type') not in ('Polygon', 'MultiPolygon'):
+                continue
+            parts = geometry['coordinates']
+            if geometry['type'] == 'Polygon':
+                parts = [parts]
+            for part in parts:
+                rings = [np.asarray(ring, dtype=np.float64)[:, :2] for ring in part if len(ring) >= 3]
+                if rings:
+                    polygons.append(DistrictPolygon(str(name).strip().title(), rings))
+        return cls(polygons)
+
+    def lookup(self, lat: float, lng: float) -> Optional[str]:
+        for index in self.grid.get((self._cell(lng), self._cell(lat)), ()):
+            polygon = self.polygons[index]
+            if polygon.contains(lng, lat):
+                return polygon.name
+        return None
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_district_index() -> Optional[DistrictIndex]:
+    """Load DISTRICT_BOUNDARIES_FILE once per process; None if unavailable.
+
+    An empty setting turns the lookup off. A file that is configured but
+    cannot be loaded is logged as an error, once per process.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                path = settings.DISTRICT_BOUNDARIES_FILE
+                _index = DistrictIndex([])
+                if path:
+                    try:
+                        with open(path, encoding='utf-8') as f:
+                            _index = DistrictIndex.from_geojson(json.load(f))
+                    except (OSError, ValueError) as e:
+                        logger.error(f"District boundaries unavailable at {path}: {e}")
+                    else:
+                        if not _index.polygons:
+                            logger.error(f"No named district polygons in {path}")
+    return _index if _index.polygons else None
+
+
+def check_district_boundaries(app_configs, **kwargs):
+    path = settings.DISTRICT_BOUNDARIES_FILE
+    if not path or os.path.isfile(path):
+        return []
+    return [Warning(
+        f'DISTRICT_BOUNDARIES_FILE does not exist: {path}',
+        hint=(
+            'Complaints will not get a district from their coordinates. Place '
+            'a GeoJSON of district boundaries there, point the setting at '
+            'one, or set it to an empty string to turn the lookup off.'
+        ),
+        id='complaints.W001',
+    )]
+
+
+def infer_district(lat, lng) -> Optional[str]:
+    index = get_district_index()
+    if index is None or lat is None or lng is None:
+        return None
+    return index.lookup(float(lat), float(lng))
@@ -0,0 +1,132 @@
+# Pub/sub fan-out of complaint status events to streaming clients
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+# Bounded so one stalled client cannot grow memory without limit; when a
+# queue is full the oldest event is dropped and the client re-fetches.
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+def citizen_channel(user_id):
+    return f'citizen:{user_id}'
+
+
+def district_channel(district):
+    return f'district:{(district or "").strip().lower()}'
+
+
+ALL_CHANNEL = 'all'
+
+
+class Subscription:
+    def __init__(self, channels: Iterable[str]):
+        self.channels = list(channels)
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def deliver(self, event):
+        # Runs on the subscriber's event loop
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+class InProcessBroker:
+    """Fan events out to subscribers living in this process.
+
+    publish() may be called from any thread (sync views, worker pools);
+    delivery is handed to each subscriber's own event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, set] = defaultdict(set)
+
+    def subscribe(self, channels: Iterable[str]) -> Subscription:
+        subscription = Subscription(channels)
+        with self._lock:
+            for channel in subscription.channels:
+                self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscribers.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[channel]
+
+    def publish(self, channels: Iterable[str], event: dict):
+        with self._lock:
+            targets = set()
+            for channel in channels:
+                targets.update(self._subscribers.get(channel, ()))
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # Loop already closed; the stream's cleanup will unsubscribe
+                pass
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len({s for subs in self._subscribers.values() for s in subs})
+
+
+_broker = None
+
+
+def get_broker():
+    """The configured broker (COMPLAINT_EVENT_BROKER), created on first use.
+
+    Any class with subscribe/unsubscribe/publish can be plugged in, e.g. one
+    that relays publish() through Redis to every worker process.
+    """
+    global _broker
+    if _broker is None:
+        _broker = import_string(settings.COMPLAINT_EVENT_BROKER)()
+    return _broker
+
+
+def update_event(update, citizen_id, district) -> dict:
+    return {
+        'complaint_id': update.complaint_id,
+        'old_status': update.old_status,
+        'new_status': update.new_status,
+        'comment': update.comment or '',
+        'created_at': update.created_at.isoformat() if update.created_at else None,
+        'citizen_id': citizen_id,
+        'district': district,
+    }
+
+
+def publish_updates(updates: List, complaints: Dict[int, tuple]):
+    """Publish ComplaintUpdate rows once the surrounding transaction commits.
+
+    `complaints` maps complaint id -> (citizen_id, district).
+    """
+    events = []
+    for update in updates:
+        citizen_id, district = complaints[update.complaint_id]
+        channels = [citizen_channel(citizen_id), ALL_CHANNEL]
+        if district:
+            channels.append(district_channel(district))
+        events.append((channels, update_event(update, citizen_id, district)))
+
+    def send():
+        broker = get_broker()
+        for channels, event in events:
+            broker.publish(channels, event)
+
+    transaction.on_commit(send)
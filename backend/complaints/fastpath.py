@@ -0,0 +1,58 @@
+# Complaint list rows built straight from .values(), skipping model
+# instances and per-field serializer dispatch. Output is identical to
+# ComplaintListSerializer(many=True).data.
+from rest_framework import serializers
+
+from backend.metrics import stage
+
+from .images import build_thumbnail_urls
+
+LIST_VALUES = (
+    'id', 'title', 'category', 'status', 'latitude', 'longitude', 'address',
+    'citizen__first_name', 'citizen__last_name', 'created_at', 'updated_at',
+    'assigned_officer_id', 'assigned_officer__first_name', 'assigned_officer__last_name',
+    'thumbnails',
+)
+
+# Unbound fields used only for their formatting, so decimals and datetimes
+# render exactly as the model serializer renders them
+_coordinate = serializers.DecimalField(max_digits=9, decimal_places=6)
+_datetime = serializers.DateTimeField()
+
+
+def list_values(queryset):
+    """`queryset` as dict rows carrying the list fields plus its ordering keys."""
+    ordering = [f.lstrip('-') for f in queryset.query.order_by if isinstance(f, str)]
+    return queryset.values(*dict.fromkeys(LIST_VALUES + tuple(ordering)))
+
+
+def _full_name(first, last):
+    # AbstractUser.get_full_name
+    return f'{first} {last}'.strip()
+
+
+def serialize_list_rows(rows, request=None):
+    coordinate = _coordinate.to_representation
+    datetime = _datetime.to_representation
+    with stage('serialize'):
+        data = []
+        for row in rows:
+            item = {
+                'id': row['id'],
+                'title': row['title'],
+                'category': row['category'],
+                'status': row['status'],
+                'latitude': coordinate(row['latitude']),
+                'longitude': coordinate(row['longitude']),
+                'address': row['address'],
+                'citizen_name': _full_name(row['citizen__first_name'], row['citizen__last_name']),
+                'created_at': datetime(row['created_at']),
+            }
+            # The serializer omits officer_name entirely when nobody is assigned
+            if row['assigned_officer_id'] is not None:
+                item['officer_name'] = _full_name(
+                    row['assigned_officer__first_name'], row['assigned_officer__last_name']
+                )
+            item['thumbnails'] = build_thumbnail_urls(row['thumbnails'], request)
+            data.append(item)
+    return data
@@ -0,0 +1,136 @@
+# Grid-cell spatial indexing without PostGIS
+#
+# Each complaint stores a Morton (Z-order) code of its coordinates in
+# `geo_cell`: GEO_BITS bits of latitude interleaved with GEO_BITS bits of
+# longitude. Every coarser grid cell is then a contiguous integer range, so
+# "points in these few cells" is a handful of B-tree range scans, refined
+# with an exact haversine distance.
+import math
+from typing import List, Tuple
+
+import numpy as np
+from django.db.models import Q
+
+GEO_BITS = 26
+EARTH_RADIUS_M = 6371008.8
+MAX_COVERING_CELLS = 16
+
+
+def _spread(value: int) -> int:
+    """Insert a zero bit between each of the low GEO_BITS bits of value."""
+    result = 0
+    for bit in range(GEO_BITS):
+        result |= ((value >> bit) & 1) << (2 * bit)
+    return result
+
+
+def _grid_index(lat: float, lng: float, bits: int) -> Tuple[int, int]:
+    scale = 1 << bits
+    i = min(int((lat + 90.0) / 180.0 * scale), scale - 1)
+    j = min(int((lng + 180.0) / 360.0 * scale), scale - 1)
+    return max(i, 0), max(j, 0)
+
+
+def encode_cell(lat: float, lng: float) -> int:
+    i, j = _grid_index(lat, lng, GEO_BITS)
+    return (_spread(i) << 1) | _spread(j)
+
+
+def encode_cells(lats, lngs) -> np.ndarray:
+    """Vectorised encode_cell for backfills and bulk inserts."""
+    scale = 1 << GEO_BITS
+    i = np.clip(((np.asarray(lats, dtype=np.float64) + 90.0) / 180.0 * scale).astype(np.int64), 0, scale - 1)
+    j = np.clip(((np.asarray(lngs, dtype=np.float64) + 180.0) / 360.0 * scale).astype(np.int64), 0, scale - 1)
+    codes = np.zeros(i.shape, dtype=np.int64)
+    for bit in range(GEO_BITS):
+        codes |= ((i >> bit) & 1) << (2 * bit + 1)
+        codes |= ((j >> bit) & 1) << (2 * bit)
+    return codes
+
+
+def haversine_m(lat1, lng1, lat2, lng2):
+    lat1, lng1, lat2, lng2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lng1, lat2, lng2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+def radius_bbox(lat: float, lng: float, radius_m: float) -> Tuple[float, float, float, float]:
+    """(min_lat, min_lng, max_lat, max_lng) enclosing a circle."""
+    dlat = math.degrees(radius_m / EARTH_RADIUS_M)
+    cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+    dlng = min(math.degrees(radius_m / (EARTH_RADIUS_M * cos_lat)), 180.0)
+    return (max(lat - dlat, -90.0), max(lng - dlng, -180.0),
+            min(lat + dlat, 90.0), min(lng + dlng, 180.0))
+
+
+def covering_ranges(min_lat, min_lng, max_lat, max_lng,
+                    max_cells: int = MAX_COVERING_CELLS) -> List[Tuple[int, int]]:
+    """Half-open geo_cell ranges whose union covers the bounding box.
+
+    Picks the finest grid level at which the box touches at most
+    `max_cells` cells, then merges cells with consecutive codes.
+    """
+    for bits in range(GEO_BITS, -1, -1):
+        i0, j0 = _grid_index(min_lat, min_lng, bits)
+        i1, j1 = _grid_index(max_lat, max_lng, bits)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) <= max_cells:
+            break
+
+    shift = 2 * (GEO_BITS - bits)
+    codes = sorted(
+        (_spread(i) << 1) | _spread(j)
+        for i in range(i0, i1 + 1)
+        for j in range(j0, j1 + 1)
+    )
+    ranges = []
+    for code in codes:
+        low, high = code << shift, (code + 1) << shift
+        if ranges and ranges[-1][1] == low:
+            ranges[-1] = (ranges[-1][0], high)
+        else:
+            ranges.append((low, high))
+    return ranges
+
+
+def filter_bbox(queryset, min_lat, min_lng, max_lat, max_lng):
+    """Restrict a complaint queryset to a bounding box via geo_cell ranges."""
+    cells = Q()
+    for low, high in covering_ranges(min_lat, min_lng, max_lat, max_lng):
+        cells |= Q(geo_cell__gte=low, geo_cell__lt=high)
+    return queryset.filter(
+        cells,
+        latitude__gte=min_lat, latitude__lte=max_lat,
+        longitude__gte=min_lng, longitude__lte=max_lng,
+    )
+
+
+def rank_by_distance(queryset, lat, lng, limit, radius_m=None):
+    """(id, metres) for the `limit` rows closest to a point, closest first.
+
+    Only ids and coordinates are read, so a wide box costs three columns
+    per candidate rather than whole rows.
+    """
+    rows = list(queryset.order_by().values_list('id', 'latitude', 'longitude'))
+    if not rows:
+        return []
+    ids, lats, lngs = zip(*rows)
+    distances = haversine_m(lat, lng, [float(v) for v in lats], [float(v) for v in lngs])
+    order = np.argsort(distances, kind='stable')
+    if radius_m is not None:
+        order = [i for i in order if distances[i] <= radius_m]
+    return [(ids[i], float(distances[i])) for i in order[:limit]]
+
+
+def load_ranked(queryset, ranked):
+    """Replace the ids from rank_by_distance with instances, keeping order."""
+    complaints = queryset.in_bulk([pk for pk, _ in ranked])
+    return [(complaints[pk], metres) for pk, metres in ranked if pk in complaints]
+
+
+def nearest(queryset, lat, lng, radius_m, limit):
+    """Complaints within radius_m of a point as (complaint, metres), closest first."""
+    candidates = filter_bbox(queryset, *radius_bbox(lat, lng, radius_m))
+    return load_ranked(queryset, rank_by_distance(candidates, lat, lng, limit, radius_m))
@@ -0,0 +1,122 @@
+# Off-request processing of uploaded complaint photos
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps, features
+
+from .models import Complaint
+
+logger = logging.getLogger(__name__)
+
+# Longest edge of the stored "original"; phone photos are rarely viewed larger
+MAX_IMAGE_SIZE = 1920
+THUMBNAIL_SIZES = {
+    'small': 160,
+    'medium': 480,
+    'large': 1024,
+}
+QUALITY = 80
+
+if features.check('webp'):
+    IMAGE_FORMAT, IMAGE_EXTENSION = 'WEBP', 'webp'
+else:
+    IMAGE_FORMAT, IMAGE_EXTENSION = 'JPEG', 'jpg'
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'IMAGE_PROCESSING_WORKERS', 2),
+    thread_name_prefix='complaint-image',
+)
+
+
+def _prepare(image):
+    # Apply the EXIF orientation to the pixels, then drop all metadata by
+    # never passing exif= when saving.
+    image = ImageOps.exif_transpose(image)
+    if IMAGE_FORMAT == 'JPEG' or image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGB')
+    return image
+
+
+def _encode(image, size):
+    variant = image.copy()
+    variant.thumbnail((size, size), Image.Resampling.LANCZOS)
+    buffer = BytesIO()
+    variant.save(buffer, IMAGE_FORMAT, quality=QUALITY, optimize=True)
+    return ContentFile(buffer.getvalue())
+
+
+def process_complaint_image(complaint_id):
+    """Recompress a complaint photo, strip its metadata and generate its
+    thumbnails.
+
+    Returns (bytes_before, bytes_after) for the main image, or None when
+    there is nothing to do. A photo counts as processed once it has
+    thumbnails; replacing it clears them (see complaints.transitions).
+    """
+    complaint = Complaint.objects.filter(pk=complaint_id).only('id', 'image', 'thumbnails').first()
+    if complaint is None or not complaint.image or complaint.thumbnails:
+        return None
+
+    storage = complaint.image.storage
+    original_name = complaint.image.name
+    base = os.path.splitext(original_name)[0]
+    size_before = storage.size(original_name)
+
+    with storage.open(original_name, 'rb') as f, Image.open(f) as source:
+        image = _prepare(source)
+        main_content = _encode(image, MAX_IMAGE_SIZE)
+        thumbnails = {
+            label: storage.save(f'{base}_{label}.{IMAGE_EXTENSION}', _encode(image, size))
+            for label, size in THUMBNAIL_SIZES.items()
+        }
+
+    # Always replace the upload, even when the re-encode is not smaller:
+    # the original still carries its EXIF, GPS position included
+    main_name = storage.save(f'{base}.{IMAGE_EXTENSION}', main_content)
+
+    # Update only these columns so concurrent edits to the complaint survive,
+    # and only if the photo was not replaced while this one was processed
+    updated = Complaint.objects.filter(pk=complaint_id, image=original_name).update(
+        image=main_name, thumbnails=thumbnails, updated_at=timezone.now()
+    )
+    if not updated:
+        for name in (main_name, *thumbnails.values()):
+            storage.delete(name)
+        return None
+    storage.delete(original_name)
+
+    return size_before, main_content.size
+
+
+def _run(complaint_id):
+    try:
+        process_complaint_image(complaint_id)
+    except Exception as e:
+        logger.error(f"Error processing image for complaint {complaint_id}: {e}")
+    finally:
+        connection.close()
+
+
+def schedule_image_processing(complaint):
+    """Queue a complaint's photo for processing once the row is committed."""
+    if complaint.image:
+        transaction.on_commit(lambda: _executor.submit(_run, complaint.pk))
+
+
+def thumbnail_urls(complaint, request=None):
+    return build_thumbnail_urls(complaint.thumbnails, request)
+
+
+def build_thumbnail_urls(thumbnails, request=None):
+    storage = Complaint._meta.get_field('image').storage
+    urls = {}
+    for label, name in (thumbnails or {}).items():
+        url = storage.url(name)
+        urls[label] = request.build_absolute_uri(url) if request is not None else url
+    return urls
@@ -0,0 +1,199 @@
+# Bulk ingest of complaints collected offline by field workers and kiosks
+import json
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import BooleanField
+from django.db.models.expressions import RawSQL
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from .districts import infer_district
+from .geo import encode_cells
+from .models import Complaint
+from .priority import compute_scores, keyword_signal, provisional
+from .routing import apply_workload_deltas, rebalance_district, workload_key
+from .serializers import ComplaintIngestSerializer
+
+
+class InvalidLine:
+    """Placeholder for an NDJSON line that is not valid JSON."""
+
+    def __init__(self, message):
+        self.message = message
+
+
+class NDJSONParser(BaseParser):
+    """One JSON object per line, read from the request stream line by line.
+
+    A malformed line becomes an InvalidLine so the rest of the batch can
+    still be ingested.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if stream is None:
+            return []
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        limit = settings.COMPLAINT_INGEST_MAX_ROWS
+        rows = []
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            if len(rows) >= limit:
+                raise ParseError(f'Batch exceeds {limit} rows')
+            try:
+                rows.append(json.loads(line.decode(encoding)))
+            except (UnicodeDecodeError, ValueError) as e:
+                rows.append(InvalidLine(str(e)))
+        return rows
+
+
+def _insert_scores(attrs_list):
+    """Insert-time priority for rows that did not send one.
+
+    Category and urgent keywords only, like score_new_complaint without the
+    per-row density COUNT; score_priorities refines these later.
+    """
+    categories = [attrs['category'] for attrs in attrs_list]
+    texts = [f"{attrs['title']} {attrs['description']}" for attrs in attrs_list]
+    zeros = np.zeros(len(attrs_list))
+    bands, scores = provisional(compute_scores(categories, zeros, zeros, zeros, keyword_signal(texts)))
+    return scores, bands
+
+
+def _inserted_ids(ids):
+    """Which of the rows just upserted in this transaction were inserted.
+
+    A row that hit ON CONFLICT DO UPDATE was locked by the update, so its
+    xmax is set; a freshly inserted row's is 0.
+    """
+    table = Complaint._meta.db_table
+    return set(
+        Complaint.objects
+        .filter(pk__in=ids)
+        .annotate(inserted=RawSQL(f'"{table}".xmax = 0', (), output_field=BooleanField()))
+        .filter(inserted=True)
+        .values_list('pk', flat=True)
+    )
+
+
+def ingest_complaints(citizen, rows: List) -> Dict:
+    """Validate and insert a batch of complaints for `citizen`.
+
+    Returns per-row results in input order. A row whose client_key was
+    already ingested, by an earlier request or earlier in this batch, is
+    reported as a duplicate with the existing id instead of inserted again,
+    so clients can safely retry a whole batch after a dropped connection.
+    """
+    validator = ComplaintIngestSerializer()
+    results: List[Dict] = [None] * len(rows)
+    pending = []  # (row index, validated attrs)
+    first_by_key = {}
+    repeats = []  # (row index, index of the first row with the same key)
+
+    for index, row in enumerate(rows):
+        if isinstance(row, InvalidLine):
+            results[index] = {'index': index, 'status': 'error', 'errors': {'non_field_errors': [f'Invalid JSON: {row.message}']}}
+            continue
+        try:
+            attrs = validator.run_validation(row)
+        except serializers.ValidationError as e:
+            results[index] = {'index': index, 'status': 'error', 'errors': e.detail}
+            continue
+        key = attrs.get('client_key')
+        if key is not None:
+            if key in first_by_key:
+                repeats.append((index, first_by_key[key]))
+                continue
+            first_by_key[key] = index
+        pending.append((index, attrs))
+
+    chunk_size = settings.COMPLAINT_INGEST_CHUNK_SIZE
+    keys = list(first_by_key)
+    existing = {}
+    for start in range(0, len(keys), chunk_size):
+        existing.update(
+            Complaint.objects
+            .filter(citizen=citizen, client_key__in=keys[start:start + chunk_size])
+            .values_list('client_key', 'id')
+        )
+
+    new_rows = []
+    for index, attrs in pending:
+        key = attrs.get('client_key')
+        if key in existing:
+            results[index] = {'index': index, 'status': 'duplicate', 'id': existing[key], 'client_key': key}
+        else:
+            new_rows.append((index, attrs))
+
+    routed = defaultdict(list)  # district -> ids inserted by this batch
+    for start in range(0, len(new_rows), chunk_size):
+        chunk = new_rows[start:start + chunk_size]
+        attrs_list = [attrs for _, attrs in chunk]
+        # bulk_create skips Complaint.save(), so fill in what it would
+        cells = encode_cells(
+            [float(attrs['latitude']) for attrs in attrs_list],
+            [float(attrs['longitude']) for attrs in attrs_list],
+        )
+        scores, bands = _insert_scores(attrs_list)
+
+        objs = []
+        for n, attrs in enumerate(attrs_list):
+            complaint = Complaint(citizen=citizen, geo_cell=int(cells[n]), **attrs)
+            if not complaint.district:
+                complaint.district = infer_district(complaint.latitude, complaint.longitude)
+            if 'priority' in attrs:
+                complaint.priority_manual = True
+            else:
+                complaint.priority = str(bands[n])
+                complaint.priority_score = None if np.isnan(scores[n]) else float(scores[n])
+            objs.append(complaint)
+
+        # One transaction per chunk keeps locks short; rows already
+        # committed are found by their client_key if the batch is retried.
+        # A key inserted concurrently by another request since the lookup
+        # above resolves to that row's id instead of raising.
+        with transaction.atomic():
+            Complaint.objects.bulk_create(
+                objs,
+                update_conflicts=True,
+                unique_fields=['citizen', 'client_key'],
+                update_fields=['client_key'],
+            )
+            inserted = _inserted_ids([c.pk for c in objs])
+            # bulk_create skips the signals that keep the backlog counters
+            apply_workload_deltas(Counter(
+                workload_key(c.assigned_officer_id, c.status, c.district) for c in objs if c.pk in inserted
+            ))
+
+        for (index, attrs), complaint in zip(chunk, objs):
+            if complaint.pk not in inserted:
+                results[index] = {'index': index, 'status': 'duplicate', 'id': complaint.pk, 'client_key': complaint.client_key}
+                continue
+            results[index] = {'index': index, 'status': 'created', 'id': complaint.pk}
+            if complaint.client_key:
+                results[index]['client_key'] = complaint.client_key
+            if complaint.district:
+                routed[complaint.district].append(complaint.pk)
+
+    for index, first in repeats:
+        first_result = results[first]
+        results[index] = {
+            'index': index, 'status': 'duplicate',
+            'id': first_result['id'], 'client_key': first_result['client_key'],
+        }
+
+    if settings.COMPLAINT_AUTO_ROUTING:
+        for district, complaint_ids in routed.items():
+            rebalance_district(district, complaint_ids=complaint_ids)
+
+    summary = {'created': 0, 'duplicate': 0, 'error': 0}
+    for result in results:
+        summary[result['status']] += 1
+    return {**summary, 'results': results}
@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from complaints.archive import archivable, archive_batch, archive_cutoff
+
+
+class Command(BaseCommand):
+    help = 'Move long-closed resolved/rejected complaints into the archive tables in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help='Defaults to COMPLAINT_ARCHIVE_AFTER_DAYS')
+        parser.add_argument('--batch-size', type=int)
+        parser.add_argument('--pause', type=float, default=0.0, help='Seconds to sleep between batches')
+        parser.add_argument('--limit', type=int, help='Stop after roughly this many complaints')
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        cutoff = archive_cutoff(options['days'])
+        if options['dry_run']:
+            self.stdout.write(f'{archivable(cutoff).count()} complaints last updated before {cutoff:%Y-%m-%d} would be archived')
+            return
+
+        moved = 0
+        start = time.perf_counter()
+        while options['limit'] is None or moved < options['limit']:
+            count = archive_batch(cutoff, options['batch_size'])
+            if not count:
+                break
+            moved += count
+            self.stdout.write(f'  {moved} archived')
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f'Archived {moved} complaints last updated before {cutoff:%Y-%m-%d} in {elapsed:.1f}s'
+        ))
@@ -0,0 +1,61 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+from django.utils import timezone
+
+from complaints.districts import get_district_index
+from complaints.models import Complaint
+from complaints.routing import recount_workloads
+
+
+class Command(BaseCommand):
+    help = 'Fill in Complaint.district from coordinates for rows where it is blank'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        index = get_district_index()
+        if index is None:
+            raise CommandError('No district boundaries loaded; check DISTRICT_BOUNDARIES_FILE')
+
+        blank = Complaint.objects.filter(Q(district__isnull=True) | Q(district=''))
+        filled = 0
+        unmatched = 0
+        last_id = 0
+        while True:
+            batch = list(
+                blank.filter(id__gt=last_id)
+                .order_by('id')
+                .values_list('id', 'latitude', 'longitude')[:options['batch_size']]
+            )
+            if not batch:
+                break
+            last_id = batch[-1][0]
+
+            by_district = defaultdict(list)
+            for complaint_id, lat, lng in batch:
+                district = index.lookup(float(lat), float(lng))
+                if district:
+                    by_district[district].append(complaint_id)
+                else:
+                    unmatched += 1
+
+            # One UPDATE per district per batch
+            for district, ids in by_district.items():
+                if not options['dry_run']:
+                    Complaint.objects.filter(id__in=ids).update(
+                        district=district, updated_at=timezone.now()
+                    )
+                filled += len(ids)
+
+        if filled and not options['dry_run']:
+            # Unassigned open complaints now count towards their district's backlog
+            recount_workloads()
+
+        verb = 'Would fill' if options['dry_run'] else 'Filled'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {filled} districts; {unmatched} complaints fall outside every boundary'
+        ))
@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from complaints.models import Complaint
+from complaints.views import ComplaintViewSet
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Time the bulk_update endpoint on N complaints (changes are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=1000)
+        parser.add_argument('--status', default='in_progress')
+
+    def handle(self, *args, **options):
+        officer = User.objects.filter(role='officer').first()
+        if officer is None:
+            raise CommandError('Need at least one officer')
+
+        ids = list(
+            Complaint.objects.exclude(status=options['status'])
+            .values_list('id', flat=True)[:options['count']]
+        )
+        if not ids:
+            raise CommandError('No complaints to update')
+
+        request = APIRequestFactory().post(
+            '/api/complaints/v2/bulk_update/',
+            {'ids': ids, 'status': options['status'], 'officer_notes': 'Bulk benchmark'},
+            format='json',
+        )
+        force_authenticate(request, user=officer)
+        view = ComplaintViewSet.as_view({'post': 'bulk_update'})
+
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = view(request)
+                elapsed = (time.perf_counter() - start) * 1000
+            transaction.set_rollback(True)
+
+        if response.status_code != 200:
+            raise CommandError(f'bulk_update failed: {response.data}')
+        self.stdout.write(
+            f"{response.data['updated']} complaints updated in {elapsed:.1f} ms "
+            f"using {len(queries)} queries (rolled back)"
+        )
@@ -0,0 +1,50 @@
+import random
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from complaints.districts import get_district_index
+
+
+class Command(BaseCommand):
+    help = 'Time point-in-polygon district lookups'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lookups', type=int, default=100000)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        index = get_district_index()
+        load_ms = (time.perf_counter() - start) * 1000
+        if index is None:
+            raise CommandError('No district boundaries loaded; check DISTRICT_BOUNDARIES_FILE')
+
+        edges = sum(p.x1.size for p in index.polygons)
+        self.stdout.write(
+            f'{len(index.polygons)} polygons, {edges} edges, {len(index.grid)} grid cells, '
+            f'loaded in {load_ms:.0f} ms'
+        )
+
+        min_x = min(p.bbox[0] for p in index.polygons)
+        min_y = min(p.bbox[1] for p in index.polygons)
+        max_x = max(p.bbox[2] for p in index.polygons)
+        max_y = max(p.bbox[3] for p in index.polygons)
+        rng = random.Random(options['seed'])
+        points = [
+            (rng.uniform(min_y, max_y), rng.uniform(min_x, max_x))
+            for _ in range(options['lookups'])
+        ]
+
+        timings = np.empty(len(points))
+        matched = 0
+        for n, (lat, lng) in enumerate(points):
+            start = time.perf_counter()
+            matched += index.lookup(lat, lng) is not None
+            timings[n] = (time.perf_counter() - start) * 1e6
+
+        p50, p99, worst = np.percentile(timings, [50, 99, 100])
+        self.stdout.write(
+            f'{len(points)} lookups, {matched} matched: p50 {p50:.1f} us  p99 {p99:.1f} us  max {worst:.1f} us'
+        )
@@ -0,0 +1,74 @@
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from complaints.models import Complaint
+from complaints.views import ComplaintViewSet
+from users.models import User
+
+CATEGORIES = [code for code, _ in Complaint.CATEGORY_CHOICES]
+
+
+class Command(BaseCommand):
+    help = 'Time the bulk ingest endpoint on an NDJSON batch, then retry it (changes are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--invalid', type=float, default=0.01, help='Fraction of rows with errors')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        citizen = User.objects.filter(role='citizen').first()
+        if citizen is None:
+            raise CommandError('Need at least one citizen')
+
+        rng = random.Random(options['seed'])
+        lines = []
+        for n in range(options['rows']):
+            row = {
+                'client_key': f'bench-{options["seed"]}-{n}',
+                'title': f'Benchmark complaint {n}',
+                'description': rng.choice([
+                    'Water supply has been irregular for a week',
+                    'Streetlight not working near the market',
+                    'सड़क पर बड़ा गड्ढा है, दुर्घटना का खतरा',
+                    'Garbage not collected for days',
+                ]),
+                'category': rng.choice(CATEGORIES),
+                'latitude': round(rng.uniform(17.8, 24.1), 6),
+                'longitude': round(rng.uniform(80.2, 84.4), 6),
+                'address': f'Ward {rng.randint(1, 70)}',
+            }
+            if rng.random() < options['invalid']:
+                row['category'] = 'unknown'
+            lines.append(json.dumps(row, ensure_ascii=False))
+        body = ('\n'.join(lines) + '\n').encode()
+
+        view = ComplaintViewSet.as_view({'post': 'ingest'})
+        factory = APIRequestFactory()
+
+        with transaction.atomic():
+            for label in ('first run', 'retry'):
+                request = factory.post(
+                    '/api/complaints/v2/ingest/', body, content_type='application/x-ndjson'
+                )
+                force_authenticate(request, user=citizen)
+                with CaptureQueriesContext(connection) as queries:
+                    start = time.perf_counter()
+                    response = view(request)
+                    elapsed = time.perf_counter() - start
+                if response.status_code not in (200, 201):
+                    raise CommandError(f'ingest failed: {response.data}')
+                data = response.data
+                self.stdout.write(
+                    f"{label}: {options['rows']} rows in {elapsed * 1000:.0f} ms "
+                    f"({options['rows'] / elapsed:,.0f} rows/s, {len(queries)} queries) - "
+                    f"created {data['created']}, duplicate {data['duplicate']}, error {data['error']}"
+                )
+            transaction.set_rollback(True)
+        self.stdout.write('Rolled back')
@@ -0,0 +1,59 @@
+import random
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max, Min
+
+from complaints.geo import nearest, radius_bbox
+from complaints.models import Complaint
+
+
+class Command(BaseCommand):
+    help = 'Time radius queries through geo_cell ranges against a plain lat/lng box filter'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--radius', type=float, nargs='+', default=[500, 2000, 10000])
+        parser.add_argument('--queries', type=int, default=50)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        extent = Complaint.objects.aggregate(
+            min_lat=Min('latitude'), max_lat=Max('latitude'),
+            min_lng=Min('longitude'), max_lng=Max('longitude'),
+        )
+        if extent['min_lat'] is None:
+            raise CommandError('No complaints to query')
+
+        total = Complaint.objects.count()
+        self.stdout.write(f'{total} complaints')
+        self.stdout.write(f"{'radius m':>9} {'cells p50 ms':>13} {'cells p95 ms':>13} {'box p50 ms':>11} {'hits':>7}")
+
+        rng = random.Random(options['seed'])
+        points = [
+            (rng.uniform(float(extent['min_lat']), float(extent['max_lat'])),
+             rng.uniform(float(extent['min_lng']), float(extent['max_lng'])))
+            for _ in range(options['queries'])
+        ]
+        queryset = Complaint.objects.all()
+
+        for radius in options['radius']:
+            cell_times, box_times, hits = [], [], []
+            for lat, lng in points:
+                start = time.perf_counter()
+                hits.append(len(nearest(queryset, lat, lng, radius, limit=10 ** 6)))
+                cell_times.append((time.perf_counter() - start) * 1000)
+
+                min_lat, min_lng, max_lat, max_lng = radius_bbox(lat, lng, radius)
+                start = time.perf_counter()
+                list(queryset.filter(
+                    latitude__gte=min_lat, latitude__lte=max_lat,
+                    longitude__gte=min_lng, longitude__lte=max_lng,
+                ).order_by())
+                box_times.append((time.perf_counter() - start) * 1000)
+
+            self.stdout.write(
+                f'{radius:>9.0f} {np.percentile(cell_times, 50):>13.2f} '
+                f'{np.percentile(cell_times, 95):>13.2f} {np.percentile(box_times, 50):>11.2f} '
+                f'{np.mean(hits):>7.1f}'
+            )
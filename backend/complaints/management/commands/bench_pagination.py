@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from complaints.models import Complaint
+from complaints.pagination import ComplaintCursorPagination, keyset_filter
+
+
+class Command(BaseCommand):
+    help = 'Compare keyset and OFFSET page fetch latency at increasing depths'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-size', type=int, default=ComplaintCursorPagination.page_size)
+        parser.add_argument('--depths', type=int, nargs='+', default=[0, 1000, 10000, 100000, 1000000])
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        page_size = options['page_size']
+        repeat = options['repeat']
+        ordering = list(ComplaintCursorPagination.default_ordering)
+        queryset = Complaint.objects.order_by(*ordering)
+        total = queryset.count()
+        self.stdout.write(f'{total} complaints, page size {page_size}')
+        self.stdout.write(f"{'depth':>10} {'keyset ms':>12} {'offset ms':>12}")
+
+        for depth in options['depths']:
+            if depth >= total:
+                continue
+            anchor = queryset.values_list('created_at', 'id')[depth]
+
+            keyset_ms = self._time(
+                lambda: list(queryset.filter(keyset_filter(ordering, list(anchor)))[:page_size]),
+                repeat,
+            )
+            offset_ms = self._time(
+                lambda: list(queryset[depth + 1:depth + 1 + page_size]),
+                repeat,
+            )
+            self.stdout.write(f'{depth:>10} {keyset_ms:>12.2f} {offset_ms:>12.2f}')
+
+    def _time(self, fn, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best
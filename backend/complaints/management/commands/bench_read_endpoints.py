@@ -0,0 +1,85 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+# (name, sync path under gunicorn/WSGI, async path under uvicorn/ASGI)
+ENDPOINTS = [
+    ('complaint list', '/api/complaints/v2/', '/api/complaints/async/'),
+    ('complaint detail', '/api/complaints/v2/{id}/', '/api/complaints/async/{id}/'),
+    ('dashboard stats', '/api/analytics/dashboard_stats/', '/api/analytics/async/dashboard_stats/'),
+    ('heatmap', '/api/analytics/heatmap_data/', '/api/analytics/async/heatmap_data/'),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-test the sync (WSGI) and async (ASGI) read endpoints against running servers, '
+        'e.g. gunicorn on :8000 and uvicorn on :8001, and compare throughput and tail latency'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sync-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--async-url', default='http://127.0.0.1:8001')
+        parser.add_argument('--username', required=True)
+        parser.add_argument('--password', required=True)
+        parser.add_argument('--concurrency', type=int, nargs='+', default=[8, 32, 128])
+        parser.add_argument('--requests', type=int, default=500, help='Requests per endpoint per level')
+        parser.add_argument('--timeout', type=float, default=30.0)
+
+    def handle(self, *args, **options):
+        login = requests.post(
+            f"{options['sync_url']}/api/users/login/",
+            json={'username': options['username'], 'password': options['password']},
+            timeout=options['timeout'],
+        )
+        if login.status_code != 200:
+            raise CommandError(f'Login failed: {login.status_code} {login.text[:200]}')
+        headers = {'Authorization': f"Bearer {login.json()['access']}"}
+
+        first = requests.get(f"{options['sync_url']}/api/complaints/v2/", headers=headers, timeout=options['timeout'])
+        results = first.json().get('results') or []
+        if not results:
+            raise CommandError('No complaints visible to this user')
+        complaint_id = results[0]['id']
+
+        self.stdout.write(f"{'endpoint':<18} {'server':<6} {'conc':>5} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'errors':>6}")
+        for concurrency in options['concurrency']:
+            for name, sync_path, async_path in ENDPOINTS:
+                for server, base, path in (
+                    ('sync', options['sync_url'], sync_path),
+                    ('async', options['async_url'], async_path),
+                ):
+                    url = base + path.format(id=complaint_id)
+                    rps, latencies, errors = self.run(url, headers, concurrency, options)
+                    p50, p95, p99, worst = np.percentile(latencies, [50, 95, 99, 100]) if latencies.size else (0, 0, 0, 0)
+                    self.stdout.write(
+                        f'{name:<18} {server:<6} {concurrency:>5} {rps:>8.0f} '
+                        f'{p50:>6.0f}ms {p95:>6.0f}ms {p99:>6.0f}ms {worst:>6.0f}ms {errors:>6}'
+                    )
+
+    def run(self, url, headers, concurrency, options):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        def one(_):
+            start = time.perf_counter()
+            try:
+                ok = session.get(url, headers=headers, timeout=options['timeout']).status_code == 200
+            except requests.RequestException:
+                ok = False
+            return (time.perf_counter() - start) * 1000, ok
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            outcomes = list(pool.map(one, range(options['requests'])))
+        elapsed = time.perf_counter() - start
+        session.close()
+
+        latencies = np.array([ms for ms, ok in outcomes if ok])
+        errors = sum(1 for _, ok in outcomes if not ok)
+        return len(outcomes) / elapsed, latencies, errors
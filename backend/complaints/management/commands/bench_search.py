@@ -0,0 +1,51 @@
+import operator
+import time
+from functools import reduce
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from complaints.models import Complaint
+from complaints.search import search_complaints
+
+DEFAULT_QUERIES = ['water leakage', 'street light', 'सड़क गड्ढा', 'garbage not collected', 'strret lihgt']
+
+
+class Command(BaseCommand):
+    help = 'Compare ILIKE (SearchFilter) and full-text complaint search latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--queries', nargs='+', default=DEFAULT_QUERIES)
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        limit = options['limit']
+        repeat = options['repeat']
+        self.stdout.write(f'{Complaint.objects.count()} complaints, first {limit} results')
+        self.stdout.write(f"{'query':<28} {'ilike ms':>10} {'fts ms':>10} {'fts hits':>9}")
+
+        for text in options['queries']:
+            ilike = Complaint.objects.filter(self._ilike(text)).order_by('-created_at')
+            fts = search_complaints(Complaint.objects.all(), text)
+
+            ilike_ms = self._time(lambda: list(ilike[:limit]), repeat)
+            fts_ms = self._time(lambda: list(fts[:limit]), repeat)
+            hits = len(fts[:limit])
+            self.stdout.write(f'{text:<28} {ilike_ms:>10.2f} {fts_ms:>10.2f} {hits:>9}')
+
+    def _ilike(self, text):
+        # Same predicate SearchFilter builds: every term must match some field
+        return reduce(operator.and_, [
+            Q(title__icontains=term) | Q(description__icontains=term) | Q(address__icontains=term)
+            for term in text.split()
+        ])
+
+    def _time(self, fn, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best
@@ -0,0 +1,81 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from analytics.stats import heatmap_point, heatmap_queryset
+from backend.renderers import ORJSONRenderer
+from complaints.fastpath import list_values, serialize_list_rows
+from complaints.models import Complaint
+from complaints.pagination import ComplaintCursorPagination
+from complaints.serializers import ComplaintListSerializer
+
+
+class Command(BaseCommand):
+    help = 'Compare model-serializer and fast-path rendering of list and heatmap rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        repeat = options['repeat']
+        request = Request(APIRequestFactory().get('/api/complaints/'))
+        ordering = ComplaintCursorPagination.default_ordering
+        queryset = Complaint.objects.select_related('citizen', 'assigned_officer').order_by(*ordering)
+
+        def list_before():
+            data = ComplaintListSerializer(queryset[:rows], many=True, context={'request': request}).data
+            return JSONRenderer().render({'results': data})
+
+        def list_after():
+            data = serialize_list_rows(list_values(queryset)[:rows], request)
+            return ORJSONRenderer().render({'results': data})
+
+        def heatmap_before():
+            # The original loop: full model instances, one dict per row
+            data = [
+                {
+                    'lat': float(c.latitude),
+                    'lng': float(c.longitude),
+                    'intensity': 1,
+                    'category': c.category,
+                    'status': c.status,
+                }
+                for c in Complaint.objects.all()[:rows]
+            ]
+            return JSONRenderer().render({'data': data, 'total_points': len(data)})
+
+        def heatmap_after():
+            data = [heatmap_point(row) for row in heatmap_queryset()[:rows]]
+            return ORJSONRenderer().render({'data': data, 'total_points': len(data)})
+
+        count = min(rows, Complaint.objects.count())
+        if not count:
+            raise CommandError('No complaints to serialize')
+        self.stdout.write(f'{count} rows, best of {repeat}')
+        self.stdout.write(f"{'endpoint':>10} {'before rows/s':>14} {'after rows/s':>14} {'speedup':>8}")
+
+        for name, before, after in (
+            ('list', list_before, list_after),
+            ('heatmap', heatmap_before, heatmap_after),
+        ):
+            if before() != after():
+                raise CommandError(f'{name}: fast path output differs from the serializer output')
+            before_s = self._time(before, repeat)
+            after_s = self._time(after, repeat)
+            self.stdout.write(
+                f'{name:>10} {count / before_s:>14.0f} {count / after_s:>14.0f} {before_s / after_s:>7.1f}x'
+            )
+
+    def _time(self, fn, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
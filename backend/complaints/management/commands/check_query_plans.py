@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from complaints.models import Complaint
+
+SEQ_SCAN = 'Seq Scan on complaints_complaint'
+
+
+class Command(BaseCommand):
+    help = (
+        'EXPLAIN the hot complaint queries and fail if any of them sequentially '
+        'scans complaints_complaint. Run against a seeded, ANALYZEd database; '
+        'on small tables PostgreSQL rightly prefers a sequential scan.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--min-rows', type=int, default=100000)
+        parser.add_argument('--verbose-plans', action='store_true')
+
+    def handle(self, *args, **options):
+        total = Complaint.objects.count()
+        if total < options['min_rows']:
+            raise CommandError(
+                f'Only {total} complaints; seed at least {options["min_rows"]} before checking plans'
+            )
+
+        failures = []
+        for name, queryset in self.hot_queries():
+            plan = queryset.explain()
+            uses_seq_scan = SEQ_SCAN in plan
+            self.stdout.write(f"{'SEQ SCAN' if uses_seq_scan else 'ok':<9} {name}")
+            if options['verbose_plans'] or uses_seq_scan:
+                self.stdout.write(plan)
+            if uses_seq_scan:
+                failures.append(name)
+
+        if failures:
+            raise CommandError(f'Sequential scan in: {", ".join(failures)}')
+
+    def hot_queries(self):
+        # Representative values taken from the data itself
+        sample = Complaint.objects.exclude(district__isnull=True).exclude(
+            assigned_officer__isnull=True
+        ).values('citizen_id', 'district', 'assigned_officer_id', 'category').first()
+        if sample is None:
+            raise CommandError('Need at least one assigned complaint with a district')
+
+        page = 20
+        newest = ('-created_at', '-id')
+        week_ago = timezone.now() - timedelta(days=7)
+
+        return [
+            ('citizen list', Complaint.objects.filter(
+                citizen_id=sample['citizen_id']).order_by(*newest)[:page]),
+            ('district + status list', Complaint.objects.filter(
+                district=sample['district'], status='pending').order_by('-created_at')[:page]),
+            ('assigned officer + status', Complaint.objects.filter(
+                assigned_officer_id=sample['assigned_officer_id'], status='in_progress')),
+            ('open backlog', Complaint.objects.filter(
+                status__in=['pending', 'in_progress']).order_by(*newest)[:page]),
+            ('heatmap', Complaint.objects.filter(
+                category=sample['category'], status='pending').values('latitude', 'longitude')),
+            ('daily counts', Complaint.objects.filter(
+                created_at__gte=week_ago).values('id')),
+            ('status count', Complaint.objects.filter(status='rejected').values('id')),
+        ]
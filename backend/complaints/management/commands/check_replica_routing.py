@@ -0,0 +1,78 @@
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from analytics.views import AnalyticsViewSet
+from backend.caching import cache_is_shared
+from backend.replicas import ReplicaPinMiddleware, pin_key, replica_aliases
+from complaints.models import Complaint
+from complaints.views import ComplaintViewSet
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        'Show which database alias serves each endpoint, before and after a write. '
+        'Locally, set PSQL_REPLICA_HOSTS=localhost to get a second alias on the same server.'
+    )
+
+    def handle(self, *args, **options):
+        if not replica_aliases():
+            raise CommandError('No replica aliases configured; set PSQL_REPLICA_HOSTS')
+        if not cache_is_shared():
+            raise CommandError('Replica reads need a shared cache for pins; set REDIS_URL')
+        officer = User.objects.filter(role='officer').first()
+        complaint = Complaint.objects.first()
+        if officer is None or complaint is None:
+            raise CommandError('Need at least one officer and one complaint')
+
+        factory = APIRequestFactory()
+        endpoints = [
+            ('GET complaint list', 'get', '/api/complaints/v2/', ComplaintViewSet.as_view({'get': 'list'}), {}),
+            ('GET complaint detail', 'get', f'/api/complaints/v2/{complaint.pk}/',
+             ComplaintViewSet.as_view({'get': 'retrieve'}), {'pk': complaint.pk}),
+            ('GET dashboard stats', 'get', '/api/analytics/dashboard_stats/',
+             AnalyticsViewSet.as_view({'get': 'dashboard_stats'}), {}),
+        ]
+
+        def call(method, path, view, kwargs, data=None):
+            if method == 'get':
+                request = factory.get(path)
+            else:
+                request = getattr(factory, method)(path, data, format='json')
+            force_authenticate(request, user=officer)
+            # Run the pinning middleware around the view as the stack would
+            middleware = ReplicaPinMiddleware(lambda req: view(req, **kwargs))
+            with ExitStack() as stack:
+                captures = {
+                    alias: stack.enter_context(CaptureQueriesContext(connections[alias]))
+                    for alias in settings.DATABASES
+                }
+                response = middleware(request)
+            used = {alias: len(c) for alias, c in captures.items() if len(c)}
+            return response, used
+
+        def report(label):
+            self.stdout.write(label)
+            for name, method, path, view, kwargs in endpoints:
+                response, used = call(method, path, view, kwargs)
+                self.stdout.write(f'  {name:<22} {response.status_code}  queries per alias: {used}')
+
+        cache.delete(pin_key(officer.pk))
+        report('Before any write:')
+
+        with transaction.atomic():
+            response, used = call(
+                'patch', f'/api/complaints/v2/{complaint.pk}/',
+                ComplaintViewSet.as_view({'patch': 'partial_update'}), {'pk': complaint.pk},
+                {'officer_notes': complaint.officer_notes or '', 'version': complaint.version},
+            )
+            self.stdout.write(f'PATCH complaint -> {response.status_code}, queries per alias: {used}')
+            report(f'Within {settings.REPLICA_PIN_SECONDS}s of that write:')
+            transaction.set_rollback(True)
+        cache.delete(pin_key(officer.pk))
@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+
+from complaints.images import THUMBNAIL_SIZES, process_complaint_image
+from complaints.models import Complaint
+
+
+class Command(BaseCommand):
+    help = 'Recompress existing complaint photos, build thumbnails and report savings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, help='Process at most this many complaints')
+
+    def handle(self, *args, **options):
+        pending = (
+            Complaint.objects
+            .exclude(image='').exclude(image__isnull=True)
+            .filter(thumbnails={})
+            .values_list('id', flat=True)
+            .order_by('id')
+        )
+        if options['limit']:
+            pending = pending[:options['limit']]
+
+        processed_ids = []
+        before_total = 0
+        after_total = 0
+        for complaint_id in list(pending):
+            try:
+                sizes = process_complaint_image(complaint_id)
+            except Exception as e:
+                self.stderr.write(f'Complaint {complaint_id}: {e}')
+                continue
+            if sizes is None:
+                continue
+            processed_ids.append(complaint_id)
+            before_total += sizes[0]
+            after_total += sizes[1]
+
+        processed = len(processed_ids)
+        if not processed:
+            self.stdout.write('No images to process')
+            return
+
+        saved = before_total - after_total
+        self.stdout.write(
+            f'{processed} images: {before_total / 1e6:.1f} MB -> {after_total / 1e6:.1f} MB '
+            f'({100 * saved / before_total:.0f}% storage saved)'
+        )
+        # List views now load the small thumbnail instead of the original
+        small = Complaint.objects.filter(
+            id__in=processed_ids
+        ).values_list('thumbnails', flat=True)
+        storage = Complaint._meta.get_field('image').storage
+        thumb_total = sum(storage.size(t['small']) for t in small if 'small' in t)
+        self.stdout.write(
+            f"List view bytes per page of 20: {20 * before_total / processed / 1e3:.0f} KB -> "
+            f"{20 * thumb_total / processed / 1e3:.0f} KB ({THUMBNAIL_SIZES['small']}px thumbnails)"
+        )
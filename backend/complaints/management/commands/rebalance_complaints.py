@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from complaints.models import Complaint
+from complaints.routing import OPEN_STATUSES, rebalance_district, recount_workloads
+
+
+class Command(BaseCommand):
+    help = 'Assign open, unassigned complaints to the least-loaded officers in each district'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--district', action='append', help='Limit to these districts')
+        parser.add_argument('--recount', action='store_true', help='Rebuild workload counters first')
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        if options['recount']:
+            recount_workloads()
+            self.stdout.write('Workload counters rebuilt')
+
+        districts = options['district'] or (
+            Complaint.objects
+            .filter(status__in=OPEN_STATUSES, assigned_officer__isnull=True)
+            .exclude(district__isnull=True).exclude(district='')
+            .values_list('district', flat=True)
+            .distinct()
+        )
+
+        total = 0
+        for district in districts:
+            assigned = rebalance_district(district, dry_run=options['dry_run'])
+            count = sum(assigned.values())
+            total += count
+            if count:
+                self.stdout.write(f'{district}: {count} complaints across {len(assigned)} officers')
+
+        verb = 'Would assign' if options['dry_run'] else 'Assigned'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {total} complaints'))
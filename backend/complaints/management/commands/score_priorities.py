@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from complaints.priority import score_open_backlog
+
+
+class Command(BaseCommand):
+    help = 'Re-score the priority of every open complaint in one batch'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        changed = score_open_backlog(dry_run=options['dry_run'])
+        elapsed = time.perf_counter() - start
+
+        for priority, count in sorted(changed.items()):
+            self.stdout.write(f'{priority:<9} {count}')
+        verb = 'Would change' if options['dry_run'] else 'Changed'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {sum(changed.values())} priorities in {elapsed:.2f}s'
+        ))
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from complaints.synthetic import DISTRICTS, seed
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Bulk-insert synthetic citizens, officers, complaints and status updates across Chhattisgarh'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--complaints', type=int, default=10000)
+        parser.add_argument('--citizens', type=int, default=None, help='Default: one per 10 complaints')
+        parser.add_argument('--officers', type=int, default=None, help='Default: 3 per district on the first run')
+        parser.add_argument('--days', type=int, default=365, help='Spread complaint dates over this many days')
+        parser.add_argument('--seed', type=int, default=None, help='Random seed for a reproducible dataset')
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        complaints = options['complaints']
+        citizens = options['citizens']
+        if citizens is None:
+            citizens = max(1, complaints // 10) if complaints else 0
+        officers = options['officers']
+        if officers is None:
+            officers = 0 if User.objects.filter(role='officer').exists() else 3 * len(DISTRICTS)
+
+        start = time.perf_counter()
+        try:
+            created = seed(
+                citizens=citizens, officers=officers, complaints=complaints,
+                days=options['days'], seed=options['seed'], batch_size=options['batch_size'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {created['citizens']} citizens, {created['officers']} officers, "
+            f"{created['complaints']} complaints and {created['updates']} updates in {elapsed:.1f} s "
+            f"({created['complaints'] / elapsed:.0f} complaints/s)"
+        ))
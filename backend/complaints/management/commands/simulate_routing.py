@@ -0,0 +1,57 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from complaints.models import Complaint
+from complaints.routing import choose_officer
+
+
+class Command(BaseCommand):
+    help = 'Simulate routing a synthetic complaint stream and compare with random assignment'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--officers', type=int, default=40)
+        parser.add_argument('--complaints', type=int, default=100000)
+        parser.add_argument('--resolve-rate', type=float, default=0.3,
+                            help='Chance an officer closes one open complaint per step')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        categories = [c for c, _ in Complaint.CATEGORY_CHOICES]
+        # Skewed category mix, as in real complaint traffic
+        weights = [30, 15, 20, 12, 8, 7, 6, 2]
+        officers = [
+            (officer_id, rng.sample(categories, k=rng.randint(0, 2)))
+            for officer_id in range(1, options['officers'] + 1)
+        ]
+        stream = rng.choices(categories, weights=weights, k=options['complaints'])
+
+        for name, pick in (('balanced', self._balanced), ('random', self._random)):
+            loads = {officer_id: 0 for officer_id, _ in officers}
+            sim_rng = random.Random(options['seed'])
+            start = time.perf_counter()
+            for category in stream:
+                officer_id = pick(officers, loads, category, sim_rng)
+                loads[officer_id] += 1
+                # Officers work through their queues at random
+                if sim_rng.random() < options['resolve_rate']:
+                    busy = sim_rng.choice(officers)[0]
+                    loads[busy] = max(0, loads[busy] - 1)
+            elapsed = time.perf_counter() - start
+
+            values = list(loads.values())
+            self.stdout.write(
+                f'{name:<9} max open {max(values):>6}  stdev {statistics.pstdev(values):>8.1f}  '
+                f'{elapsed / len(stream) * 1e6:.1f} us/assignment'
+            )
+
+    def _balanced(self, officers, loads, category, rng):
+        return choose_officer(
+            [(officer_id, loads[officer_id], cats) for officer_id, cats in officers], category
+        )
+
+    def _random(self, officers, loads, category, rng):
+        return rng.choice(officers)[0]
@@ -0,0 +1,76 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Open many idle event streams against a running ASGI server and hold them'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000/api/complaints/events/')
+        parser.add_argument('--connections', type=int, default=2000)
+        parser.add_argument('--hold', type=int, default=60, help='Seconds to keep streams open')
+        parser.add_argument('--username', help='User to stream as (default: first citizen)')
+
+    def handle(self, *args, **options):
+        users = User.objects.all()
+        user = (users.filter(username=options['username']) if options['username']
+                else users.filter(role='citizen')).first()
+        if user is None:
+            raise CommandError('No user to authenticate as')
+        token = str(AccessToken.for_user(user))
+        asyncio.run(self.run(options, token))
+
+    async def run(self, options, token):
+        url = urlsplit(options['url'])
+        path = f'{url.path}?token={token}'
+        request = (
+            f'GET {path} HTTP/1.1\r\nHost: {url.netloc}\r\n'
+            f'Accept: text/event-stream\r\n\r\n'
+        ).encode()
+
+        async def open_stream():
+            reader, writer = await asyncio.open_connection(url.hostname, url.port or 80)
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            if b' 200 ' not in status_line:
+                writer.close()
+                raise ConnectionError(status_line.decode().strip())
+            return reader, writer
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *[open_stream() for _ in range(options['connections'])],
+            return_exceptions=True,
+        )
+        streams = [r for r in results if not isinstance(r, BaseException)]
+        failures = [r for r in results if isinstance(r, BaseException)]
+        self.stdout.write(
+            f'{len(streams)} streams open, {len(failures)} failed '
+            f'in {time.perf_counter() - start:.1f}s'
+        )
+        if failures:
+            self.stdout.write(f'first failure: {failures[0]!r}')
+
+        # Drain keep-alives while holding, and count streams the server dropped
+        async def hold(reader):
+            deadline = time.monotonic() + options['hold']
+            while time.monotonic() < deadline:
+                try:
+                    chunk = await asyncio.wait_for(reader.read(1024), timeout=deadline - time.monotonic())
+                except asyncio.TimeoutError:
+                    return True
+                if not chunk:
+                    return False
+            return True
+
+        alive = await asyncio.gather(*[hold(reader) for reader, _ in streams])
+        for _, writer in streams:
+            writer.close()
+        self.stdout.write(f'{sum(alive)} of {len(streams)} streams still open after {options["hold"]}s')
@@ -0,0 +1,88 @@
+import random
+import threading
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from complaints.models import Complaint, ComplaintUpdate
+from complaints.transitions import ALLOWED_TRANSITIONS, TransitionConflict, apply_changes
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Race concurrent officers through status transitions on one complaint and check for lost updates'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=16)
+        parser.add_argument('--attempts', type=int, default=200, help='Attempts per thread')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        officers = list(User.objects.filter(role='officer')[:options['threads']])
+        citizen = User.objects.filter(role='citizen').first()
+        if not officers or citizen is None:
+            raise CommandError('Need at least one officer and one citizen')
+
+        complaint = Complaint.objects.create(
+            title='Concurrency stress test', description='Temporary', category='other',
+            latitude=21.25, longitude=81.63, citizen=citizen,
+        )
+        outcomes = Counter()
+        lock = threading.Lock()
+        barrier = threading.Barrier(options['threads'])
+
+        def worker(n):
+            rng = random.Random(options['seed'] + n)
+            officer = officers[n % len(officers)]
+            barrier.wait()
+            try:
+                for _ in range(options['attempts']):
+                    # Read, decide, then write - the classic lost-update window
+                    current = Complaint.objects.get(pk=complaint.pk)
+                    new_status = rng.choice(sorted(ALLOWED_TRANSITIONS[current.status]))
+                    try:
+                        apply_changes(current, {'status': new_status}, officer)
+                        result = 'applied'
+                    except TransitionConflict:
+                        result = 'conflict'
+                    with lock:
+                        outcomes[result] += 1
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(options['threads'])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        try:
+            final = Complaint.objects.get(pk=complaint.pk)
+            history = list(
+                ComplaintUpdate.objects.filter(complaint=complaint)
+                .order_by('id').values_list('old_status', 'new_status')
+            )
+            # Every applied write bumped the version exactly once, has an
+            # audit row, and each audit row starts where the previous ended
+            chained = all(history[i][0] == history[i - 1][1] for i in range(1, len(history)))
+            chained = chained and (not history or history[0][0] == 'pending')
+            chained = chained and (not history or history[-1][1] == final.status)
+            ok = final.version == outcomes['applied'] == len(history) and chained
+
+            attempts = sum(outcomes.values())
+            self.stdout.write(
+                f"{attempts} attempts from {options['threads']} threads in {elapsed:.2f}s "
+                f"({attempts / elapsed:,.0f}/s): {outcomes['applied']} applied, "
+                f"{outcomes['conflict']} conflicts; final version {final.version}, "
+                f"{len(history)} audit rows"
+            )
+        finally:
+            complaint.delete()
+
+        if not ok:
+            raise CommandError('Lost or duplicated updates detected')
+        self.stdout.write(self.style.SUCCESS('No lost updates'))
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0003_complaintupdate_complaint_district_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="complaint",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="complaint_created_id_idx"
+            ),
+        ),
+    ]
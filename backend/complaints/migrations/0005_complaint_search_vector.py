@@ -0,0 +1,67 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:07
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.conf import settings
+from django.db import migrations
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE FUNCTION complaints_complaint_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(NEW.address, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER complaints_complaint_search_vector_trigger
+BEFORE INSERT OR UPDATE OF title, description, address, search_vector
+ON complaints_complaint
+FOR EACH ROW EXECUTE FUNCTION complaints_complaint_search_vector_update();
+
+UPDATE complaints_complaint SET search_vector = NULL;
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER = """
+DROP TRIGGER IF EXISTS complaints_complaint_search_vector_trigger ON complaints_complaint;
+DROP FUNCTION IF EXISTS complaints_complaint_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0004_complaint_created_id_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="complaint",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="complaint",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="complaint_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="complaint",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"],
+                name="complaint_title_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER, DROP_SEARCH_VECTOR_TRIGGER),
+    ]
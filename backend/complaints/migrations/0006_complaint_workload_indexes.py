@@ -0,0 +1,52 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0005_complaint_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="complaint",
+            index=models.Index(
+                fields=["citizen", "-created_at", "-id"],
+                name="complaint_citizen_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="complaint",
+            index=models.Index(
+                fields=["district", "status", "-created_at"],
+                name="complaint_district_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="complaint",
+            index=models.Index(
+                fields=["assigned_officer", "status"],
+                name="complaint_officer_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="complaint",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "in_progress"])),
+                fields=["-created_at", "-id"],
+                name="complaint_open_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="complaint",
+            index=models.Index(
+                fields=["category", "status"],
+                include=("latitude", "longitude"),
+                name="complaint_heatmap_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0006_complaint_workload_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="complaint",
+            name="thumbnails",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
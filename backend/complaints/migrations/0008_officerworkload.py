@@ -0,0 +1,72 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_workloads(apps, schema_editor):
+    Complaint = apps.get_model("complaints", "Complaint")
+    OfficerWorkload = apps.get_model("complaints", "OfficerWorkload")
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    counts = dict(
+        Complaint.objects.filter(
+            status__in=["pending", "in_progress"], assigned_officer__isnull=False
+        )
+        .values("assigned_officer")
+        .annotate(n=Count("id"))
+        .values_list("assigned_officer", "n")
+    )
+    OfficerWorkload.objects.bulk_create(
+        [
+            OfficerWorkload(officer_id=officer_id, open_count=counts.get(officer_id, 0))
+            for officer_id in User.objects.filter(role="officer").values_list(
+                "id", flat=True
+            )
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0007_complaint_thumbnails"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OfficerWorkload",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("open_count", models.IntegerField(default=0)),
+                (
+                    "categories",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Categories this officer specialises in",
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "officer",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="workload",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(populate_workloads, migrations.RunPython.noop),
+    ]
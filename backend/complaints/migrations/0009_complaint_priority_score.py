@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0008_officerworkload"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="complaint",
+            name="priority_score",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:17
+
+from django.db import migrations, models
+
+from complaints.geo import encode_cells
+
+
+def backfill_geo_cells(apps, schema_editor):
+    Complaint = apps.get_model("complaints", "Complaint")
+    last_id = 0
+    while True:
+        batch = list(
+            Complaint.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", "latitude", "longitude")[:5000]
+        )
+        if not batch:
+            break
+        last_id = batch[-1][0]
+        ids, lats, lngs = zip(*batch)
+        codes = encode_cells(lats, lngs)
+        Complaint.objects.bulk_update(
+            [Complaint(id=pk, geo_cell=int(code)) for pk, code in zip(ids, codes)],
+            ["geo_cell"],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0009_complaint_priority_score"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="complaint",
+            name="geo_cell",
+            field=models.BigIntegerField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(backfill_geo_cells, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-19 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0010_complaint_geo_cell"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="complaint",
+            name="client_key",
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name="complaint",
+            constraint=models.UniqueConstraint(
+                fields=("citizen", "client_key"), name="complaint_citizen_client_key_uniq"
+            ),
+        ),
+    ]
@@ -0,0 +1,148 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0011_complaint_client_key"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedComplaint",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("title", models.CharField(max_length=200)),
+                ("description", models.TextField()),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("water", "Water Supply"),
+                            ("sanitation", "Sanitation"),
+                            ("roads", "Roads & Infrastructure"),
+                            ("electricity", "Electricity"),
+                            ("streetlight", "Street Lighting"),
+                            ("drainage", "Drainage"),
+                            ("garbage", "Garbage Collection"),
+                            ("other", "Other"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("in_progress", "In Progress"),
+                            ("resolved", "Resolved"),
+                            ("rejected", "Rejected"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "priority",
+                    models.CharField(
+                        choices=[
+                            ("low", "Low"),
+                            ("medium", "Medium"),
+                            ("high", "High"),
+                            ("critical", "Critical"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("priority_score", models.FloatField(blank=True, null=True)),
+                ("latitude", models.DecimalField(decimal_places=6, max_digits=9)),
+                ("longitude", models.DecimalField(decimal_places=6, max_digits=9)),
+                ("address", models.CharField(blank=True, max_length=500, null=True)),
+                ("district", models.CharField(blank=True, max_length=100, null=True)),
+                ("geo_cell", models.BigIntegerField(blank=True, null=True)),
+                (
+                    "image",
+                    models.ImageField(
+                        blank=True, null=True, upload_to="complaints/%Y/%m/"
+                    ),
+                ),
+                ("thumbnails", models.JSONField(blank=True, default=dict)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("resolved_at", models.DateTimeField(blank=True, null=True)),
+                ("rating", models.IntegerField(blank=True, null=True)),
+                ("feedback", models.TextField(blank=True, null=True)),
+                ("officer_notes", models.TextField(blank=True, null=True)),
+                ("client_key", models.CharField(blank=True, max_length=64, null=True)),
+                ("archived_at", models.DateTimeField()),
+                (
+                    "assigned_officer",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "citizen",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedComplaintUpdate",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("old_status", models.CharField(max_length=20)),
+                ("new_status", models.CharField(max_length=20)),
+                ("comment", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField()),
+                (
+                    "complaint",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="updates",
+                        to="complaints.archivedcomplaint",
+                    ),
+                ),
+                (
+                    "updated_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="archivedcomplaint",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="archived_created_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedcomplaint",
+            index=models.Index(
+                fields=["citizen", "-created_at", "-id"],
+                name="archived_citizen_created_idx",
+            ),
+        ),
+    ]
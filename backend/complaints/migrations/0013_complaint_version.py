@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0012_complaint_archive"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="complaint",
+            name="version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,112 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:39
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_queue_counters(apps, schema_editor):
+    Complaint = apps.get_model("complaints", "Complaint")
+    OfficerWorkload = apps.get_model("complaints", "OfficerWorkload")
+    DistrictBacklog = apps.get_model("complaints", "DistrictBacklog")
+    open_complaints = Complaint.objects.filter(status__in=["pending", "in_progress"])
+
+    for officer_id, status, n in (
+        open_complaints.filter(assigned_officer__isnull=False)
+        .values("assigned_officer", "status")
+        .annotate(n=Count("id"))
+        .values_list("assigned_officer", "status", "n")
+    ):
+        OfficerWorkload.objects.update_or_create(
+            officer_id=officer_id, defaults={f"{status}_count": n}
+        )
+
+    backlog = {}
+    for district, status, n in (
+        open_complaints.filter(assigned_officer__isnull=True)
+        .exclude(district__isnull=True)
+        .exclude(district="")
+        .values("district", "status")
+        .annotate(n=Count("id"))
+        .values_list("district", "status", "n")
+    ):
+        counts = backlog.setdefault(district.lower(), {"pending_count": 0, "in_progress_count": 0})
+        counts[f"{status}_count"] += n
+    DistrictBacklog.objects.bulk_create(
+        [DistrictBacklog(district=district, **counts) for district, counts in backlog.items()]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0013_complaint_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DistrictBacklog",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("district", models.CharField(max_length=100, unique=True)),
+                ("pending_count", models.IntegerField(default=0)),
+                ("in_progress_count", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="complaint",
+            name="priority_rank",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(priority="critical", then=models.Value(0)),
+                    models.When(priority="high", then=models.Value(1)),
+                    models.When(priority="medium", then=models.Value(2)),
+                    default=models.Value(3),
+                ),
+                output_field=models.SmallIntegerField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="officerworkload",
+            name="in_progress_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="officerworkload",
+            name="pending_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="complaint",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "in_progress"])),
+                fields=["assigned_officer", "priority_rank", "created_at", "id"],
+                name="complaint_officer_queue_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="complaint",
+            index=models.Index(
+                django.db.models.functions.text.Upper("district"),
+                models.F("priority_rank"),
+                models.F("created_at"),
+                models.F("id"),
+                condition=models.Q(
+                    ("assigned_officer__isnull", True),
+                    ("status__in", ["pending", "in_progress"]),
+                ),
+                name="complaint_district_queue_idx",
+            ),
+        ),
+        migrations.RunPython(populate_queue_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-19 17:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def clear_routing_authors(apps, schema_editor):
+    # Automatic routing used to record the assigned officer as the author
+    for name in ("ComplaintUpdate", "ArchivedComplaintUpdate"):
+        apps.get_model("complaints", name).objects.filter(
+            comment="Automatically routed", old_status=F("new_status")
+        ).update(updated_by=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0014_work_queue"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="archivedcomplaintupdate",
+            name="updated_by",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="complaintupdate",
+            name="updated_by",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(clear_routing_authors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-19 17:36
+
+from django.db import migrations, models
+
+
+def flag_manual_priorities(apps, schema_editor):
+    # Scoring always stores a score unless it keeps the default band, so a
+    # scoreless complaint in any other band was prioritised by hand
+    for name in ("Complaint", "ArchivedComplaint"):
+        apps.get_model("complaints", name).objects.filter(
+            priority_score__isnull=True
+        ).exclude(priority="medium").update(priority_manual=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0015_system_updates"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="archivedcomplaint",
+            name="priority_manual",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="complaint",
+            name="priority_manual",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(flag_manual_priorities, migrations.RunPython.noop),
+    ]
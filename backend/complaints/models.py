@@ -1,5 +1,10 @@
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from users.models import User
+from .geo import encode_cell
+from .districts import infer_district
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 class Complaint(models.Model):
@@ -32,14 +37,33 @@ class Complaint(models.Model):
     description = models.TextField()
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    # Bumped by every status/assignment write; see complaints.transitions
+    version = models.PositiveIntegerField(default=0, editable=False)
     priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES, default='medium')
+    priority_score = models.FloatField(null=True, blank=True, editable=False)
+    # Set when the priority was given by hand; score_priorities leaves it
+    priority_manual = models.BooleanField(default=False, editable=False)
+    # Work-queue sort key, most urgent first; computed by the database
+    priority_rank = models.GeneratedField(
+        expression=models.Case(
+            models.When(priority='critical', then=models.Value(0)),
+            models.When(priority='high', then=models.Value(1)),
+            models.When(priority='medium', then=models.Value(2)),
+            default=models.Value(3),
+        ),
+        output_field=models.SmallIntegerField(),
+        db_persist=True,
+    )
     
     latitude = models.DecimalField(max_digits=9, decimal_places=6)
     longitude = models.DecimalField(max_digits=9, decimal_places=6)
     address = models.CharField(max_length=500, blank=True, null=True)
     district = models.CharField(max_length=100, blank=True, null=True)
+    # Z-order grid cell of (latitude, longitude); see complaints.geo
+    geo_cell = models.BigIntegerField(null=True, blank=True, editable=False, db_index=True)
     
     image = models.ImageField(upload_to='complaints/%Y/%m/', blank=True, null=True)
+    thumbnails = models.JSONField(default=dict, blank=True, editable=False)
     
     citizen = models.ForeignKey(User, on_delete=models.CASCADE, related_name='complaints')
     assigned_officer = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='assigned_complaints')
@@ -56,6 +80,11 @@ class Complaint(models.Model):
     )
     feedback = models.TextField(blank=True, null=True)
     officer_notes = models.TextField(blank=True, null=True)
+
+    # Maintained by a database trigger from title, description and address
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Idempotency key sent by offline clients with bulk ingest; unique per citizen
+    client_key = models.CharField(max_length=64, blank=True, null=True, editable=False)
     
     class Meta:
         ordering = ['-created_at']
@@ -63,11 +92,57 @@ class Complaint(models.Model):
             models.Index(fields=['status']),
             models.Index(fields=['category']),
             models.Index(fields=['created_at']),
+            # Keyset pagination walks (created_at, id) newest-first
+            models.Index(fields=['-created_at', '-id'], name='complaint_created_id_idx'),
+            GinIndex(fields=['search_vector'], name='complaint_search_vector_idx'),
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='complaint_title_trgm_idx'),
+            # Citizen's own complaints, newest first
+            models.Index(fields=['citizen', '-created_at', '-id'], name='complaint_citizen_created_idx'),
+            # Officer views filtered by district / own assignments and status
+            models.Index(fields=['district', 'status', '-created_at'], name='complaint_district_status_idx'),
+            models.Index(fields=['assigned_officer', 'status'], name='complaint_officer_status_idx'),
+            # Open backlog only; resolved/rejected history is never scanned
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=models.Q(status__in=['pending', 'in_progress']),
+                name='complaint_open_created_idx',
+            ),
+            # Heatmap filters on category/status and reads coordinates only
+            models.Index(
+                fields=['category', 'status'],
+                include=['latitude', 'longitude'],
+                name='complaint_heatmap_idx',
+            ),
+            # Officer work queues (complaints.queue): own open assignments
+            # and the district's unassigned backlog, urgent and oldest first
+            models.Index(
+                fields=['assigned_officer', 'priority_rank', 'created_at', 'id'],
+                condition=models.Q(status__in=['pending', 'in_progress']),
+                name='complaint_officer_queue_idx',
+            ),
+            models.Index(
+                Upper('district'), 'priority_rank', 'created_at', 'id',
+                condition=models.Q(status__in=['pending', 'in_progress'], assigned_officer__isnull=True),
+                name='complaint_district_queue_idx',
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['citizen', 'client_key'], name='complaint_citizen_client_key_uniq'),
         ]
     
     def __str__(self):
         return f"{self.title} - {self.status}"
     
+    def save(self, *args, **kwargs):
+        if self.latitude is not None and self.longitude is not None:
+            self.geo_cell = encode_cell(float(self.latitude), float(self.longitude))
+            if not self.district:
+                self.district = infer_district(self.latitude, self.longitude)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'latitude', 'longitude'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'geo_cell', 'district'}
+        super().save(*args, **kwargs)
+    
     def get_resolution_time(self):
         if self.resolved_at:
             delta = self.resolved_at - self.created_at
@@ -76,7 +151,8 @@ class Complaint(models.Model):
 
 class ComplaintUpdate(models.Model):
     complaint = models.ForeignKey(Complaint, on_delete=models.CASCADE, related_name='updates')
-    updated_by = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Null for changes made by the system, e.g. automatic routing
+    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
     old_status = models.CharField(max_length=20)
     new_status = models.CharField(max_length=20)
     comment = models.TextField(blank=True, null=True)
@@ -86,4 +162,102 @@ class ComplaintUpdate(models.Model):
         ordering = ['-created_at']
     
     def __str__(self):
-        return f"Update for {self.complaint.title} at {self.created_at}"
\ No newline at end of file
+        return f"Update for {self.complaint.title} at {self.created_at}"
+
+
+class OfficerWorkload(models.Model):
+    """Running count of an officer's open assigned complaints.
+
+    Kept up to date incrementally by complaints.routing so that routing a
+    new complaint never has to COUNT(*) every officer's queue.
+    open_count is pending_count + in_progress_count.
+    """
+    officer = models.OneToOneField(User, on_delete=models.CASCADE, related_name='workload')
+    open_count = models.IntegerField(default=0)
+    pending_count = models.IntegerField(default=0)
+    in_progress_count = models.IntegerField(default=0)
+    categories = models.JSONField(default=list, blank=True, help_text="Categories this officer specialises in")
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"{self.officer.username}: {self.open_count} open"
+
+
+class DistrictBacklog(models.Model):
+    """Running count of a district's open complaints nobody is assigned to.
+
+    Keyed by the lower-cased district name and maintained alongside
+    OfficerWorkload by complaints.routing.
+    """
+    district = models.CharField(max_length=100, unique=True)
+    pending_count = models.IntegerField(default=0)
+    in_progress_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.district}: {self.pending_count + self.in_progress_count} unassigned"
+
+
+class ArchivedComplaint(models.Model):
+    """Resolved/rejected complaint moved out of the hot table.
+
+    Same columns as Complaint (minus the search vector) and the same ids,
+    so rows can be copied across with INSERT ... SELECT; see
+    complaints.archive.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=200)
+    description = models.TextField()
+    category = models.CharField(max_length=20, choices=Complaint.CATEGORY_CHOICES)
+    status = models.CharField(max_length=20, choices=Complaint.STATUS_CHOICES)
+    priority = models.CharField(max_length=10, choices=Complaint.PRIORITY_CHOICES)
+    priority_score = models.FloatField(null=True, blank=True)
+    priority_manual = models.BooleanField(default=False)
+
+    latitude = models.DecimalField(max_digits=9, decimal_places=6)
+    longitude = models.DecimalField(max_digits=9, decimal_places=6)
+    address = models.CharField(max_length=500, blank=True, null=True)
+    district = models.CharField(max_length=100, blank=True, null=True)
+    geo_cell = models.BigIntegerField(null=True, blank=True)
+
+    image = models.ImageField(upload_to='complaints/%Y/%m/', blank=True, null=True)
+    thumbnails = models.JSONField(default=dict, blank=True)
+
+    citizen = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    assigned_officer = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    resolved_at = models.DateTimeField(null=True, blank=True)
+
+    rating = models.IntegerField(null=True, blank=True)
+    feedback = models.TextField(blank=True, null=True)
+    officer_notes = models.TextField(blank=True, null=True)
+    client_key = models.CharField(max_length=64, blank=True, null=True)
+
+    archived_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='archived_created_id_idx'),
+            models.Index(fields=['citizen', '-created_at', '-id'], name='archived_citizen_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.title} - {self.status} (archived)"
+
+    get_resolution_time = Complaint.get_resolution_time
+
+
+class ArchivedComplaintUpdate(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    complaint = models.ForeignKey(ArchivedComplaint, on_delete=models.CASCADE, related_name='updates')
+    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    old_status = models.CharField(max_length=20)
+    new_status = models.CharField(max_length=20)
+    comment = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-created_at']
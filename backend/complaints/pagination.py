@@ -0,0 +1,222 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import GeneratedField, Q
+from asgiref.sync import sync_to_async
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def keyset_filter(ordering, values, reverse=False):
+    """Build a Q that selects rows strictly after `values` in `ordering`.
+
+    `ordering` is a list of order_by strings such as ['-created_at', '-id'].
+    The expansion is the usual row-value comparison:
+    (a < x) OR (a = x AND b < y) OR ...
+    """
+    condition = Q()
+    for i, field in enumerate(ordering):
+        name = field.lstrip('-')
+        descending = field.startswith('-')
+        if reverse:
+            descending = not descending
+        step = Q(**{f"{name}__{'lt' if descending else 'gt'}": values[i]})
+        for prev_field, prev_value in zip(ordering[:i], values[:i]):
+            step &= Q(**{prev_field.lstrip('-'): prev_value})
+        condition |= step
+    return condition
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _ordering_field(model, name):
+    """The model field an ordering name sorts on, None for annotations."""
+    field = None
+    for part in name.split('__'):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        if field.is_relation:
+            model = field.related_model
+    return field.output_field if isinstance(field, GeneratedField) else field
+
+
+def _row_value(row, name):
+    # Pages may hold model instances or .values() dicts
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+class ComplaintCursorPagination(BasePagination):
+    """Keyset pagination on the view's ordering with an `id` tiebreaker.
+
+    Pages are fetched with a `WHERE (created_at, id) < (...)` style filter
+    instead of OFFSET, so deep pages cost the same as the first one and no
+    COUNT(*) is issued. Passing `offset` (and optionally `limit`) switches
+    to plain limit/offset pagination for small result sets.
+    """
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    offset_query_param = 'offset'
+    default_ordering = ('-created_at', '-id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_offset(request):
+            return self.offset_paginator.paginate_queryset(queryset, request, view)
+        return self.finish_page(list(self.page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset for async views, fetching with the async ORM."""
+        if self.use_offset(request):
+            return await sync_to_async(self.offset_paginator.paginate_queryset)(queryset, request, view)
+        return self.finish_page([row async for row in self.page_queryset(queryset, request)])
+
+    def use_offset(self, request):
+        self.request = request
+        self.offset_paginator = None
+        if self.offset_query_param in request.query_params:
+            self.offset_paginator = LimitOffsetPagination()
+            self.offset_paginator.default_limit = self.page_size
+            self.offset_paginator.max_limit = self.max_page_size
+        return self.offset_paginator is not None
+
+    def page_queryset(self, queryset, request):
+        """The sliced queryset for the requested page, one row over size."""
+        self.page_size_value = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        self.base_url = request.build_absolute_uri()
+
+        cursor = self.decode_cursor(request, queryset.model)
+        self.cursor = cursor
+        self.reverse = False
+        queryset = queryset.order_by(*self.ordering)
+        if cursor is not None:
+            values, self.reverse = cursor
+            queryset = queryset.filter(keyset_filter(self.ordering, values, self.reverse))
+            if self.reverse:
+                queryset = queryset.reverse()
+        return queryset[:self.page_size_value + 1]
+
+    def finish_page(self, rows):
+        cursor, reverse = self.cursor, self.reverse
+        has_more = len(rows) > self.page_size_value
+        rows = rows[:self.page_size_value]
+        if reverse:
+            rows.reverse()
+
+        self.has_next = has_more if not reverse else cursor is not None
+        self.has_previous = cursor is not None if not reverse else has_more
+        self.first_row = rows[0] if rows else None
+        self.last_row = rows[-1] if rows else None
+        return rows
+
+    def get_paginated_response(self, data):
+        if self.offset_paginator is not None:
+            return self.offset_paginator.get_paginated_response(data)
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, queryset):
+        # OrderingFilter has already applied any `?ordering=` from the
+        # request; fall back to newest-first when it has not.
+        ordering = [f for f in queryset.query.order_by if isinstance(f, str)]
+        if not ordering:
+            ordering = list(self.default_ordering)
+        names = {f.lstrip('-') for f in ordering}
+        for field in self.default_ordering:
+            if field.lstrip('-') not in names:
+                ordering.append(field)
+        return ordering
+
+    def get_next_link(self):
+        if not self.has_next or self.last_row is None:
+            return None
+        return self.encode_cursor(self.last_row, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or self.first_row is None:
+            return None
+        return self.encode_cursor(self.first_row, reverse=True)
+
+    def encode_cursor(self, row, reverse):
+        payload = {
+            'o': self.ordering,
+            'v': [_encode_value(_row_value(row, f.lstrip('-'))) for f in self.ordering],
+        }
+        if reverse:
+            payload['r'] = 1
+        token = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request, model):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+            values = payload['v']
+            reverse = bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        # A cursor is only meaningful for the ordering it was issued under.
+        if (payload.get('o') != self.ordering or not isinstance(values, list)
+                or len(values) != len(self.ordering)):
+            raise NotFound(self.invalid_cursor_message)
+        values = [
+            self.cursor_value(model, name.lstrip('-'), value)
+            for name, value in zip(self.ordering, values)
+        ]
+        return values, reverse
+
+    def cursor_value(self, model, name, value):
+        # Cursors come from the client; anything a real one could not hold
+        # must become a 404, not an error in the filter below
+        if value is None or isinstance(value, (dict, list)):
+            raise NotFound(self.invalid_cursor_message)
+        field = _ordering_field(model, name)
+        if field is None:
+            return value
+        try:
+            return field.to_python(value)
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'schema': {'type': 'integer'},
+            },
+        ]
@@ -0,0 +1,249 @@
+# Vectorised priority scoring for complaints
+import re
+from collections import Counter
+from datetime import timedelta
+
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Complaint
+
+OPEN_STATUSES = ('pending', 'in_progress')
+
+CATEGORY_WEIGHTS = {
+    'electricity': 0.8,
+    'water': 0.7,
+    'drainage': 0.6,
+    'sanitation': 0.6,
+    'roads': 0.5,
+    'streetlight': 0.4,
+    'garbage': 0.4,
+    'other': 0.3,
+}
+
+FEATURE_WEIGHTS = {
+    'category': 0.30,
+    'density': 0.20,
+    'cluster': 0.15,
+    'age': 0.15,
+    'text': 0.20,
+}
+
+# Lower bounds of each priority band, highest first
+THRESHOLDS = [
+    ('critical', 0.75),
+    ('high', 0.55),
+    ('medium', 0.35),
+    ('low', 0.0),
+]
+
+# Band of a complaint that score_priorities has not scored yet
+DEFAULT_PRIORITY = Complaint._meta.get_field('priority').default
+
+# ~1.1 km grid cells for "how many open complaints are nearby"
+DENSITY_CELL_DEGREES = 0.01
+DENSITY_WINDOW_DAYS = 30
+DENSITY_CAP = 25
+CLUSTER_CAP = 100
+AGE_CAP_DAYS = 14
+
+URGENT_PATTERN = re.compile(
+    r'urgent|emergency|danger|accident|injur|fire|shock|electrocut|live wire|'
+    r'collapse|flood|overflow|sewage|hospital|school|child|contaminat|'
+    r'तुरंत|जल्दी|खतरा|खतरनाक|दुर्घटना|आग|करंट|बाढ़|गंदा पानी|अस्पताल|स्कूल|बच्च',
+    re.IGNORECASE,
+)
+
+URGENT_PROTOTYPES = [
+    'Dangerous situation, people may get hurt, needs urgent action',
+    'Live electric wire fallen on the road',
+    'Contaminated drinking water making people sick',
+    'बहुत खतरनाक स्थिति है, तुरंत कार्रवाई करें',
+]
+_prototype_vectors = None
+
+
+def compute_scores(categories, densities, cluster_sizes, ages_days, text_signal):
+    """Combine per-complaint features into a score in [0, 1].
+
+    All arguments are equal-length arrays; categories holds category codes.
+    """
+    category = np.array([CATEGORY_WEIGHTS.get(c, CATEGORY_WEIGHTS['other']) for c in categories])
+    density = np.minimum(np.log1p(densities) / np.log1p(DENSITY_CAP), 1.0)
+    cluster = np.minimum(np.log1p(cluster_sizes) / np.log1p(CLUSTER_CAP), 1.0)
+    age = np.clip(np.asarray(ages_days, dtype=np.float64) / AGE_CAP_DAYS, 0.0, 1.0)
+    text = np.clip(text_signal, 0.0, 1.0)
+
+    return (
+        FEATURE_WEIGHTS['category'] * category
+        + FEATURE_WEIGHTS['density'] * density
+        + FEATURE_WEIGHTS['cluster'] * cluster
+        + FEATURE_WEIGHTS['age'] * age
+        + FEATURE_WEIGHTS['text'] * text
+    )
+
+
+def bucket(scores):
+    scores = np.asarray(scores, dtype=np.float64)
+    return np.select(
+        [scores >= threshold for _, threshold in THRESHOLDS],
+        [label for label, _ in THRESHOLDS],
+        default='low',
+    )
+
+
+def provisional(scores):
+    """Bands and scores to store at insert time.
+
+    Cluster size and age are not known yet and count as 0, so these scores
+    only bound the full ones from below. Rows whose bound reaches the
+    default band get it and their score; the rest keep the default band
+    with no score (NaN) until score_priorities sees them.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    known = scores >= dict(THRESHOLDS)[DEFAULT_PRIORITY]
+    return np.where(known, bucket(scores), DEFAULT_PRIORITY), np.where(known, scores, np.nan)
+
+
+def keyword_signal(texts):
+    return np.array([1.0 if URGENT_PATTERN.search(t or '') else 0.0 for t in texts])
+
+
+def _grid_cells(latitudes, longitudes):
+    lat = np.floor(np.asarray(latitudes, dtype=np.float64) / DENSITY_CELL_DEGREES).astype(np.int64)
+    lng = np.floor(np.asarray(longitudes, dtype=np.float64) / DENSITY_CELL_DEGREES).astype(np.int64)
+    return lat * 100000 + lng
+
+
+def _embedding_signal(ids):
+    """Similarity of each complaint's stored embedding to urgent phrasings."""
+    global _prototype_vectors
+    from analytics.vector_index import complaint_vector_index
+
+    index_ids, index_vectors, _ = complaint_vector_index.refresh()
+    signal = np.zeros(len(ids))
+    if index_ids.size == 0:
+        return signal
+
+    if _prototype_vectors is None:
+        from analytics.ai_service import clustering_service
+        vectors = clustering_service.generate_embeddings(URGENT_PROTOTYPES)
+        if vectors.size == 0:
+            return signal
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        _prototype_vectors = vectors.astype(np.float32)
+
+    positions = np.searchsorted(index_ids, ids)
+    positions = np.minimum(positions, index_ids.size - 1)
+    found = index_ids[positions] == ids
+
+    similarity = (index_vectors[positions[found]] @ _prototype_vectors.T).max(axis=1)
+    # Paraphrases of the prototypes sit around 0.6-0.7; unrelated text < 0.3
+    signal[found] = np.clip((similarity - 0.3) / 0.4, 0.0, 1.0)
+    return signal
+
+
+def score_open_backlog(dry_run=False):
+    """Re-score every open complaint in one pass and persist changed bands.
+
+    Priorities given by hand (priority_manual) are left alone, as are older
+    ones whose priority no longer matches the band of their stored score.
+    Returns a Counter of {new_priority: count} for rows that changed.
+    """
+    rows = list(
+        Complaint.objects
+        .filter(status__in=OPEN_STATUSES, priority_manual=False)
+        .order_by('id')
+        .values_list(
+            'id', 'category', 'latitude', 'longitude', 'created_at',
+            'title', 'description', 'priority', 'priority_score',
+            'embedding__cluster__complaint_count',
+        )
+    )
+    if not rows:
+        return Counter()
+
+    (ids, categories, lats, lngs, created, titles, descriptions,
+     priorities, old_scores, cluster_sizes) = zip(*rows)
+    ids = np.asarray(ids, dtype=np.int64)
+    now = timezone.now()
+
+    ages = (now.timestamp() - np.array([c.timestamp() for c in created])) / 86400
+
+    # Open complaints from the last window sharing each complaint's grid cell
+    cells = _grid_cells(lats, lngs)
+    recent_cells, counts = np.unique(cells[ages <= DENSITY_WINDOW_DAYS], return_counts=True)
+    densities = np.zeros(len(ids))
+    if recent_cells.size:
+        positions = np.minimum(np.searchsorted(recent_cells, cells), recent_cells.size - 1)
+        hit = recent_cells[positions] == cells
+        densities[hit] = counts[positions[hit]]
+
+    clusters = np.array([size or 0 for size in cluster_sizes], dtype=np.float64)
+    texts = [f'{t} {d}' for t, d in zip(titles, descriptions)]
+    text = np.maximum(keyword_signal(texts), _embedding_signal(ids))
+
+    scores = compute_scores(categories, densities, clusters, ages, text)
+    bands = bucket(scores)
+
+    old_scores = np.array([np.nan if s is None else s for s in old_scores])
+    priorities = np.asarray(priorities)
+    manual = ~np.isnan(old_scores) & (bucket(np.nan_to_num(old_scores)) != priorities)
+    selected = np.flatnonzero(~manual)
+
+    changed = Counter(bands[selected][bands[selected] != priorities[selected]].tolist())
+    if not dry_run:
+        # Only rows whose band moved get a new updated_at, so clients'
+        # cached copies of unchanged complaints stay valid
+        moved = selected[bands[selected] != priorities[selected]]
+        kept = selected[bands[selected] == priorities[selected]]
+        with transaction.atomic():
+            Complaint.objects.bulk_update(
+                [
+                    Complaint(id=int(ids[i]), priority=str(bands[i]),
+                              priority_score=float(scores[i]), updated_at=now)
+                    for i in moved
+                ],
+                ['priority', 'priority_score', 'updated_at'],
+                batch_size=1000,
+            )
+            Complaint.objects.bulk_update(
+                [Complaint(id=int(ids[i]), priority_score=float(scores[i])) for i in kept],
+                ['priority_score'],
+                batch_size=1000,
+            )
+    return changed
+
+
+def score_new_complaint(complaint):
+    """Cheap scoring at insert time: one COUNT query, no model inference.
+
+    Stores a provisional() band; score_priorities adds age and clusters.
+    """
+    lat, lng = float(complaint.latitude), float(complaint.longitude)
+    cell = DENSITY_CELL_DEGREES
+    lat0 = np.floor(lat / cell) * cell
+    lng0 = np.floor(lng / cell) * cell
+    density = (
+        Complaint.objects
+        .filter(
+            status__in=OPEN_STATUSES,
+            created_at__gte=timezone.now() - timedelta(days=DENSITY_WINDOW_DAYS),
+            latitude__gte=lat0, latitude__lt=lat0 + cell,
+            longitude__gte=lng0, longitude__lt=lng0 + cell,
+        )
+        .count()
+    )
+
+    text = keyword_signal([f'{complaint.title} {complaint.description}'])
+    bands, scores = provisional(compute_scores([complaint.category], [density], [0], [0], text))
+    priority = str(bands[0])
+    score = None if np.isnan(scores[0]) else float(scores[0])
+
+    Complaint.objects.filter(pk=complaint.pk).update(
+        priority=priority, priority_score=score, updated_at=timezone.now()
+    )
+    complaint.priority = priority
+    complaint.priority_score = score
+    return priority
@@ -0,0 +1,55 @@
+# Officer work queue: their own open complaints plus the unassigned backlog
+# of their district, most urgent first and then oldest first
+import heapq
+
+from .fastpath import LIST_VALUES
+from .models import Complaint, DistrictBacklog, OfficerWorkload
+from .pagination import ComplaintCursorPagination
+from .routing import OPEN_STATUSES, district_key
+
+QUEUE_ORDERING = ('priority_rank', 'created_at', 'id')
+QUEUE_VALUES = LIST_VALUES + ('priority', 'priority_rank')
+
+
+def queue_sources(officer):
+    """The queue's two parts as querysets, each served by its own partial index.
+
+    Kept apart rather than OR-ed together so both stay index range scans
+    however large the district's backlog is.
+    """
+    open_complaints = Complaint.objects.filter(status__in=OPEN_STATUSES).order_by(*QUEUE_ORDERING)
+    sources = [open_complaints.filter(assigned_officer=officer)]
+    if officer.district:
+        sources.append(open_complaints.filter(assigned_officer__isnull=True, district__iexact=officer.district))
+    return [source.values(*QUEUE_VALUES) for source in sources]
+
+
+def queue_counts(officer):
+    """Per-status queue sizes from the maintained counters, no COUNT(*)."""
+    fields = ('pending_count', 'in_progress_count')
+    assigned = OfficerWorkload.objects.filter(officer=officer).values(*fields).first() or {}
+    unassigned = {}
+    if officer.district:
+        unassigned = DistrictBacklog.objects.filter(district=district_key(officer.district)).values(*fields).first() or {}
+    return {
+        name: {status: counts.get(f'{status}_count', 0) for status in OPEN_STATUSES}
+        for name, counts in (('assigned', assigned), ('unassigned', unassigned))
+    }
+
+
+class WorkQueuePagination(ComplaintCursorPagination):
+    """Keyset pages over several disjoint querysets sharing QUEUE_ORDERING.
+
+    Each source is fetched one page (plus one row) past the cursor and the
+    results merged, so a page costs a few index probes however deep it is.
+    """
+    default_ordering = QUEUE_ORDERING
+
+    def paginate_sources(self, sources, request):
+        self.request = request
+        self.offset_paginator = None
+        pages = [list(self.page_queryset(source, request)) for source in sources]
+        # Each page is sorted along the ordering (reversed when paging back)
+        key = lambda row: tuple(row[name] for name in QUEUE_ORDERING)
+        merged = heapq.merge(*pages, key=key, reverse=self.reverse)
+        return self.finish_page(list(merged)[:self.page_size_value + 1])
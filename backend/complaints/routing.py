@@ -0,0 +1,265 @@
+# Workload-balanced assignment of complaints to district officers
+import heapq
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from users.models import User
+from .events import publish_updates
+from .models import Complaint, ComplaintUpdate, DistrictBacklog, OfficerWorkload
+
+OPEN_STATUSES = ('pending', 'in_progress')
+
+# An officer who specialises in a category is preferred over a generalist
+# until they carry this many more open complaints.
+EXPERTISE_BONUS = getattr(settings, 'ROUTING_EXPERTISE_BONUS', 5)
+
+
+WorkloadKey = Tuple[str, object, str]
+
+
+def district_key(district) -> str:
+    # DistrictBacklog rows are matched like district__iexact
+    return (district or '').lower()
+
+
+def workload_key(assigned_officer_id, status, district) -> Optional[WorkloadKey]:
+    """The open-queue counter a complaint counts towards, if any.
+
+    ('officer', officer_id, status) while assigned, ('district', name,
+    status) while unassigned in a known district.
+    """
+    if status not in OPEN_STATUSES:
+        return None
+    if assigned_officer_id:
+        return ('officer', assigned_officer_id, status)
+    if district:
+        return ('district', district_key(district), status)
+    return None
+
+
+def apply_workload_deltas(deltas: Dict[WorkloadKey, int]):
+    """Add deltas to the OfficerWorkload / DistrictBacklog counters with F() updates."""
+    for key, delta in deltas.items():
+        if key is None or not delta:
+            continue
+        kind, owner, status = key
+        column = f'{status}_count'
+        changes = {column: F(column) + delta}
+        if kind == 'officer':
+            model, lookup = OfficerWorkload, {'officer_id': owner}
+            changes['open_count'] = F('open_count') + delta
+        else:
+            model, lookup = DistrictBacklog, {'district': owner}
+        if not model.objects.filter(**lookup).update(**changes):
+            model.objects.get_or_create(**lookup)
+            model.objects.filter(**lookup).update(**changes)
+
+
+def workload_transition(old_key: Optional[WorkloadKey], new_key: Optional[WorkloadKey]):
+    if old_key == new_key:
+        return
+    deltas = Counter()
+    if old_key:
+        deltas[old_key] -= 1
+    if new_key:
+        deltas[new_key] += 1
+    apply_workload_deltas(deltas)
+
+
+def score(open_count: int, categories: Iterable[str], category: str) -> int:
+    return open_count - (EXPERTISE_BONUS if category in categories else 0)
+
+
+def choose_officer(officers: List[Tuple[int, int, List[str]]], category: str) -> Optional[int]:
+    """Pick the least-loaded officer, favouring category specialists.
+
+    `officers` holds (officer_id, open_count, categories) tuples; ties go to
+    the lowest id so results are deterministic.
+    """
+    best = None
+    for officer_id, open_count, categories in officers:
+        key = (score(open_count, categories, category), officer_id)
+        if best is None or key < best:
+            best = key
+    return best[1] if best else None
+
+
+def district_officers(district: str) -> List[Tuple[int, int, List[str]]]:
+    officers = (
+        User.objects
+        .filter(role='officer', is_active=True, district__iexact=district)
+        .values_list('id', 'workload__open_count', 'workload__categories')
+    )
+    return [
+        (officer_id, open_count or 0, categories or [])
+        for officer_id, open_count, categories in officers
+    ]
+
+
+def route_complaint(complaint: Complaint) -> Optional[User]:
+    """Assign a new, unassigned complaint to an officer in its district."""
+    if complaint.assigned_officer_id or not complaint.district:
+        return None
+
+    officer_id = choose_officer(district_officers(complaint.district), complaint.category)
+    if officer_id is None:
+        return None
+
+    with transaction.atomic():
+        assigned = Complaint.objects.filter(
+            pk=complaint.pk, assigned_officer__isnull=True
+        ).update(assigned_officer_id=officer_id, updated_at=timezone.now(), version=F('version') + 1)
+        if not assigned:
+            return None
+        workload_transition(
+            workload_key(None, complaint.status, complaint.district),
+            workload_key(officer_id, complaint.status, complaint.district),
+        )
+        ComplaintUpdate.objects.create(
+            complaint=complaint,
+            updated_by=None,  # routed by the system, not by the officer
+            old_status=complaint.status,
+            new_status=complaint.status,
+            comment='Automatically routed',
+        )
+
+    complaint.assigned_officer_id = officer_id
+    complaint.version += 1
+    complaint._workload_key = workload_key(officer_id, complaint.status, complaint.district)
+    return complaint.assigned_officer
+
+
+def recount_workloads():
+    """Rebuild every counter from the complaints table."""
+    open_complaints = Complaint.objects.filter(status__in=OPEN_STATUSES)
+    officer_counts = Counter()
+    for officer_id, status, n in (
+        open_complaints.filter(assigned_officer__isnull=False)
+        .values('assigned_officer', 'status')
+        .annotate(n=Count('id'))
+        .values_list('assigned_officer', 'status', 'n')
+    ):
+        officer_counts[officer_id, status] += n
+    district_counts = Counter()
+    for district, status, n in (
+        open_complaints.filter(assigned_officer__isnull=True)
+        .exclude(district__isnull=True).exclude(district='')
+        .values('district', 'status')
+        .annotate(n=Count('id'))
+        .values_list('district', 'status', 'n')
+    ):
+        # Differently-cased spellings share one counter
+        district_counts[district_key(district), status] += n
+
+    officer_ids = set(User.objects.filter(role='officer').values_list('id', flat=True))
+    officer_ids.update(officer_id for officer_id, _ in officer_counts)
+    districts = {district for district, _ in district_counts}
+    with transaction.atomic():
+        OfficerWorkload.objects.exclude(officer_id__in=officer_ids).update(
+            open_count=0, pending_count=0, in_progress_count=0
+        )
+        for officer_id in officer_ids:
+            pending = officer_counts[officer_id, 'pending']
+            in_progress = officer_counts[officer_id, 'in_progress']
+            OfficerWorkload.objects.update_or_create(
+                officer_id=officer_id,
+                defaults={
+                    'open_count': pending + in_progress,
+                    'pending_count': pending,
+                    'in_progress_count': in_progress,
+                },
+            )
+        DistrictBacklog.objects.exclude(district__in=districts).update(pending_count=0, in_progress_count=0)
+        for district in districts:
+            DistrictBacklog.objects.update_or_create(
+                district=district,
+                defaults={
+                    'pending_count': district_counts[district, 'pending'],
+                    'in_progress_count': district_counts[district, 'in_progress'],
+                },
+            )
+
+
+def rebalance_district(district: str, dry_run: bool = False,
+                       complaint_ids: Optional[Iterable[int]] = None) -> Dict[int, int]:
+    """Assign every open, unassigned complaint in a district, or only those
+    among `complaint_ids`.
+
+    Uses a heap keyed on live load so each assignment is O(log officers),
+    then writes one UPDATE per officer. Returns {officer_id: assigned}.
+    """
+    officers = district_officers(district)
+    if not officers:
+        return {}
+    categories = {officer_id: set(cats) for officer_id, _, cats in officers}
+    loads = {officer_id: open_count for officer_id, open_count, _ in officers}
+
+    pending = Complaint.objects.filter(
+        district__iexact=district, status__in=OPEN_STATUSES, assigned_officer__isnull=True
+    )
+    if complaint_ids is not None:
+        pending = pending.filter(id__in=list(complaint_ids))
+    pending = list(pending.order_by('created_at').values_list('id', 'category', 'status'))
+
+    # One heap per category lets specialists be compared fairly against
+    # generalists without rescanning every officer.
+    heaps = {}
+    assignments: Dict[int, List[int]] = {}
+    statuses = {complaint_id: status for complaint_id, _, status in pending}
+    for complaint_id, category, _ in pending:
+        heap = heaps.get(category)
+        if heap is None:
+            heap = [(score(loads[o], categories[o], category), o) for o in loads]
+            heapq.heapify(heap)
+            heaps[category] = heap
+        # Entries go stale when another category's heap assigns to the same
+        # officer; refresh lazily.
+        while True:
+            entry_score, officer_id = heap[0]
+            current = score(loads[officer_id], categories[officer_id], category)
+            if current == entry_score:
+                break
+            heapq.heapreplace(heap, (current, officer_id))
+        heapq.heapreplace(heap, (current + 1, officer_id))
+        loads[officer_id] += 1
+        assignments.setdefault(officer_id, []).append(complaint_id)
+
+    if not dry_run:
+        with transaction.atomic():
+            deltas = Counter()
+            for officer_id, complaint_ids in assignments.items():
+                # Skip anything assigned by someone else since we read it
+                claimed = list(
+                    Complaint.objects
+                    .select_for_update()
+                    .filter(id__in=complaint_ids, assigned_officer__isnull=True)
+                    .values_list('id', flat=True)
+                )
+                Complaint.objects.filter(id__in=claimed).update(
+                    assigned_officer_id=officer_id, updated_at=timezone.now(), version=F('version') + 1
+                )
+                audit = ComplaintUpdate.objects.bulk_create([
+                    ComplaintUpdate(
+                        complaint_id=complaint_id,
+                        updated_by=None,
+                        old_status=statuses[complaint_id],
+                        new_status=statuses[complaint_id],
+                        comment='Automatically routed',
+                    )
+                    for complaint_id in claimed
+                ])
+                owners = Complaint.objects.filter(id__in=claimed).values_list('id', 'citizen_id', 'district')
+                publish_updates(audit, {pk: (citizen_id, district) for pk, citizen_id, district in owners})
+                assignments[officer_id] = claimed
+                for complaint_id in claimed:
+                    # Moves from the district backlog to the officer's queue
+                    deltas[workload_key(None, statuses[complaint_id], district)] -= 1
+                    deltas[workload_key(officer_id, statuses[complaint_id], district)] += 1
+            apply_workload_deltas(deltas)
+
+    return {officer_id: len(ids) for officer_id, ids in assignments.items()}
@@ -0,0 +1,54 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db import connection
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast
+from rest_framework import filters
+
+# Complaints mix English and Devanagari. The 'english' config stems English
+# words, while 'simple' keeps every token verbatim so Hindi words (which the
+# English stemmer does not understand) still match exactly.
+SEARCH_CONFIGS = ('english', 'simple')
+
+
+def build_search_query(text):
+    query = None
+    for config in SEARCH_CONFIGS:
+        part = SearchQuery(text, config=config, search_type='websearch')
+        query = part if query is None else query | part
+    return query
+
+
+def search_complaints(queryset, text):
+    """Full-text search over the stored `search_vector`, ranked by relevance.
+
+    Titles that are a close trigram match are also returned so that typos
+    ("strret light") still find something; they rank below real matches.
+    """
+    query = build_search_query(text)
+    rank = SearchRank(F('search_vector'), query) + TrigramWordSimilarity(text, 'title')
+    return (
+        queryset
+        .filter(Q(search_vector=query) | Q(title__trigram_word_similar=text))
+        # Cast to double so ranks survive a round trip through a cursor
+        .annotate(rank=Cast(rank, FloatField()))
+        .order_by('-rank')
+    )
+
+
+class ComplaintSearchFilter(filters.SearchFilter):
+    """Drop-in replacement for SearchFilter backed by PostgreSQL FTS.
+
+    Falls back to SearchFilter's ILIKE matching on other databases.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        # Archived complaints carry no search vector; ILIKE is fine for
+        # occasional lookups in cold storage
+        has_vector = any(f.name == 'search_vector' for f in queryset.model._meta.fields)
+        if connection.vendor != 'postgresql' or not has_vector:
+            return super().filter_queryset(request, queryset, view)
+
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        return search_complaints(queryset, ' '.join(terms))
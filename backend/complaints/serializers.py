@@ -1,26 +1,32 @@
 from rest_framework import serializers
 from .models import Complaint,ComplaintUpdate
+from users.models import User
 from users.serializers import UserSerializer
+from .images import thumbnail_urls
 
 class ComplaintSerializer(serializers.ModelSerializer):
     citizen_details = UserSerializer(source='citizen', read_only=True)
     officer_details = UserSerializer(source='assigned_officer', read_only=True)
     resolution_time = serializers.SerializerMethodField()
+    thumbnails = serializers.SerializerMethodField()
     
     class Meta:
         model = Complaint
         fields = [
-            'id', 'title', 'description', 'category', 'status', 'priority',
-            'latitude', 'longitude', 'address', 'district','image',
+            'id', 'title', 'description', 'category', 'status', 'version', 'priority',
+            'latitude', 'longitude', 'address', 'district','image', 'thumbnails',
             'citizen', 'citizen_details', 'assigned_officer', 'officer_details',
             'created_at', 'updated_at', 'resolved_at',
             'rating', 'feedback', 'officer_notes', 'resolution_time'
         ]
-        read_only_fields = ['id', 'citizen', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'citizen', 'version', 'created_at', 'updated_at']
     
     def get_resolution_time(self, obj):
         return obj.get_resolution_time()
     
+    def get_thumbnails(self, obj):
+        return thumbnail_urls(obj, self.context.get('request'))
+    
     def create(self, validated_data):
         validated_data['citizen'] = self.context['request'].user
         return super().create(validated_data)
@@ -28,17 +34,21 @@ class ComplaintSerializer(serializers.ModelSerializer):
 class ComplaintListSerializer(serializers.ModelSerializer):
     citizen_name = serializers.CharField(source='citizen.get_full_name', read_only=True)
     officer_name = serializers.CharField(source='assigned_officer.get_full_name', read_only=True)
+    thumbnails = serializers.SerializerMethodField()
     
     class Meta:
         model = Complaint
         fields = [
             'id', 'title', 'category', 'status',
             'latitude', 'longitude', 'address',
-            'citizen_name', 'created_at', 'officer_name'
+            'citizen_name', 'created_at', 'officer_name', 'thumbnails'
         ]
+    
+    def get_thumbnails(self, obj):
+        return thumbnail_urls(obj, self.context.get('request'))
 
 class ComplaintUpdateSerializer(serializers.ModelSerializer):
-    updated_by_name = serializers.CharField(source='updated_by.get_full_name', read_only=True)
+    updated_by_name = serializers.CharField(source='updated_by.get_full_name', read_only=True, allow_null=True)
 
     class Meta: 
         model = ComplaintUpdate
@@ -46,4 +56,41 @@ class ComplaintUpdateSerializer(serializers.ModelSerializer):
 
 class ComplaintRatingSerializer(serializers.Serializer):
     rating = serializers.IntegerField(min_value=1, max_value=5, required=True)
-    feedback = serializers.CharField(required=False, allow_blank=True)
\ No newline at end of file
+    feedback = serializers.CharField(required=False, allow_blank=True)
+
+class ComplaintIngestSerializer(serializers.ModelSerializer):
+    client_key = serializers.CharField(max_length=64, required=False)
+
+    class Meta:
+        model = Complaint
+        fields = [
+            'client_key', 'title', 'description', 'category', 'priority',
+            'latitude', 'longitude', 'address', 'district'
+        ]
+
+class ComplaintBulkUpdateSerializer(serializers.Serializer):
+    FILTER_FIELDS = ['category', 'status', 'priority', 'district']
+    MAX_IDS = 5000
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, allow_empty=False, max_length=MAX_IDS
+    )
+    filters = serializers.DictField(child=serializers.CharField(), required=False, allow_empty=False)
+    status = serializers.ChoiceField(choices=Complaint.STATUS_CHOICES, required=False)
+    assigned_officer = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.filter(role='officer'), required=False, allow_null=True
+    )
+    officer_notes = serializers.CharField(required=False, allow_blank=True)
+
+    def validate_filters(self, value):
+        unknown = set(value) - set(self.FILTER_FIELDS)
+        if unknown:
+            raise serializers.ValidationError(f"Unsupported filter fields: {', '.join(sorted(unknown))}")
+        return value
+
+    def validate(self, attrs):
+        if ('ids' in attrs) == ('filters' in attrs):
+            raise serializers.ValidationError("Provide exactly one of 'ids' or 'filters'.")
+        if not {'status', 'assigned_officer', 'officer_notes'} & set(attrs):
+            raise serializers.ValidationError("Nothing to update.")
+        return attrs
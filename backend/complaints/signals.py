@@ -0,0 +1,59 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from .conditional import invalidate_cached_detail
+from .events import publish_updates
+from .models import Complaint, ComplaintUpdate
+from .routing import workload_key, workload_transition
+
+_UNKNOWN = object()
+
+
+@receiver(post_init, sender=Complaint)
+def remember_workload_key(sender, instance, **kwargs):
+    # Deferred fields would cost a query to read; treat them as unknown
+    fields = instance.__dict__
+    if {'assigned_officer_id', 'status', 'district'} <= fields.keys():
+        instance._workload_key = workload_key(
+            fields['assigned_officer_id'], fields['status'], fields['district']
+        )
+    else:
+        instance._workload_key = _UNKNOWN
+
+
+@receiver(post_save, sender=Complaint)
+def update_workload_on_save(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and not {'assigned_officer', 'status', 'district'} & set(update_fields):
+        return
+    old_key = None if created else instance._workload_key
+    if old_key is _UNKNOWN:
+        return
+    new_key = workload_key(instance.assigned_officer_id, instance.status, instance.district)
+    workload_transition(old_key, new_key)
+    instance._workload_key = new_key
+
+
+@receiver(post_delete, sender=Complaint)
+def update_workload_on_delete(sender, instance, **kwargs):
+    if instance._workload_key is not _UNKNOWN:
+        workload_transition(instance._workload_key, None)
+
+
+@receiver(post_save, sender=Complaint)
+@receiver(post_delete, sender=Complaint)
+def drop_cached_detail(sender, instance, **kwargs):
+    invalidate_cached_detail(instance.pk)
+
+
+@receiver(post_save, sender=ComplaintUpdate)
+def publish_complaint_update(sender, instance, created, **kwargs):
+    if not created:
+        return
+    if ComplaintUpdate.complaint.is_cached(instance):
+        owner = (instance.complaint.citizen_id, instance.complaint.district)
+    else:
+        owner = Complaint.objects.filter(pk=instance.complaint_id).values_list(
+            'citizen_id', 'district'
+        ).first()
+    if owner is not None:
+        publish_updates([instance], {instance.complaint_id: owner})
@@ -0,0 +1,48 @@
+# Server-Sent Events endpoint; serve under ASGI (backend.asgi) so idle
+# streams cost a coroutine rather than a worker thread
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+
+from .auth import authenticate_request
+from .events import ALL_CHANNEL, citizen_channel, district_channel, get_broker
+
+
+def _channels_for(user, request):
+    if user.role != 'officer':
+        return [citizen_channel(user.pk)]
+    district = request.GET.get('district') or user.district
+    return [district_channel(district)] if district else [ALL_CHANNEL]
+
+
+async def complaint_events(request):
+    # EventSource cannot set headers, so also accept ?token=<access token>
+    user = await sync_to_async(authenticate_request)(request, allow_query_token=True)
+    if user is None:
+        return JsonResponse({'error': 'Authentication required'}, status=401)
+
+    broker = get_broker()
+    subscription = broker.subscribe(_channels_for(user, request))
+    keepalive = settings.COMPLAINT_EVENTS_KEEPALIVE
+
+    async def stream():
+        try:
+            yield 'retry: 5000\n\n'
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ': keep-alive\n\n'
+                    continue
+                yield f'event: complaint_update\ndata: {json.dumps(event)}\n\n'
+        finally:
+            broker.unsubscribe(subscription)
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
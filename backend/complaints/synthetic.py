@@ -0,0 +1,289 @@
+# Synthetic users, complaints and status histories for load testing
+import random
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+
+import numpy as np
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from users.models import User
+from .geo import encode_cells
+from .models import Complaint, ComplaintUpdate, OfficerWorkload
+from .priority import bucket, compute_scores, keyword_signal
+from .routing import recount_workloads
+
+# (district, centre latitude, centre longitude, relative share of complaints)
+DISTRICTS = [
+    ('Raipur', 21.2514, 81.6296, 14),
+    ('Durg', 21.1904, 81.2849, 10),
+    ('Bilaspur', 22.0797, 82.1409, 9),
+    ('Korba', 22.3595, 82.7501, 6),
+    ('Rajnandgaon', 21.0974, 81.0337, 5),
+    ('Raigarh', 21.8974, 83.3950, 5),
+    ('Janjgir-Champa', 22.0093, 82.5780, 4),
+    ('Bastar', 19.0748, 82.0080, 4),
+    ('Surguja', 23.1186, 83.1958, 4),
+    ('Mahasamund', 21.1074, 82.0948, 3),
+    ('Dhamtari', 20.7070, 81.5497, 3),
+    ('Kabirdham', 22.0140, 81.2300, 3),
+    ('Balod', 20.7300, 81.2047, 3),
+    ('Baloda Bazar', 21.6566, 82.1605, 3),
+    ('Bemetara', 21.7150, 81.5340, 2),
+    ('Mungeli', 22.0660, 81.6850, 2),
+    ('Kanker', 20.2719, 81.4912, 2),
+    ('Jashpur', 22.8860, 84.1380, 2),
+    ('Gariaband', 20.6340, 82.0610, 2),
+    ('Dantewada', 18.8960, 81.3500, 1),
+]
+STATE_BOUNDS = (17.78, 80.25, 24.10, 84.40)  # min_lat, min_lng, max_lat, max_lng
+SPREAD_DEGREES = 0.08
+
+CATEGORY_SHARES = {
+    'water': 20, 'roads': 18, 'garbage': 15, 'electricity': 12,
+    'sanitation': 10, 'drainage': 10, 'streetlight': 10, 'other': 5,
+}
+STATUS_SHARES = {'pending': 35, 'in_progress': 25, 'resolved': 32, 'rejected': 8}
+
+# English, Hindi and Hinglish phrasings per category, mixed the way
+# citizens actually write them
+TITLES = {
+    'water': [
+        'No water supply since {days} days', 'Dirty water coming from tap',
+        '{days} दिन से पानी नहीं आ रहा', 'नल से गंदा पानी आ रहा है',
+        'Pani ki supply band hai', 'Pipeline leak on main road',
+    ],
+    'roads': [
+        'Big pothole near {place}', 'Road broken after rain',
+        '{place} के पास सड़क पर गड्ढा', 'सड़क पूरी तरह टूट गई है',
+        'Sadak mein bade gaddhe hain', 'Road repair work left incomplete',
+    ],
+    'garbage': [
+        'Garbage not collected for {days} days', 'Overflowing dustbin at {place}',
+        '{days} दिन से कचरा नहीं उठाया गया', '{place} में कचरे का ढेर',
+        'Kachra gaadi nahi aa rahi', 'Garbage burning near houses',
+    ],
+    'electricity': [
+        'Power cut for {days} days', 'Live wire hanging near {place}',
+        '{days} दिन से बिजली नहीं है', 'बिजली का तार टूटकर गिरा है',
+        'Transformer kharab ho gaya', 'Frequent voltage fluctuation',
+    ],
+    'sanitation': [
+        'Public toilet not cleaned', 'Open defecation near {place}',
+        'सार्वजनिक शौचालय गंदा है', '{place} में सफाई नहीं होती',
+        'Safai karmchari nahi aate', 'Stray animals and filth on street',
+    ],
+    'drainage': [
+        'Drain blocked near {place}', 'Sewage overflowing on road',
+        'नाली जाम है, पानी भर रहा है', 'सड़क पर गंदा पानी बह रहा है',
+        'Naali saaf nahi hui', 'Waterlogging after every rain',
+    ],
+    'streetlight': [
+        'Streetlight not working at {place}', 'Street lights off for {days} days',
+        '{place} में स्ट्रीट लाइट बंद है', 'रात में अंधेरा रहता है, लाइट खराब',
+        'Light khambha toot gaya', 'Streetlight stays on during the day',
+    ],
+    'other': [
+        'Encroachment on footpath at {place}', 'Stray dogs menace',
+        '{place} में अतिक्रमण', 'आवारा कुत्तों का आतंक',
+        'Noise pollution at night', 'Illegal parking blocking road',
+    ],
+}
+DESCRIPTIONS = [
+    'Residents of {place} have complained many times but nothing has been done.',
+    'Problem is getting worse every day, please take urgent action.',
+    'Children and elderly people are facing a lot of difficulty.',
+    '{place} के निवासी कई बार शिकायत कर चुके हैं, कोई सुनवाई नहीं हुई।',
+    'कृपया जल्द से जल्द समस्या का समाधान करें।',
+    'Bahut dikkat ho rahi hai, jaldi theek karwaiye.',
+    'This is near the school, there is a risk of accident.',
+    'Yeh samasya {days} din se hai, koi nahi aaya.',
+]
+PLACES = [
+    'Gandhi Chowk', 'Station Road', 'Shanti Nagar', 'Ward {ward}', 'Bus Stand',
+    'Main Market', 'Civil Lines', 'Sector {ward}', 'Tikrapara', 'Nehru Nagar',
+    'गांधी चौक', 'बस स्टैंड', 'पुराना बाजार',
+]
+FIRST_NAMES = ['Ramesh', 'Sunita', 'Anil', 'Priya', 'Mahesh', 'Kavita', 'Sanjay', 'Pooja', 'Deepak', 'Anita',
+               'राजेश', 'सीमा', 'Vikas', 'Neha', 'Manoj', 'Rekha', 'Ashok', 'Lata', 'Suresh', 'Geeta']
+LAST_NAMES = ['Sahu', 'Verma', 'Yadav', 'Patel', 'Sharma', 'Sinha', 'Netam', 'Dewangan', 'Chandrakar',
+              'Tiwari', 'Kashyap', 'Markam', 'Nishad', 'Dhruw', 'साहू', 'वर्मा']
+RESOLUTION_COMMENTS = ['Work completed', 'Issue resolved by field team', 'कार्य पूर्ण', 'Problem theek kar di gayi']
+REJECTION_COMMENTS = ['Duplicate complaint', 'Outside municipal limits', 'अधिकार क्षेत्र से बाहर']
+
+
+def _choices(rng, shares, k):
+    names = list(shares)
+    return rng.choices(names, weights=[shares[n] for n in names], k=k)
+
+
+def _place(rng):
+    return rng.choice(PLACES).format(ward=rng.randint(1, 70))
+
+
+def _fill(rng, template):
+    return template.format(place=_place(rng), days=rng.randint(2, 15))
+
+
+@contextmanager
+def manual_timestamps(*fields):
+    """Let bulk_create keep the created_at/updated_at values we generate.
+
+    Changes the fields process-wide; only for commands, never in a server.
+    """
+    saved = [(f, f.auto_now, f.auto_now_add) for f in fields]
+    for f in fields:
+        f.auto_now = f.auto_now_add = False
+    try:
+        yield
+    finally:
+        for f, auto_now, auto_now_add in saved:
+            f.auto_now, f.auto_now_add = auto_now, auto_now_add
+
+
+def create_users(count, role, rng, tag, batch_size):
+    """Bulk-create `count` users sharing one password hash; returns their ids."""
+    password = make_password('synthetic')
+    districts = [d[0] for d in DISTRICTS]
+    weights = [d[3] for d in DISTRICTS]
+    ids = []
+    for start in range(0, count, batch_size):
+        users = [
+            User(
+                username=f'syn_{tag}_{role}_{n}',
+                email=f'syn_{tag}_{role}_{n}@example.invalid',
+                password=password,
+                first_name=rng.choice(FIRST_NAMES),
+                last_name=rng.choice(LAST_NAMES),
+                role=role,
+                # Every district gets officers before any gets a second one
+                district=districts[n % len(districts)] if role == 'officer' else rng.choices(districts, weights)[0],
+                phone=f'9{rng.randint(100000000, 999999999)}',
+            )
+            for n in range(start, min(start + batch_size, count))
+        ]
+        ids.extend(u.pk for u in User.objects.bulk_create(users))
+    return ids
+
+
+def create_complaints(count, citizen_ids, officers_by_district, rng, days, batch_size):
+    """Bulk-create `count` complaints with their status-change history.
+
+    Returns (complaints created, updates created).
+    """
+    np_rng = np.random.default_rng(rng.randrange(2 ** 32))
+    now = timezone.now()
+    fields = [
+        Complaint._meta.get_field('created_at'),
+        Complaint._meta.get_field('updated_at'),
+        ComplaintUpdate._meta.get_field('created_at'),
+    ]
+    min_lat, min_lng, max_lat, max_lng = STATE_BOUNDS
+    district_weights = [d[3] for d in DISTRICTS]
+    created = updates = 0
+
+    with manual_timestamps(*fields):
+        for start in range(0, count, batch_size):
+            size = min(batch_size, count - start)
+            districts = rng.choices(DISTRICTS, district_weights, k=size)
+            lats = np.clip([d[1] for d in districts] + np_rng.normal(0, SPREAD_DEGREES, size), min_lat, max_lat)
+            lngs = np.clip([d[2] for d in districts] + np_rng.normal(0, SPREAD_DEGREES, size), min_lng, max_lng)
+            cells = encode_cells(lats, lngs)
+            categories = _choices(rng, CATEGORY_SHARES, size)
+            statuses = _choices(rng, STATUS_SHARES, size)
+            titles = [_fill(rng, rng.choice(TITLES[c])) for c in categories]
+            descriptions = [_fill(rng, rng.choice(DESCRIPTIONS)) for _ in range(size)]
+            # Ages skew recent, like a growing user base
+            ages = np.minimum(np_rng.exponential(days / 3, size), days)
+            scores = compute_scores(categories, np.zeros(size), np.zeros(size), ages, keyword_signal(titles))
+            bands = bucket(scores)
+
+            complaints, histories = [], []
+            for n in range(size):
+                name = districts[n][0]
+                created_at = now - timedelta(days=float(ages[n]))
+                status = statuses[n]
+                officers = officers_by_district.get(name)
+                officer_id = None
+                if officers and (status != 'pending' or rng.random() < 0.5):
+                    officer_id = rng.choice(officers)
+                history = []
+                if status != 'pending' and officer_id:
+                    elapsed = min(rng.expovariate(1 / 72), (now - created_at).total_seconds() / 3600)
+                    started = created_at + timedelta(hours=elapsed / 3)
+                    history.append(('pending', 'in_progress', started, 'Work started / कार्य शुरू'))
+                    if status in ('resolved', 'rejected'):
+                        comment = rng.choice(RESOLUTION_COMMENTS if status == 'resolved' else REJECTION_COMMENTS)
+                        history.append(('in_progress', status, created_at + timedelta(hours=elapsed), comment))
+                elif status != 'pending':
+                    # Closed without an officer: a single direct transition
+                    history.append(('pending', status, min(created_at + timedelta(hours=1), now), ''))
+                updated_at = history[-1][2] if history else created_at
+                complaints.append(Complaint(
+                    title=titles[n][:200],
+                    description=descriptions[n],
+                    category=categories[n],
+                    status=status,
+                    priority=str(bands[n]),
+                    priority_score=float(scores[n]),
+                    latitude=round(float(lats[n]), 6),
+                    longitude=round(float(lngs[n]), 6),
+                    address=_place(rng),
+                    district=name,
+                    geo_cell=int(cells[n]),
+                    citizen_id=rng.choice(citizen_ids),
+                    assigned_officer_id=officer_id,
+                    created_at=created_at,
+                    updated_at=updated_at,
+                    resolved_at=updated_at if status == 'resolved' else None,
+                    rating=rng.randint(1, 5) if status == 'resolved' and rng.random() < 0.4 else None,
+                ))
+                histories.append((history, officer_id))
+
+            with transaction.atomic():
+                Complaint.objects.bulk_create(complaints)
+                rows = [
+                    ComplaintUpdate(
+                        complaint_id=complaint.pk,
+                        updated_by_id=officer_id or complaint.citizen_id,
+                        old_status=old, new_status=new, comment=comment, created_at=at,
+                    )
+                    for complaint, (history, officer_id) in zip(complaints, histories)
+                    for old, new, at, comment in history
+                ]
+                ComplaintUpdate.objects.bulk_create(rows, batch_size=batch_size)
+            created += size
+            updates += len(rows)
+    return created, updates
+
+
+def seed(citizens, officers, complaints, days=365, seed=None, batch_size=5000):
+    """Generate a synthetic dataset; returns counts of what was created.
+
+    New users get a random tag in their username so repeated runs add to
+    the data instead of colliding.
+    """
+    rng = random.Random(seed)
+    tag = uuid.UUID(int=rng.getrandbits(128)).hex[:8]
+    new_citizens = create_users(citizens, 'citizen', rng, tag, batch_size)
+    officer_ids = create_users(officers, 'officer', rng, tag, batch_size)
+    citizen_ids = new_citizens or list(User.objects.filter(role='citizen').values_list('id', flat=True))
+    if complaints and not citizen_ids:
+        raise ValueError('Need at least one citizen to file complaints')
+
+    officers_by_district = {}
+    for officer_id, district in User.objects.filter(role='officer', is_active=True).values_list('id', 'district'):
+        officers_by_district.setdefault(district, []).append(officer_id)
+    categories = list(CATEGORY_SHARES)
+    OfficerWorkload.objects.bulk_create([
+        OfficerWorkload(officer_id=officer_id, categories=rng.sample(categories, 2))
+        for officer_id in officer_ids
+    ])
+
+    created, updates = create_complaints(complaints, citizen_ids, officers_by_district, rng, days, batch_size)
+    # bulk_create skips the signals that maintain the queue counters
+    recount_workloads()
+    return {'citizens': len(new_citizens), 'officers': len(officer_ids),
+            'complaints': created, 'updates': updates}
@@ -0,0 +1,44 @@
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from complaints.archive import archive_batch, archive_cutoff
+from complaints.models import Complaint
+from users.models import User
+
+
+@override_settings(COMPLAINT_AUTO_ROUTING=False, COMPLAINT_DETAIL_CACHE_TIMEOUT=0)
+class ArchivedReadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.citizen = User.objects.create_user('citizen', password='x')
+        cls.other = User.objects.create_user('other', password='x')
+        cls.officer = User.objects.create_user('officer', password='x', role='officer')
+        make = lambda status: Complaint.objects.create(
+            title=f'{status} complaint', description='Water pipe leaking', category='water',
+            latitude=21.255, longitude=81.635, citizen=cls.citizen, status=status,
+        )
+        cls.archived, cls.open = make('resolved'), make('submitted')
+        archive_batch(archive_cutoff(days=0))
+
+    def get(self, user, url, **params):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client.get(url, params)
+
+    def test_detail_falls_back_to_archive(self):
+        for url in (f'/api/complaints/detail/{self.archived.pk}/', f'/api/complaints/v2/{self.archived.pk}/'):
+            with self.subTest(url=url):
+                for user in (self.citizen, self.officer):
+                    response = self.get(user, url)
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(response.json()['id'], self.archived.pk)
+                self.assertEqual(self.get(self.other, url).status_code, 404)
+
+    def test_list_archived(self):
+        for url in ('/api/complaints/list/', '/api/complaints/v2/'):
+            with self.subTest(url=url):
+                ids = [c['id'] for c in self.get(self.citizen, url).json()['results']]
+                self.assertEqual(ids, [self.open.pk])
+                ids = [c['id'] for c in self.get(self.citizen, url, archived='true').json()['results']]
+                self.assertEqual(ids, [self.archived.pk])
+                self.assertEqual(self.get(self.other, url, archived='true').json()['results'], [])
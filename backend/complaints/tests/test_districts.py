@@ -0,0 +1,78 @@
+import json
+import os
+import random
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from complaints import districts
+from complaints.districts import DistrictIndex, check_district_boundaries, infer_district
+
+# Synthetic shapes, not real boundaries: Raipur is a square with a hole,
+# Durg a triangle sharing Raipur's west edge, Bastar a MultiPolygon
+FIXTURE = os.path.join(os.path.dirname(__file__), 'districts.geojson')
+
+
+class DistrictIndexTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        with open(FIXTURE, encoding='utf-8') as f:
+            cls.index = DistrictIndex.from_geojson(json.load(f))
+
+    def test_features_without_name_or_area_are_skipped(self):
+        self.assertEqual(
+            sorted(p.name for p in self.index.polygons),
+            ['Bastar', 'Bastar', 'Durg', 'Raipur'],
+        )
+
+    def test_lookup(self):
+        cases = [
+            ((21.3, 81.7), 'Raipur'),
+            ((21.22, 81.62), None),  # in Raipur's hole
+            ((21.2, 81.45), 'Durg'),
+            ((21.3, 81.25), None),  # beyond Durg's hypotenuse
+            ((19.1, 82.0), 'Bastar'),
+            ((19.05, 82.25), 'Bastar'),  # second part
+            ((19.15, 82.25), None),
+            ((20.05, 80.05), None),  # unnamed feature
+        ]
+        for (lat, lng), expected in cases:
+            with self.subTest(lat=lat, lng=lng):
+                self.assertEqual(self.index.lookup(lat, lng), expected)
+
+    def test_grid_lists_only_polygons_touching_each_cell(self):
+        cell = DistrictIndex._cell
+        names = lambda key: sorted(self.index.polygons[i].name for i in self.index.grid[key])
+        self.assertEqual(names((cell(81.7), cell(21.3))), ['Raipur'])
+        # The column on the shared edge holds both neighbours
+        self.assertEqual(names((cell(81.5), cell(21.3))), ['Durg', 'Raipur'])
+        self.assertNotIn((cell(81.0), cell(21.3)), self.index.grid)
+
+    def test_grid_agrees_with_testing_every_polygon(self):
+        rng = random.Random(7)
+        for _ in range(2000):
+            lat, lng = rng.uniform(18.9, 21.5), rng.uniform(81.1, 82.4)
+            expected = next((p.name for p in self.index.polygons if p.contains(lng, lat)), None)
+            self.assertEqual(self.index.lookup(lat, lng), expected, (lat, lng))
+
+
+@override_settings(DISTRICT_BOUNDARIES_FILE=FIXTURE)
+@mock.patch.object(districts, '_index', None)
+class InferDistrictTests(SimpleTestCase):
+    def test_loads_boundaries_from_settings(self):
+        self.assertEqual(infer_district('21.3', '81.7'), 'Raipur')
+        self.assertIsNone(infer_district(None, 81.7))
+
+    @override_settings(DISTRICT_BOUNDARIES_FILE='')
+    def test_empty_setting_turns_lookup_off(self):
+        self.assertIsNone(infer_district('21.3', '81.7'))
+
+
+class BoundariesCheckTests(SimpleTestCase):
+    def test_warns_when_configured_file_is_missing(self):
+        with override_settings(DISTRICT_BOUNDARIES_FILE=FIXTURE + '.missing'):
+            self.assertEqual([w.id for w in check_district_boundaries(None)], ['complaints.W001'])
+        for path in (FIXTURE, ''):
+            with self.subTest(path=path), override_settings(DISTRICT_BOUNDARIES_FILE=path):
+                self.assertEqual(check_district_boundaries(None), [])
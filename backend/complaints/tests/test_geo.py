@@ -0,0 +1,57 @@
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from complaints.models import Complaint
+from users.models import User
+
+
+@override_settings(COMPLAINT_AUTO_ROUTING=False)
+class NearbyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.officer = User.objects.create_user('officer', password='x', role='officer')
+        # Created oldest first, so the closest point is the oldest one
+        cls.close, cls.middle, cls.far = (
+            Complaint.objects.create(
+                title=f'Complaint {n}', description='Water pipe leaking', category='water',
+                latitude=21.255 + offset, longitude=81.635, citizen=cls.officer,
+            )
+            for n, offset in enumerate((0.0001, 0.002, 0.004))
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.officer)
+
+    def nearby(self, **params):
+        return self.client.get('/api/complaints/v2/nearby/', params)
+
+    def ids(self, response):
+        self.assertEqual(response.status_code, 200)
+        return [item['id'] for item in response.json()['results']]
+
+    def test_radius_is_closest_first_and_limited(self):
+        response = self.nearby(lat=21.255, lng=81.635, radius=1000, limit=2)
+        self.assertEqual(self.ids(response), [self.close.pk, self.middle.pk])
+        response = self.nearby(lat=21.255, lng=81.635, radius=300)
+        self.assertEqual(self.ids(response), [self.close.pk, self.middle.pk])
+
+    def test_bbox_sorts_before_limiting(self):
+        response = self.nearby(bbox='81.63,21.2501,81.64,21.2601', limit=1)
+        self.assertEqual(self.ids(response), [self.close.pk])
+
+    def test_rejects_bad_coordinates(self):
+        for params in (
+            {'lat': 'nan', 'lng': '81.635'},
+            {'lat': 'inf', 'lng': '81.635'},
+            {'lat': '21.255', 'lng': '-inf'},
+            {'lat': '21.255', 'lng': '81.635', 'radius': 'nan'},
+            {'lat': '21.255', 'lng': '81.635', 'radius': '-5'},
+            {'lat': '91', 'lng': '81.635'},
+            {'lat': '21.255', 'lng': '181'},
+            {'bbox': '81.63,nan,81.64,21.26'},
+            {'bbox': '81.63,21.25,81.64,95'},
+            {'bbox': '81.64,21.25,81.63,21.26'},
+        ):
+            with self.subTest(params=params):
+                self.assertEqual(self.nearby(**params).status_code, 400)
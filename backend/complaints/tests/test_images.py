@@ -0,0 +1,87 @@
+import shutil
+import tempfile
+from io import BytesIO
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from complaints.images import process_complaint_image
+from complaints.models import Complaint
+from users.models import User
+
+GPS_IFD = 0x8825
+
+
+def photo(name='photo.jpg', color='red'):
+    # Noise saved at low quality, so the re-encode is not smaller than the upload
+    exif = Image.Exif()
+    exif[0x010F] = 'PhoneMaker'
+    exif[GPS_IFD] = {1: 'N', 2: (21.0, 15.0, 0.0), 3: 'E', 4: (81.0, 38.0, 0.0)}
+    buffer = BytesIO()
+    image = Image.merge('RGB', [Image.effect_noise((128, 128), 64)] * 3)
+    Image.blend(image, Image.new('RGB', image.size, color), 0.5).save(buffer, 'JPEG', quality=10, exif=exif)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+
+class ComplaintImageTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root, COMPLAINT_AUTO_ROUTING=False)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.citizen = User.objects.create_user('citizen', password='x')
+        self.complaint = Complaint.objects.create(
+            title='Pothole', description='Deep pothole', category='roads',
+            latitude=21.25, longitude=81.63, citizen=self.citizen, image=photo(),
+        )
+
+    def stored_exif(self):
+        self.complaint.refresh_from_db()
+        with self.complaint.image.open('rb') as f, Image.open(f) as image:
+            return dict(image.getexif())
+
+    def test_metadata_is_stripped_even_when_not_smaller(self):
+        self.assertIn(GPS_IFD, self.stored_exif())
+        before, after = process_complaint_image(self.complaint.pk)
+        self.assertGreaterEqual(after, before)
+        self.assertEqual(self.stored_exif(), {})
+        self.assertEqual(set(self.complaint.thumbnails), {'small', 'medium', 'large'})
+
+    def test_replaced_photo_is_processed_again(self):
+        process_complaint_image(self.complaint.pk)
+        self.complaint.refresh_from_db()
+        old_thumbnails = self.complaint.thumbnails
+
+        client = APIClient()
+        client.force_authenticate(self.citizen)
+        response = client.patch(
+            f'/api/complaints/v2/{self.complaint.pk}/', {'image': photo('new.jpg', 'blue')},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.complaint.refresh_from_db()
+        self.assertEqual(self.complaint.thumbnails, {})
+
+        self.assertIsNotNone(process_complaint_image(self.complaint.pk))
+        self.assertEqual(self.stored_exif(), {})
+        self.assertNotEqual(self.complaint.thumbnails, old_thumbnails)
+
+    def test_photo_replaced_during_processing_is_left_alone(self):
+        storage = Complaint._meta.get_field('image').storage
+        size = storage.size
+
+        def replace_then_size(name):
+            # Another request swaps the photo after processing has started
+            Complaint.objects.filter(pk=self.complaint.pk).update(image='complaints/new.jpg', thumbnails={})
+            return size(name)
+
+        with mock.patch.object(storage, 'size', side_effect=replace_then_size):
+            self.assertIsNone(process_complaint_image(self.complaint.pk))
+        self.complaint.refresh_from_db()
+        self.assertEqual(self.complaint.image.name, 'complaints/new.jpg')
+        self.assertEqual(self.complaint.thumbnails, {})
@@ -0,0 +1,56 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from complaints import ingest
+from complaints.ingest import ingest_complaints
+from complaints.models import Complaint, DistrictBacklog
+from users.models import User
+
+
+def row(key, **extra):
+    return {
+        'client_key': key, 'title': 'Broken streetlight', 'description': 'Dark road at night',
+        'category': 'streetlight', 'latitude': 21.25, 'longitude': 81.63, 'district': 'Raipur', **extra,
+    }
+
+
+@override_settings(COMPLAINT_AUTO_ROUTING=True)
+class IngestTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.citizen = User.objects.create_user('citizen', password='x')
+        cls.officer = User.objects.create_user('officer', password='x', role='officer', district='Raipur')
+
+    def backlog(self):
+        return DistrictBacklog.objects.get(district='raipur').pending_count
+
+    def test_routes_only_this_batchs_complaints(self):
+        earlier = Complaint.objects.create(citizen=self.citizen, **{
+            k: v for k, v in row(None).items() if k != 'client_key'
+        })
+        result = ingest_complaints(self.citizen, [row('a')])
+        self.assertEqual(result['created'], 1)
+        created = Complaint.objects.get(pk=result['results'][0]['id'])
+        self.assertEqual(created.assigned_officer, self.officer)
+        earlier.refresh_from_db()
+        self.assertIsNone(earlier.assigned_officer)
+        self.assertEqual(self.backlog(), 1)
+
+    def test_concurrent_duplicate_is_not_counted_as_created(self):
+        encode_cells = ingest.encode_cells
+        competing = []
+
+        def insert_then_encode(*args):
+            # Another request commits the same client_key after the lookup
+            competing.append(Complaint.objects.create(citizen=self.citizen, **row('b')))
+            return encode_cells(*args)
+
+        with mock.patch.object(ingest, 'encode_cells', side_effect=insert_then_encode):
+            result = ingest_complaints(self.citizen, [row('b'), row('b')])
+
+        self.assertEqual((result['created'], result['duplicate']), (0, 2))
+        self.assertEqual({r['id'] for r in result['results']}, {competing[0].pk})
+        self.assertEqual(Complaint.objects.count(), 1)
+        # Counted once, by the competing insert, and left to its own routing
+        self.assertEqual(self.backlog(), 1)
@@ -0,0 +1,43 @@
+import base64
+import json
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from complaints.models import Complaint
+from users.models import User
+
+
+def cursor(values, ordering=('-created_at', '-id')):
+    payload = {'o': list(ordering), 'v': values}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+@override_settings(COMPLAINT_AUTO_ROUTING=False)
+class CursorPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.officer = User.objects.create_user('officer', password='x', role='officer')
+        for n in range(3):
+            Complaint.objects.create(
+                title=f'Complaint {n}', description='Water pipe leaking', category='water',
+                latitude=Decimal('21.25'), longitude=Decimal('81.63'), citizen=cls.officer,
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.officer)
+
+    def test_next_link_pages_through(self):
+        first = self.client.get('/api/complaints/v2/', {'page_size': 2}).json()
+        self.assertEqual(len(first['results']), 2)
+        second = self.client.get(first['next']).json()
+        self.assertEqual(len(second['results']), 1)
+
+    def test_tampered_cursor_is_not_found(self):
+        for values in ([{'x': 1}, 1], ['notadate', 1], ['2024-01-01T00:00:00', 'one'],
+                       [None, 1], ['2024-01-01T00:00:00', [1]], {'a': 1}):
+            with self.subTest(values=values):
+                response = self.client.get('/api/complaints/v2/', {'cursor': cursor(values)})
+                self.assertEqual(response.status_code, 404)
@@ -0,0 +1,85 @@
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from complaints.ingest import ingest_complaints
+from complaints.models import Complaint
+from complaints.priority import score_new_complaint, score_open_backlog
+from users.models import User
+
+
+class InsertTimePriorityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.citizen = User.objects.create_user('citizen', password='x')
+
+    def create(self, category, description):
+        complaint = Complaint.objects.create(
+            title='Complaint', description=description, category=category,
+            latitude=21.255, longitude=81.635, citizen=self.citizen,
+        )
+        score_new_complaint(complaint)
+        return complaint
+
+    def test_unremarkable_complaint_keeps_default_until_scored(self):
+        complaint = self.create('water', 'No supply since Monday')
+        self.assertEqual(complaint.priority, 'medium')
+        self.assertIsNone(complaint.priority_score)
+
+        # Not mistaken for a manual override by the batch scorer
+        score_open_backlog()
+        complaint.refresh_from_db()
+        self.assertIsNotNone(complaint.priority_score)
+
+    def test_urgent_complaint_is_raised_at_once(self):
+        complaint = self.create('electricity', 'Live wire hanging near the school')
+        self.assertEqual(complaint.priority, 'medium')
+        self.assertIsNotNone(complaint.priority_score)
+
+        for _ in range(10):
+            self.create('electricity', 'Power cut')
+        complaint = self.create('electricity', 'Live wire hanging near the school')
+        self.assertEqual(complaint.priority, 'high')
+
+
+@override_settings(COMPLAINT_AUTO_ROUTING=False)
+class ManualPriorityTests(TestCase):
+    """Priorities given by hand survive the batch scorer."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.citizen = User.objects.create_user('citizen', password='x')
+        cls.officer = User.objects.create_user('officer', password='x', role='officer')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.citizen)
+
+    payload = {
+        'title': 'Streetlight', 'description': 'One bulb flickers', 'category': 'streetlight',
+        'latitude': '21.255000', 'longitude': '81.635000',
+    }
+
+    def rescored(self, pk):
+        score_open_backlog()
+        return Complaint.objects.get(pk=pk).priority
+
+    def test_priority_given_at_create(self):
+        for url in ('/api/complaints/v2/', '/api/complaints/list/'):
+            with self.subTest(url=url):
+                response = self.client.post(url, {**self.payload, 'priority': 'critical'}, format='json')
+                self.assertEqual(response.status_code, 201, response.content)
+                self.assertEqual(self.rescored(response.json()['id']), 'critical')
+
+    def test_priority_given_at_ingest(self):
+        result = ingest_complaints(self.citizen, [{**self.payload, 'priority': 'critical'}])
+        self.assertEqual(self.rescored(result['results'][0]['id']), 'critical')
+
+    def test_priority_changed_by_an_officer(self):
+        # Still at the default band with no score, like any new complaint
+        pk = self.client.post('/api/complaints/v2/', self.payload, format='json').json()['id']
+        self.assertIsNone(Complaint.objects.get(pk=pk).priority_score)
+
+        self.client.force_authenticate(self.officer)
+        response = self.client.patch(f'/api/complaints/v2/{pk}/', {'priority': 'critical'}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.rescored(pk), 'critical')
@@ -0,0 +1,81 @@
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from complaints.models import Complaint, ComplaintUpdate
+from users.models import User
+
+# Queries each endpoint may run, whatever the page size. A change that
+# adds a per-row lookup makes the larger page exceed its budget; a
+# deliberate new query means raising the number here.
+BUDGETS = {
+    'list': 1,
+    'list_v1': 1,
+    'detail': 2,
+    'detail_v1': 1,
+    'updates': 3,
+}
+
+
+@override_settings(COMPLAINT_AUTO_ROUTING=False, COMPLAINT_DETAIL_CACHE_TIMEOUT=0)
+class QueryBudgetTests(TestCase):
+    SMALL, LARGE = 3, 15
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.officer = User.objects.create_user('officer', password='x', role='officer', first_name='Asha')
+        cls.complaints = []
+        # A different citizen, assignee and updater per complaint, so any
+        # relation loaded row by row costs one query per row
+        for n in range(cls.LARGE):
+            citizen = User.objects.create_user(f'citizen{n}', password='x', first_name=f'C{n}')
+            assignee = User.objects.create_user(f'officer{n}', password='x', role='officer', first_name=f'O{n}')
+            cls.complaints.append(Complaint.objects.create(
+                title=f'Complaint {n}', description='Water pipe leaking', category='water',
+                latitude=Decimal('21.25'), longitude=Decimal('81.63'), district='Raipur',
+                citizen=citizen, assigned_officer=assignee,
+            ))
+        cls.few_updates, cls.many_updates = cls.complaints[:2]
+        for complaint, count in ((cls.few_updates, cls.SMALL), (cls.many_updates, cls.LARGE)):
+            updaters = User.objects.filter(role='officer').exclude(pk=cls.officer.pk)[:count]
+            ComplaintUpdate.objects.bulk_create([
+                ComplaintUpdate(complaint=complaint, updated_by=user, old_status='pending',
+                                new_status='in_progress', comment=f'Update {n}')
+                for n, user in enumerate(updaters)
+            ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.officer)
+
+    def assertWithinBudget(self, name, url):
+        with self.assertNumQueries(BUDGETS[name]):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_list(self):
+        for size in (self.SMALL, self.LARGE):
+            data = self.assertWithinBudget('list', f'/api/complaints/v2/?page_size={size}')
+            self.assertEqual(len(data['results']), size)
+
+    def test_list_v1(self):
+        for size in (self.SMALL, self.LARGE):
+            data = self.assertWithinBudget('list_v1', f'/api/complaints/list/?page_size={size}')
+            self.assertEqual(len(data['results']), size)
+
+    def test_detail(self):
+        for complaint in (self.few_updates, self.many_updates):
+            data = self.assertWithinBudget('detail', f'/api/complaints/v2/{complaint.pk}/')
+            self.assertEqual(data['officer_details']['id'], complaint.assigned_officer_id)
+
+    def test_detail_v1(self):
+        for complaint in (self.few_updates, self.many_updates):
+            data = self.assertWithinBudget('detail_v1', f'/api/complaints/detail/{complaint.pk}/')
+            self.assertEqual(data['citizen_details']['id'], complaint.citizen_id)
+
+    def test_updates(self):
+        for complaint, count in ((self.few_updates, self.SMALL), (self.many_updates, self.LARGE)):
+            data = self.assertWithinBudget('updates', f'/api/complaints/v2/{complaint.pk}/updates/')
+            self.assertEqual(len(data), count)
@@ -0,0 +1,29 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+
+from complaints.synthetic import seed
+
+
+class QueryPlanTests(TestCase):
+    """The hot complaint queries must not sequentially scan complaints.
+
+    Runs check_query_plans on a freshly seeded and ANALYZEd table, large
+    enough that PostgreSQL picks an index whenever a usable one exists.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        seed(citizens=50, officers=20, complaints=5000, days=120, seed=7)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE complaints_complaint')
+
+    def test_hot_queries_avoid_sequential_scans(self):
+        out = StringIO()
+        try:
+            call_command('check_query_plans', min_rows=5000, stdout=out)
+        except CommandError as e:
+            self.fail(f'{e}\n{out.getvalue()}')
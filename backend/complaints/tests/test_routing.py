@@ -0,0 +1,35 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from complaints.models import Complaint, ComplaintUpdate
+from complaints.routing import rebalance_district, route_complaint
+from users.models import User
+
+
+class RoutingAuditTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.citizen = User.objects.create_user('citizen', password='x')
+        cls.officer = User.objects.create_user('officer', password='x', role='officer', district='Raipur')
+
+    def create(self):
+        return Complaint.objects.create(
+            title='Garbage', description='Not collected for a week', category='garbage',
+            latitude=21.25, longitude=81.63, district='Raipur', citizen=self.citizen,
+        )
+
+    def test_routing_is_recorded_as_a_system_change(self):
+        complaint = self.create()
+        self.assertEqual(route_complaint(complaint), self.officer)
+        rebalanced = self.create()
+        self.assertEqual(rebalance_district('Raipur'), {self.officer.pk: 1})
+
+        updates = ComplaintUpdate.objects.filter(complaint__in=[complaint, rebalanced])
+        self.assertEqual(len(updates), 2)
+        self.assertTrue(all(u.updated_by is None for u in updates))
+
+        client = APIClient()
+        client.force_authenticate(self.citizen)
+        response = client.get(f'/api/complaints/v2/{complaint.pk}/updates/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json()[0]['updated_by_name'])
@@ -0,0 +1,76 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, TransactionTestCase
+from rest_framework.test import APIClient
+
+from complaints.models import Complaint, ComplaintUpdate
+from users.models import User
+
+
+class BulkUpdateTransitionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.officer = User.objects.create_user('officer', password='x', role='officer')
+        citizen = User.objects.create_user('citizen', password='x')
+        cls.complaints = {
+            current: Complaint.objects.create(
+                title=current, description='Streetlight out', category='streetlight',
+                latitude=21.25, longitude=81.63, citizen=citizen, status=current,
+            )
+            for current in ('pending', 'in_progress', 'resolved', 'rejected')
+        }
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.officer)
+
+    def bulk_update(self, new_status):
+        ids = sorted(c.pk for c in self.complaints.values())
+        response = self.client.post(
+            '/api/complaints/v2/bulk_update/', {'ids': ids, 'status': new_status}, format='json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def statuses(self):
+        return dict(Complaint.objects.values_list('title', 'status'))
+
+    def test_disallowed_transitions_are_reported_not_applied(self):
+        data = self.bulk_update('pending')
+        # resolved -> pending is not a transition; everything else may go
+        # (back) to pending, and pending -> pending is a no-op
+        resolved = self.complaints['resolved'].pk
+        self.assertEqual(data['invalid_transition'], [resolved])
+        self.assertNotIn(resolved, data['ids'])
+        self.assertEqual(data['updated'], 3)
+        self.assertEqual(self.statuses()['resolved'], 'resolved')
+        self.assertFalse(ComplaintUpdate.objects.filter(complaint_id=resolved).exists())
+
+    def test_rejected_cannot_be_resolved(self):
+        data = self.bulk_update('resolved')
+        self.assertEqual(data['invalid_transition'], [self.complaints['rejected'].pk])
+        self.assertEqual(self.statuses(), {
+            'pending': 'resolved', 'in_progress': 'resolved',
+            'resolved': 'resolved', 'rejected': 'rejected',
+        })
+
+
+class ConcurrentTransitionTests(TransactionTestCase):
+    """Racing officers through transitions loses and duplicates nothing.
+
+    A TransactionTestCase, since every thread needs its own connection and
+    has to see the others' commits.
+    """
+
+    def test_no_lost_updates(self):
+        User.objects.create_user('citizen', password='x')
+        for n in range(8):
+            User.objects.create_user(f'officer{n}', password='x', role='officer')
+        out = StringIO()
+        try:
+            call_command('stress_transitions', threads=8, attempts=25, stdout=out)
+        except CommandError as e:
+            self.fail(f'{e}\n{out.getvalue()}')
+        self.assertIn('No lost updates', out.getvalue())
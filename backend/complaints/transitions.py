@@ -0,0 +1,112 @@
+# Status state machine with optimistic (compare-and-set) concurrency
+#
+# Every status or assignment change is a single conditional UPDATE that
+# only matches if the row still has the status and version the caller
+# read. If someone else got there first nothing is written and the caller
+# gets a conflict, instead of silently overwriting their change. No row
+# locks are held between the read and the write.
+from typing import Dict, Optional, Set
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .conditional import invalidate_cached_detail
+from .geo import encode_cell
+from .models import Complaint, ComplaintUpdate
+from .routing import workload_key, workload_transition
+
+ALLOWED_TRANSITIONS = {
+    'pending': {'in_progress', 'resolved', 'rejected'},
+    'in_progress': {'pending', 'resolved', 'rejected'},
+    # Reopening a closed complaint
+    'resolved': {'in_progress'},
+    'rejected': {'pending'},
+}
+
+
+class InvalidTransition(Exception):
+    pass
+
+
+class TransitionConflict(Exception):
+    """The complaint changed since the caller read it."""
+
+
+def check_transition(old_status: str, new_status: str):
+    if old_status != new_status and new_status not in ALLOWED_TRANSITIONS.get(old_status, ()):
+        raise InvalidTransition(f"Cannot move a complaint from '{old_status}' to '{new_status}'")
+
+
+def allowed_predecessors(new_status: str) -> Set[str]:
+    """Statuses check_transition lets a complaint move to `new_status` from."""
+    return {old for old, targets in ALLOWED_TRANSITIONS.items() if new_status in targets} | {new_status}
+
+
+def apply_changes(complaint: Complaint, changes: Dict, user, expected_version: Optional[int] = None,
+                  comment: Optional[str] = None, audit: bool = False) -> Complaint:
+    """Write `changes` (model field name -> value) to `complaint` with CAS.
+
+    `expected_version` is the version the client last saw; defaults to the
+    one loaded on `complaint`. Raises InvalidTransition or
+    TransitionConflict; on success updates `complaint` in place and
+    records a ComplaintUpdate when the status changed (always if `audit`).
+    """
+    if expected_version is None:
+        expected_version = complaint.version
+    old_status = complaint.status
+    old_officer_id = complaint.assigned_officer_id
+    old_district = complaint.district
+    new_status = changes.get('status', old_status)
+    check_transition(old_status, new_status)
+
+    now = timezone.now()
+    for name, value in changes.items():
+        setattr(complaint, name, value)
+    values = {}
+    for name in changes:
+        field = Complaint._meta.get_field(name)
+        # pre_save commits uploaded files and resolves FKs to ids
+        values[field.attname] = field.pre_save(complaint, False)
+
+    if new_status != old_status:
+        values['resolved_at'] = now if new_status == 'resolved' else None
+    if 'priority' in changes:
+        values['priority_manual'] = True
+    if 'image' in changes:
+        # The new photo gets recompressed and its own thumbnails
+        # (complaints.images); the old ones must not be served meanwhile
+        values['thumbnails'] = {}
+    if {'latitude', 'longitude'} & set(changes):
+        values['geo_cell'] = encode_cell(float(complaint.latitude), float(complaint.longitude))
+    values['updated_at'] = now
+    values['version'] = F('version') + 1
+
+    with transaction.atomic():
+        updated = Complaint.objects.filter(
+            pk=complaint.pk, status=old_status, version=expected_version
+        ).update(**values)
+        if not updated:
+            raise TransitionConflict('Complaint was changed by someone else; reload and try again')
+
+        # Queryset updates skip model signals
+        workload_transition(
+            workload_key(old_officer_id, old_status, old_district),
+            workload_key(complaint.assigned_officer_id, new_status, complaint.district),
+        )
+        if audit or new_status != old_status:
+            ComplaintUpdate.objects.create(
+                complaint=complaint,
+                updated_by=user,
+                old_status=old_status,
+                new_status=new_status,
+                comment=comment or '',
+            )
+    invalidate_cached_detail(complaint.pk)
+
+    for attname, value in values.items():
+        if attname != 'version':
+            setattr(complaint, attname, value)
+    complaint.version = expected_version + 1
+    complaint._workload_key = workload_key(complaint.assigned_officer_id, new_status, complaint.district)
+    return complaint
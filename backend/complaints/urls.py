@@ -1,6 +1,8 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import ComplaintViewSet, ComplaintListCreateView, ComplaintDetailView
+from .streams import complaint_events
+from .async_views import complaint_list, complaint_detail
 
 router = DefaultRouter()
 router.register(r'v2', ComplaintViewSet, basename='complaint')
@@ -9,4 +11,8 @@ urlpatterns = [
     path('', include(router.urls)),
     path('list/', ComplaintListCreateView.as_view(), name='complaint-list-create'),
     path('detail/<int:pk>/', ComplaintDetailView.as_view(), name='complaint-detail'),
+    path('events/', complaint_events, name='complaint-events'),
+    # Async (ASGI) read paths mirroring v2 list/detail
+    path('async/', complaint_list, name='complaint-list-async'),
+    path('async/<int:pk>/', complaint_detail, name='complaint-detail-async'),
 ]
\ No newline at end of file
@@ -2,22 +2,135 @@ from rest_framework import generics, filters, status, viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.parsers import JSONParser
 from django_filters.rest_framework import DjangoFilterBackend # type: ignore
+from django.db import transaction
+from django.db.models import Case, Count, F, Max, Value, When
+from django.http import Http404
 from django.utils import timezone
-from .models import Complaint, ComplaintUpdate
-from .serializers import ComplaintSerializer, ComplaintListSerializer, ComplaintUpdateSerializer, ComplaintRatingSerializer
+from django.conf import settings
+from collections import Counter
+import math
+from backend.replicas import ReplicaReadMixin
+from backend.throttling import limit_concurrency
+from .models import ArchivedComplaint, Complaint, ComplaintUpdate
+from .serializers import (
+    ComplaintSerializer, ComplaintListSerializer, ComplaintUpdateSerializer,
+    ComplaintRatingSerializer, ComplaintBulkUpdateSerializer
+)
+from .pagination import ComplaintCursorPagination
+from .fastpath import list_values, serialize_list_rows
+from .queue import WorkQueuePagination, queue_counts, queue_sources
+from .search import ComplaintSearchFilter
+from .images import schedule_image_processing
+from .routing import apply_workload_deltas, route_complaint, workload_key
+from .priority import score_new_complaint
+from .events import publish_updates
+from .ingest import NDJSONParser, ingest_complaints
+from .geo import filter_bbox, load_ranked, nearest, rank_by_distance
+from .conditional import ConditionalGetMixin, make_etag, get_cached_detail, set_cached_detail
+from .transitions import InvalidTransition, TransitionConflict, allowed_predecessors, apply_changes
+from analytics.ai_service import clustering_service
+from analytics.vector_index import complaint_vector_index
 
-class ComplaintViewSet(viewsets.ModelViewSet):
+
+def _check_coordinates(lat, lng):
+    # float() accepts nan and inf, which no point on the map can have
+    if not (math.isfinite(lat) and math.isfinite(lng)):
+        raise ValueError('coordinates must be finite')
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        raise ValueError('coordinates out of range')
+
+
+class ArchiveFallbackMixin:
+    """Reads that reach complaints moved to cold storage.
+
+    `?archived=true` lists the archive instead of the hot table, and a
+    detail read that misses the hot table is answered from the archive.
+    """
+
+    def wants_archive(self):
+        return self.request.method == 'GET' and self.request.query_params.get('archived') == 'true'
+
+    def visible(self, queryset):
+        user = self.request.user
+        if user.role == 'officer':
+            return queryset
+        return queryset.filter(citizen=user)
+
+    def get_archive_queryset(self):
+        return self.visible(ArchivedComplaint.objects.select_related('citizen', 'assigned_officer'))
+
+    def get_archived_object(self):
+        archived = self.get_archive_queryset().filter(pk=self.kwargs[self.lookup_field]).first()
+        if archived is None:
+            raise Http404
+        return archived
+
+
+class CompareAndSetUpdateMixin:
+    """PUT/PATCH as a single conditional UPDATE on the version read.
+
+    Clients send back the `version` they loaded; if the complaint changed
+    since, the response is 409 with its current state.
+    """
+
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop('partial', False)
+        complaint = self.get_object()
+
+        # Only officers can update status and assign themselves
+        if 'status' in request.data and request.user.role != 'officer':
+            return Response(
+                {"error": "Only officers can update complaint status"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        try:
+            version = request.data.get('version')
+            expected_version = int(version) if version not in (None, '') else None
+        except (TypeError, ValueError):
+            return Response({"version": ["A valid integer is required."]}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = self.get_serializer(complaint, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        try:
+            apply_changes(
+                complaint, serializer.validated_data, request.user, expected_version,
+                comment=request.data.get('officer_notes', ''),
+            )
+        except InvalidTransition as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except TransitionConflict as e:
+            return self.conflict(e)
+
+        if 'image' in serializer.validated_data:
+            schedule_image_processing(complaint)
+        return Response(self.get_serializer(complaint).data)
+
+    def conflict(self, error):
+        current = self.get_serializer(self.get_object()).data
+        return Response({"error": str(error), "current": current}, status=status.HTTP_409_CONFLICT)
+
+
+class ComplaintViewSet(ReplicaReadMixin, ArchiveFallbackMixin, CompareAndSetUpdateMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    replica_actions = ('list', 'nearby', 'my_queue')
+    pagination_class = ComplaintCursorPagination
+    filter_backends = [DjangoFilterBackend, ComplaintSearchFilter, filters.OrderingFilter]
     filterset_fields = ['category', 'status', 'priority', 'district']
     search_fields = ['title', 'description', 'address']
     ordering_fields = ['created_at', 'status', 'priority']
     
     def get_queryset(self):
+        if self.action == 'list' and self.wants_archive():
+            return self.get_archive_queryset()
+        return self.visible(Complaint.objects.select_related('citizen', 'assigned_officer'))
+
+    def visible(self, queryset):
         user = self.request.user
         if user.role == 'officer':
-            queryset = Complaint.objects.all() # Officers can see all the complaints
+            # Officers can see all the complaints
             district = self.request.query_params.get('district')
             if district:
                 queryset = queryset.filter(district=district)
@@ -25,7 +138,7 @@ class ComplaintViewSet(viewsets.ModelViewSet):
             return queryset
 
         # Citizens see only their complaints
-        return Complaint.objects.filter(citizen = user)
+        return queryset.filter(citizen = user)
 
     
     def get_serializer_class(self):
@@ -33,38 +146,81 @@ class ComplaintViewSet(viewsets.ModelViewSet):
             return ComplaintListSerializer
         return ComplaintSerializer
     
-    def perform_create(self, serializer):
-        serializer.save(citizen = self.request.user)
+    def list(self, request, *args, **kwargs):
+        queryset = list_values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else list(queryset)
 
-    def update(self, request, *args, **kwargs):
-        complaint = self.get_object()
-        old_status = complaint.status
-        
-        # Only officers can update status and assign themselves
-        if 'status' in request.data and request.user.role != 'officer':
-            return Response(
-                {"error": "Only officers can update complaint status"},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
-        # If status is being updated to resolved, set resolved_at
-        if 'status' in request.data and request.data['status'] == 'resolved':
-            request.data['resolved_at'] = timezone.now()
-        
-        response = super().update(request, *args, **kwargs)
-        
-        # Create update record if status changed
-        if 'status' in request.data and old_status != request.data['status']:
-            ComplaintUpdate.objects.create(
-                complaint=complaint,
-                updated_by=request.user,
-                old_status=old_status,
-                new_status=request.data['status'],
-                comment=request.data.get('officer_notes', '')
-            )
-        
-        return response
+        # The page rows are already loaded; validate on them before paying
+        # for serialization
+        etag, last_modified = self.page_validators(request, rows)
+        not_modified = self.not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return self.with_validators(not_modified, etag, last_modified)
+
+        data = serialize_list_rows(rows, request)
+        if page is not None:
+            response = self.get_paginated_response(data)
+        else:
+            response = Response(data)
+        return self.with_validators(response, etag, last_modified)
+    
+    def retrieve(self, request, *args, **kwargs):
+        validators = (
+            self.get_queryset()
+            .filter(pk=kwargs[self.lookup_field])
+            .values_list('updated_at', 'assigned_officer_id')
+            .first()
+        )
+        if validators is None:
+            return self.retrieve_archived(request)
+
+        pk = kwargs[self.lookup_field]
+        last_modified, officer_id = validators
+        etag = self.detail_etag(request, pk, last_modified, officer_id)
+        not_modified = self.not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return self.with_validators(not_modified, etag, last_modified)
+
+        data = get_cached_detail(pk, etag)
+        if data is None:
+            data = self.get_serializer(self.get_object()).data
+            set_cached_detail(pk, etag, data)
+        return self.with_validators(Response(data), etag, last_modified)
+
+    def page_validators(self, request, rows):
+        # `rows` are list_values() dicts
+        etag = make_etag(
+            request.user.pk, request.get_full_path(),
+            [(c['id'], c['updated_at'], c['assigned_officer_id']) for c in rows],
+        )
+        return etag, max((c['updated_at'] for c in rows), default=None)
+
+    def detail_etag(self, request, pk, last_modified, officer_id):
+        return make_etag(str(pk), last_modified, officer_id, request.get_host())
+
+    def archived_etag(self, request, complaint):
+        return make_etag('archived', complaint.pk, complaint.archived_at, request.get_host())
+
+    def retrieve_archived(self, request):
+        # Archived complaints no longer change, so validate on archived_at
+        complaint = self.get_archived_object()
+        etag = self.archived_etag(request, complaint)
+        not_modified = self.not_modified(request, etag, complaint.archived_at)
+        if not_modified is not None:
+            return self.with_validators(not_modified, etag, complaint.archived_at)
+        data = self.get_serializer(complaint).data
+        return self.with_validators(Response(data), etag, complaint.archived_at)
     
+    def perform_create(self, serializer):
+        manual = 'priority' in serializer.validated_data
+        complaint = serializer.save(citizen=self.request.user, priority_manual=manual)
+        schedule_image_processing(complaint)
+        if not manual:
+            score_new_complaint(complaint)
+        if settings.COMPLAINT_AUTO_ROUTING:
+            route_complaint(complaint)
+
     @action(detail=True, methods=['post'])
     def rate_complaint(self, request, pk=None):
         complaint = self.get_object()
@@ -87,7 +243,9 @@ class ComplaintViewSet(viewsets.ModelViewSet):
         if serializer.is_valid():
             complaint.rating = serializer.validated_data['rating']
             complaint.feedback = serializer.validated_data.get('feedback', '')
-            complaint.save()
+            # Only the rating columns, so a stale copy can't undo a
+            # concurrent status change
+            complaint.save(update_fields=['rating', 'feedback', 'updated_at'])
             
             return Response(
                 ComplaintSerializer(complaint).data,
@@ -99,11 +257,266 @@ class ComplaintViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'])
     def updates(self, request, pk=None):
         # Get the all the complaint for the user
-        complaint = self.get_object()
-        updates = complaint.updates.all()
+        try:
+            complaint = self.get_object()
+        except Http404:
+            complaint = self.get_archived_object()
+        stats = complaint.updates.aggregate(last=Max('created_at'), count=Count('id'))
+        etag = make_etag(complaint.pk, stats['last'], stats['count'])
+        not_modified = self.not_modified(request, etag, stats['last'])
+        if not_modified is not None:
+            return self.with_validators(not_modified, etag, stats['last'])
+
+        updates = complaint.updates.select_related('updated_by')
         serializer = ComplaintUpdateSerializer(updates, many=True)
-        return Response(serializer.data)
+        return self.with_validators(Response(serializer.data), etag, stats['last'])
     
+    @action(detail=False, methods=['post'])
+    def bulk_update(self, request):
+        # Apply one status/assignee/notes change to many complaints with a
+        # single UPDATE and one bulk insert of audit rows
+        if request.user.role != 'officer':
+            return Response(
+                {"error": "Only officers can bulk update complaints"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = ComplaintBulkUpdateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+
+        targets = Complaint.objects.all()
+        if 'ids' in data:
+            targets = targets.filter(id__in=data['ids'])
+        else:
+            targets = targets.filter(**data['filters'])
+
+        now = timezone.now()
+        changes = {'updated_at': now, 'version': F('version') + 1}
+        if 'status' in data:
+            changes['status'] = data['status']
+            if data['status'] == 'resolved':
+                # Keep the original resolution time for already-resolved rows
+                changes['resolved_at'] = Case(
+                    When(status='resolved', resolved_at__isnull=False, then=F('resolved_at')),
+                    default=Value(now),
+                )
+            else:
+                changes['resolved_at'] = None
+        if 'assigned_officer' in data:
+            changes['assigned_officer'] = data['assigned_officer']
+        if 'officer_notes' in data:
+            changes['officer_notes'] = data['officer_notes']
+
+        limit = ComplaintBulkUpdateSerializer.MAX_IDS
+        with transaction.atomic():
+            # Lock the rows so the audit trail records the status each one
+            # actually had when this update was applied
+            rows = list(
+                targets.select_for_update().order_by('id')
+                .values_list('id', 'status', 'assigned_officer_id', 'district')[:limit + 1]
+            )
+            if len(rows) > limit:
+                return Response(
+                    {"error": f"Filter matches more than {limit} complaints"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            # Same state machine as single updates; the rest are reported
+            # and left untouched
+            invalid = []
+            if 'status' in data:
+                allowed_from = allowed_predecessors(data['status'])
+                invalid = [complaint_id for complaint_id, old_status, _, _ in rows if old_status not in allowed_from]
+                rows = [row for row in rows if row[1] in allowed_from]
+            if not rows:
+                return Response({'updated': 0, 'ids': [], 'invalid_transition': invalid})
+
+            ids = [complaint_id for complaint_id, _, _, _ in rows]
+            Complaint.objects.filter(id__in=ids).update(**changes)
+
+            # Queryset updates skip model signals, so move the officers'
+            # workload counters here
+            deltas = Counter()
+            for _, old_status, old_officer, district in rows:
+                new_status = data.get('status', old_status)
+                new_officer = old_officer
+                if 'assigned_officer' in data:
+                    new_officer = data['assigned_officer'].pk if data['assigned_officer'] else None
+                old_key = workload_key(old_officer, old_status, district)
+                new_key = workload_key(new_officer, new_status, district)
+                if old_key != new_key:
+                    if old_key:
+                        deltas[old_key] -= 1
+                    if new_key:
+                        deltas[new_key] += 1
+            apply_workload_deltas(deltas)
+
+            comment = data.get('officer_notes')
+            if not comment and data.get('assigned_officer'):
+                comment = f"Assigned to {data['assigned_officer'].get_full_name()}"
+            audit = ComplaintUpdate.objects.bulk_create([
+                ComplaintUpdate(
+                    complaint_id=complaint_id,
+                    updated_by=request.user,
+                    old_status=old_status,
+                    new_status=data.get('status', old_status),
+                    comment=comment or '',
+                )
+                for complaint_id, old_status, _, _ in rows
+            ])
+            owners = Complaint.objects.filter(id__in=ids).values_list('id', 'citizen_id', 'district')
+            publish_updates(audit, {pk: (citizen_id, district) for pk, citizen_id, district in owners})
+
+        return Response({'updated': len(ids), 'ids': ids, 'invalid_transition': invalid})
+
+    @action(detail=False, methods=['post'], parser_classes=[NDJSONParser, JSONParser])
+    def ingest(self, request):
+        # Offline sync: NDJSON (application/x-ndjson) or a JSON array of
+        # complaints, each with an optional client_key for safe retries
+        rows = request.data
+        if not isinstance(rows, list):
+            return Response(
+                {"error": "Expected a JSON array or NDJSON body"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(rows) > settings.COMPLAINT_INGEST_MAX_ROWS:
+            return Response(
+                {"error": f"Batch exceeds {settings.COMPLAINT_INGEST_MAX_ROWS} rows"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        result = ingest_complaints(request.user, rows)
+        return Response(result, status=status.HTTP_201_CREATED if result['created'] else status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'])
+    def nearby(self, request):
+        # Complaints within `radius` metres of (lat, lng), or inside
+        # bbox=min_lng,min_lat,max_lng,max_lat, closest first
+        params = request.query_params
+        try:
+            limit = max(1, min(int(params.get('limit', 50)), 500))
+            if 'bbox' in params:
+                min_lng, min_lat, max_lng, max_lat = (float(v) for v in params['bbox'].split(','))
+                _check_coordinates(min_lat, min_lng)
+                _check_coordinates(max_lat, max_lng)
+                if min_lat > max_lat or min_lng > max_lng:
+                    raise ValueError('empty bbox')
+            else:
+                lat, lng = float(params['lat']), float(params['lng'])
+                _check_coordinates(lat, lng)
+                radius = min(float(params.get('radius', 500)), 50000)
+                if not radius > 0:
+                    raise ValueError('radius must be positive')
+        except (KeyError, ValueError):
+            return Response(
+                {"error": "Provide lat and lng (and optional radius in metres) or bbox=min_lng,min_lat,max_lng,max_lat"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Same visibility rules and category/status filters as the list
+        queryset = DjangoFilterBackend().filter_queryset(request, self.get_queryset(), self)
+
+        if 'bbox' in params:
+            lat, lng = (min_lat + max_lat) / 2, (min_lng + max_lng) / 2
+            candidates = filter_bbox(queryset, min_lat, min_lng, max_lat, max_lng)
+            hits = load_ranked(queryset, rank_by_distance(candidates, lat, lng, limit))
+        else:
+            hits = nearest(queryset, lat, lng, radius, limit)
+
+        results = []
+        for complaint, distance in hits:
+            data = ComplaintListSerializer(complaint, context={'request': request}).data
+            data['distance_m'] = round(float(distance), 1)
+            results.append(data)
+        return Response({'count': len(results), 'results': results})
+
+    @action(detail=False, methods=['get'])
+    def my_queue(self, request):
+        # The officer's open assignments and their district's unassigned
+        # complaints, most urgent and oldest first
+        if request.user.role != 'officer':
+            return Response(
+                {"error": "Only officers have a work queue"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        paginator = WorkQueuePagination()
+        rows = paginator.paginate_sources(queue_sources(request.user), request)
+        counts = queue_counts(request.user)
+
+        page_etag, last_modified = self.page_validators(request, rows)
+        etag = make_etag(page_etag, counts)
+        not_modified = self.not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return self.with_validators(not_modified, etag, last_modified)
+
+        data = serialize_list_rows(rows, request)
+        for item, row in zip(data, rows):
+            item['priority'] = row['priority']
+        response = paginator.get_paginated_response(data)
+        response.data['counts'] = counts
+        return self.with_validators(response, etag, last_modified)
+
+    @action(detail=False, methods=['get'])
+    @limit_concurrency('semantic_search')
+    def semantic_search(self, request):
+        # Meaning-based search over stored embeddings, so Hindi, English and
+        # Hinglish phrasings of the same problem find each other. Target:
+        # under 50 ms for 100k stored vectors, excluding the query embedding.
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response(
+                {"error": "Query parameter 'q' is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            top_k = max(1, min(int(request.query_params.get('top_k', 10)), 100))
+            recency_weight = float(request.query_params.get('recency_weight', 0))
+            half_life_days = float(request.query_params.get('half_life_days', 30))
+        except ValueError:
+            return Response(
+                {"error": "top_k, recency_weight and half_life_days must be numbers"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not 0 <= recency_weight <= 1 or half_life_days <= 0:
+            return Response(
+                {"error": "recency_weight must be between 0 and 1 and half_life_days positive"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Same visibility rules and filters as the list endpoint
+        queryset = DjangoFilterBackend().filter_queryset(request, self.get_queryset(), self)
+        candidate_ids = None
+        if queryset.query.where:
+            candidate_ids = queryset.values_list('id', flat=True)
+
+        embeddings = clustering_service.generate_embeddings([query])
+        if embeddings.size == 0:
+            return Response(
+                {"error": "Failed to embed query"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        hits = complaint_vector_index.search(
+            embeddings[0],
+            candidate_ids=candidate_ids,
+            top_k=top_k,
+            recency_weight=recency_weight,
+            half_life_days=half_life_days,
+        )
+        complaints = queryset.in_bulk([complaint_id for complaint_id, _ in hits])
+
+        results = []
+        for complaint_id, score in hits:
+            if complaint_id in complaints:
+                data = ComplaintListSerializer(complaints[complaint_id], context={'request': request}).data
+                data['score'] = round(score, 4)
+                results.append(data)
+
+        return Response({'query': query, 'results': results})
+
     @action(detail=True, methods=['post'])
     def assign_to_me(self, request, pk=None):
         # Officer assigns complaint to themselves
@@ -114,60 +527,63 @@ class ComplaintViewSet(viewsets.ModelViewSet):
             )
         
         complaint = self.get_object()
-        complaint.assigned_officer = request.user
+        changes = {'assigned_officer': request.user}
         if complaint.status == 'pending':
-            complaint.status = 'in_progress'
-        complaint.save()
-    
-        ComplaintUpdate.objects.create(
-            complaint=complaint,
-            updated_by=request.user,
-            old_status='pending',
-            new_status='in_progress',
-            comment=f'Assigned to {request.user.get_full_name()}'
-        )
+            changes['status'] = 'in_progress'
+        try:
+            apply_changes(
+                complaint, changes, request.user,
+                comment=f'Assigned to {request.user.get_full_name()}', audit=True,
+            )
+        except TransitionConflict as e:
+            return self.conflict(e)
         
         return Response(ComplaintSerializer(complaint).data)
 
-class ComplaintListCreateView(generics.ListCreateAPIView):
+class ComplaintListCreateView(ReplicaReadMixin, ArchiveFallbackMixin, generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    pagination_class = ComplaintCursorPagination
+    filter_backends = [DjangoFilterBackend, ComplaintSearchFilter, filters.OrderingFilter]
     filterset_fields = ['category', 'status']
     search_fields = ['title', 'description', 'address']
     ordering_fields = ['created_at', 'status']
     
     def get_queryset(self):
-        user = self.request.user
-        if user.role == 'officer':
-            return Complaint.objects.all()
-        return Complaint.objects.filter(citizen=user)
+        if self.wants_archive():
+            return self.get_archive_queryset()
+        return self.visible(Complaint.objects.select_related('citizen', 'assigned_officer'))
     
     def get_serializer_class(self):
         if self.request.method == 'GET':
             return ComplaintListSerializer
         return ComplaintSerializer
+
+    def list(self, request, *args, **kwargs):
+        queryset = list_values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serialize_list_rows(page, request))
+        return Response(serialize_list_rows(queryset, request))
     
     def perform_create(self, serializer):
-        serializer.save(citizen=self.request.user)
+        manual = 'priority' in serializer.validated_data
+        complaint = serializer.save(citizen=self.request.user, priority_manual=manual)
+        schedule_image_processing(complaint)
+        if not manual:
+            score_new_complaint(complaint)
+        if settings.COMPLAINT_AUTO_ROUTING:
+            route_complaint(complaint)
 
-class ComplaintDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ComplaintDetailView(ArchiveFallbackMixin, CompareAndSetUpdateMixin, generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ComplaintSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        if user.role == 'officer':
-            return Complaint.objects.all()
-        return Complaint.objects.filter(citizen=user)
-    
-    def update(self, request, *args, **kwargs):
-        complaint = self.get_object()
-        
-        # Only officers can update status
-        if 'status' in request.data and request.user.role != 'officer':
-            return Response(
-                {"error": "Only officers can update complaint status"},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
-        return super().update(request, *args, **kwargs)
\ No newline at end of file
+        return self.visible(Complaint.objects.select_related('citizen', 'assigned_officer'))
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            complaint = self.get_object()
+        except Http404:
+            complaint = self.get_archived_object()
+        return Response(self.get_serializer(complaint).data)
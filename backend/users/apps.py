@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "users"
+
+    def ready(self):
+        from django.core.checks import register
+
+        from backend.caching import check_shared_cache
+        from . import signals  # noqa: F401
+
+        register(check_shared_cache, deploy=True)
@@ -0,0 +1,52 @@
+# JWT authentication that keeps recently seen users in the cache
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from backend.caching import cache_is_shared
+
+
+def user_cache_key(user_id):
+    return f'auth:user:{user_id}'
+
+
+def invalidate_cached_user(user_id):
+    cache.delete(user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication without the per-request user query.
+
+    The user row is kept for AUTH_USER_CACHE_TIMEOUT seconds and dropped
+    whenever the user is saved or deleted (see users.signals), so profile
+    edits and deactivation apply on the next request. That only holds when
+    every worker shares the cache; with a per-process cache the user is
+    read from the database each time.
+    """
+
+    def get_user(self, validated_token):
+        timeout = settings.AUTH_USER_CACHE_TIMEOUT
+        if not timeout or not cache_is_shared():
+            return super().get_user(validated_token)
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            # Raises for unknown and inactive users, which are never cached
+            user = super().get_user(validated_token)
+            cache.set(key, user, timeout)
+        elif api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+        return user
@@ -0,0 +1,69 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from backend.caching import cache_is_shared
+from users.authentication import CachedJWTAuthentication, invalidate_cached_user
+from users.models import User
+
+
+def trivial_view(authentication_class):
+    class View(APIView):
+        authentication_classes = [authentication_class]
+        throttle_classes = []
+
+        def get(self, request):
+            return Response({'id': request.user.pk, 'role': request.user.role})
+
+    return View.as_view()
+
+
+class Command(BaseCommand):
+    help = 'Requests/sec on a trivial authenticated endpoint with and without the user cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', help='User to authenticate as (default: first active user)')
+        parser.add_argument('--requests', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_active=True)
+        if options['username']:
+            users = users.filter(username=options['username'])
+        user = users.order_by('id').first()
+        if user is None:
+            raise CommandError('No active user to authenticate as')
+
+        token = str(AccessToken.for_user(user))
+        factory = APIRequestFactory()
+        count = options['requests']
+        invalidate_cached_user(user.pk)
+
+        self.stdout.write(f'{count} requests as {user.username}')
+        if not cache_is_shared():
+            self.stdout.write(self.style.WARNING(
+                'No shared cache (REDIS_URL unset): CachedJWTAuthentication loads the user every time'
+            ))
+        self.stdout.write(f"{'authentication':>24} {'req/s':>10} {'queries/req':>12}")
+        for name, authentication_class in (
+            ('JWTAuthentication', JWTAuthentication),
+            ('CachedJWTAuthentication', CachedJWTAuthentication),
+        ):
+            view = trivial_view(authentication_class)
+            # Warm up (and fill the cache for the cached variant)
+            view(factory.get('/', HTTP_AUTHORIZATION=f'Bearer {token}'))
+
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                for _ in range(count):
+                    response = view(factory.get('/', HTTP_AUTHORIZATION=f'Bearer {token}'))
+                    if response.status_code != 200:
+                        raise CommandError(f'{name}: got HTTP {response.status_code}')
+                elapsed = time.perf_counter() - start
+            self.stdout.write(f'{name:>24} {count / elapsed:>10.0f} {len(queries) / count:>12.2f}')
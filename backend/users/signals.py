@@ -0,0 +1,18 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_cached_user
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def drop_cached_user(sender, instance, using, **kwargs):
+    # Covers profile updates, role/district changes and deactivation;
+    # QuerySet.update() bypasses this and must invalidate by hand.
+    # Dropped again on commit in case a concurrent request re-cached the
+    # old row before the transaction finished.
+    user_id = instance.pk
+    invalidate_cached_user(user_id)
+    transaction.on_commit(lambda: invalidate_cached_user(user_id), using=using)
@@ -0,0 +1,40 @@
+import tempfile
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from backend.caching import cache_is_shared
+from users.authentication import CachedJWTAuthentication
+from users.models import User
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('officer', password='x', role='officer')
+        self.request = APIRequestFactory().get(
+            '/', HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}'
+        )
+
+    def authenticate(self):
+        return CachedJWTAuthentication().authenticate(self.request)[0]
+
+    def test_per_process_cache_loads_user_every_time(self):
+        self.assertFalse(cache_is_shared())
+        self.authenticate()
+        with self.assertNumQueries(1):
+            self.authenticate()
+
+    def test_shared_cache_keeps_user_until_saved(self):
+        with tempfile.TemporaryDirectory() as location, override_settings(CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location},
+        }):
+            self.authenticate()
+            with self.assertNumQueries(0):
+                self.assertEqual(self.authenticate().role, 'officer')
+
+            self.user.is_active = False
+            self.user.save()
+            with self.assertRaises(AuthenticationFailed):
+                self.authenticate()
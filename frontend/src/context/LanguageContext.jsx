@@ -32,6 +32,8 @@ const translations = {
     drainage: 'Drainage',
     garbage: 'Garbage Collection',
     other: 'Other',
+    loadMore: 'Load More',
+    system: 'System',
   },
   hi: {
     appName: 'सीजी संवाद',
@@ -60,6 +62,8 @@ const translations = {
     drainage: 'जल निकासी',
     garbage: 'कचरा संग्रहण',
     other: 'अन्य',
+    loadMore: 'और देखें',
+    system: 'सिस्टम',
   },
   cg: {
     appName: 'सीजी संवाद',
@@ -88,6 +92,8 @@ const translations = {
     drainage: 'नाली',
     garbage: 'कचरा',
     other: 'अउ',
+    loadMore: 'अउ देखव',
+    system: 'सिस्टम',
   },
 };
 
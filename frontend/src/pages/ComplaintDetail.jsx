@@ -52,13 +52,19 @@ const ComplaintDetail = () => {
 
   const handleStatusUpdate = async (newStatus) => {
     try {
-      await complaintAPI.update(id, { status: newStatus });
+      await complaintAPI.update(id, { status: newStatus, version: complaint.version });
       toast.success('Status updated successfully');
       fetchComplaintDetail();
       fetchComplaintUpdates();
     } catch (error) {
       console.error('Error updating status:', error);
-      toast.error('Failed to update status');
+      if (error.response?.status === 409) {
+        toast.error('This complaint was just changed by someone else. Showing the latest version.');
+        fetchComplaintDetail();
+        fetchComplaintUpdates();
+      } else {
+        toast.error(error.response?.data?.error || 'Failed to update status');
+      }
     }
   };
 
@@ -70,7 +76,13 @@ const ComplaintDetail = () => {
       fetchComplaintUpdates();
     } catch (error) {
       console.error('Error assigning complaint:', error);
-      toast.error('Failed to assign complaint');
+      if (error.response?.status === 409) {
+        toast.error('This complaint was just changed by someone else. Showing the latest version.');
+        fetchComplaintDetail();
+        fetchComplaintUpdates();
+      } else {
+        toast.error('Failed to assign complaint');
+      }
     }
   };
 
@@ -232,7 +244,7 @@ const ComplaintDetail = () => {
                     <div className="timeline-marker"></div>
                     <div className="timeline-content">
                       <div className="timeline-header">
-                        <strong>{update.updated_by_name}</strong>
+                        <strong>{update.updated_by_name ?? t('system')}</strong>
                         <span className="timeline-date">
                           {new Date(update.created_at).toLocaleString('en-IN')}
                         </span>
@@ -12,6 +12,7 @@ const ViewComplaints = () => {
   const { t } = useLanguage();
   const navigate = useNavigate();
   const [complaints, setComplaints] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
   const [loading, setLoading] = useState(true);
   const [filters, setFilters] = useState({
     category: '',
@@ -19,21 +20,46 @@ const ViewComplaints = () => {
     search: '',
   });
   const [viewMode, setViewMode] = useState('list'); 
+  // The map shows every matching complaint, not just the loaded pages
+  const [mapComplaints, setMapComplaints] = useState(null);
 
   useEffect(() => {
     fetchComplaints();
   }, [filters]);
 
+  useEffect(() => {
+    setMapComplaints(null);
+    if (viewMode !== 'map') return;
+
+    let cancelled = false;
+    complaintAPI.getAllPages(filterParams())
+      .then((results) => {
+        if (!cancelled) setMapComplaints(results);
+      })
+      .catch((error) => {
+        console.error('Error fetching complaints:', error);
+        toast.error('Failed to load complaints');
+        if (!cancelled) setMapComplaints([]);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [viewMode, filters]);
+
+  const filterParams = () => {
+    const params = {};
+    if (filters.category) params.category = filters.category;
+    if (filters.status) params.status = filters.status;
+    if (filters.search) params.search = filters.search;
+    return params;
+  };
+
   const fetchComplaints = async () => {
     setLoading(true);
     try {
-      const params = {};
-      if (filters.category) params.category = filters.category;
-      if (filters.status) params.status = filters.status;
-      if (filters.search) params.search = filters.search;
-
-      const response = await complaintAPI.getAll(params);
-      setComplaints(response.data);
+      const response = await complaintAPI.getAll(filterParams());
+      setComplaints(response.data.results);
+      setNextPage(response.data.next);
     } catch (error) {
       console.error('Error fetching complaints:', error);
       toast.error('Failed to load complaints');
@@ -42,6 +68,17 @@ const ViewComplaints = () => {
     }
   };
 
+  const loadMore = async () => {
+    try {
+      const response = await complaintAPI.getPage(nextPage);
+      setComplaints([...complaints, ...response.data.results]);
+      setNextPage(response.data.next);
+    } catch (error) {
+      console.error('Error fetching complaints:', error);
+      toast.error('Failed to load complaints');
+    }
+  };
+
   const handleFilterChange = (e) => {
     setFilters({
       ...filters,
@@ -104,15 +141,22 @@ const ViewComplaints = () => {
         </div>
       </div>
 
-      {loading ? (
+      {loading || (viewMode === 'map' && !mapComplaints) ? (
         <div className="loading">Loading complaints...</div>
       ) : (
         <>
           {viewMode === 'list' ? (
-            <ComplaintList
-              complaints={complaints}
-              onComplaintClick={handleComplaintClick}
-            />
+            <>
+              <ComplaintList
+                complaints={complaints}
+                onComplaintClick={handleComplaintClick}
+              />
+              {nextPage && (
+                <button onClick={loadMore} className="btn-load-more">
+                  {t('loadMore')}
+                </button>
+              )}
+            </>
           ) : (
             <div className="map-view">
               <MapContainer
@@ -124,7 +168,7 @@ const ViewComplaints = () => {
                   url="https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png"
                   attribution='&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a>'
                 />
-                {complaints.map((complaint) => (
+                {mapComplaints.map((complaint) => (
                   <Marker
                     key={complaint.id}
                     position={[parseFloat(complaint.latitude), parseFloat(complaint.longitude)]}
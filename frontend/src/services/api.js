@@ -60,6 +60,17 @@ export const authAPI = {
 // Complaint APIs
 export const complaintAPI = {
   getAll: (params) => api.get('/complaints/v2/', { params }),
+  getPage: (url) => api.get(url),
+  // Every page of a filtered listing, following the cursor links
+  getAllPages: async (params) => {
+    let response = await api.get('/complaints/v2/', { params: { ...params, page_size: 100 } });
+    const results = [...response.data.results];
+    while (response.data.next) {
+      response = await api.get(response.data.next);
+      results.push(...response.data.results);
+    }
+    return results;
+  },
   getById: (id) => api.get(`/complaints/v2/${id}/`),
   create: (data) => {
     const formData = new FormData();